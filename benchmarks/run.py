@@ -0,0 +1,365 @@
+"""Benchmarks of the client's hot paths against a local FRED stand-in.
+
+Usage:
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --quick --compare results.json
+
+Every benchmark talks to `FredStandIn` over HTTP on localhost, so numbers
+measure the client and not FRED. The results are written as JSON, and
+`--compare` prints the change of each headline metric against a previous
+run.
+"""
+
+import gc
+import sys
+import json
+import time
+import platform
+import argparse
+import statistics
+import subprocess
+import tracemalloc
+import requests
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from datetime import timezone
+from typing import Callable
+from typing import Dict
+from typing import List
+from benchmarks.stand_in import FredStandIn
+from benchmarks.stand_in import synthetic_observations
+from fred.cache import ResponseCache
+from fred.client import FederalReserveClient
+from fred.compact import CompactObservations
+
+# The metric of each benchmark compared across runs, and whether higher is better.
+HEADLINES = {
+    'make_request_overhead': ('overhead_us', False),
+    'observation_parse': ('json_rows_per_second', True),
+    'pagination': ('items_per_second', True),
+    'cache_hit_latency': ('mean_us', False),
+    'concurrency_scaling': ('best_requests_per_second', True),
+    'memory_per_million_observations': ('dict_rows_mb', False)
+}
+
+
+def new_client(stand_in: FredStandIn) -> FederalReserveClient:
+    """Returns a client pointed at the stand-in, with rate limiting off."""
+
+    fred_client = FederalReserveClient(api_key='benchmark')
+    fred_client.fred_session.resource = stand_in.url
+    fred_client.fred_session.rate_limiter = None
+
+    return fred_client
+
+
+def timed(function: Callable, repeat: int) -> List[float]:
+    """Returns the seconds taken by each of `repeat` calls."""
+
+    durations = []
+
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - started)
+
+    return durations
+
+
+def percentiles(durations: List[float]) -> Dict[str, float]:
+    """Summarizes durations in microseconds."""
+
+    ordered = sorted(durations)
+
+    return {
+        'mean_us': round(statistics.mean(ordered) * 1e6, 2),
+        'p50_us': round(ordered[len(ordered) // 2] * 1e6, 2),
+        'p95_us': round(ordered[int(len(ordered) * 0.95) - 1] * 1e6, 2),
+        'max_us': round(ordered[-1] * 1e6, 2)
+    }
+
+
+def bench_make_request_overhead(stand_in: FredStandIn, calls: int) -> Dict:
+    """Times `make_request` against a bare `requests` send of the same small response."""
+
+    fred_client = new_client(stand_in=stand_in)
+    series_service = fred_client.series()
+    url = stand_in.url + '/series'
+
+    def raw_request() -> Dict:
+        # The transport `make_request` uses, without anything around it.
+        with requests.Session() as request_session:
+            prepared = requests.Request(method='GET', url=url, params={'series_id': 'SYN', 'file_type': 'json'}).prepare()
+            return request_session.send(request=prepared).json()
+
+    # Warm both paths up before timing them.
+    raw_request()
+    series_service.get_series(series_id='SYN')
+
+    # Interleaved, so both see the same machine load.
+    raw, client = [], []
+    for _ in range(calls):
+        raw.extend(timed(raw_request, repeat=1))
+        client.extend(timed(lambda: series_service.get_series(series_id='SYN'), repeat=1))
+
+    return {
+        'calls': calls,
+        'raw_requests': percentiles(durations=raw),
+        'make_request': percentiles(durations=client),
+        'overhead_us': round((statistics.median(client) - statistics.median(raw)) * 1e6, 2)
+    }
+
+
+def bench_observation_parse(observations: int) -> Dict:
+    """Measures the rows per second of decoding observations and compacting them."""
+
+    body = json.dumps({'count': observations, 'observations': synthetic_observations(count=observations)})
+
+    decoded = timed(lambda: json.loads(body), repeat=3)
+    content = json.loads(body)
+    compacted = timed(lambda: CompactObservations.from_response(content=content), repeat=3)
+
+    return {
+        'rows': observations,
+        'payload_bytes': len(body),
+        'json_rows_per_second': round(observations / min(decoded)),
+        'compact_rows_per_second': round(observations / min(compacted))
+    }
+
+
+def bench_pagination(stand_in: FredStandIn, max_workers: int) -> Dict:
+    """Measures the items per second of walking a listing with the `Paginator`."""
+
+    fred_client = new_client(stand_in=stand_in)
+    paginator = fred_client.paginator(max_workers=max_workers)
+
+    started = time.perf_counter()
+    items = paginator.category_series(category_id='1', collect=True)
+    seconds = time.perf_counter() - started
+
+    return {
+        'items': len(items),
+        'pages': -(-len(items) // paginator.page_size),
+        'max_workers': max_workers,
+        'seconds': round(seconds, 4),
+        'items_per_second': round(len(items) / seconds)
+    }
+
+
+def bench_cache_hit_latency(stand_in: FredStandIn, hits: int) -> Dict:
+    """Times `ResponseCache` hits once the response is cached."""
+
+    fred_client = new_client(stand_in=stand_in)
+    response_cache = ResponseCache(series_service=fred_client.series())
+
+    miss = timed(lambda: response_cache.get_series_observations(series_id='SYN'), repeat=1)
+    durations = timed(lambda: response_cache.get_series_observations(series_id='SYN'), repeat=hits)
+
+    results = percentiles(durations=durations)
+    results.update({'hits': response_cache.hits, 'miss_us': round(miss[0] * 1e6, 2)})
+
+    return results
+
+
+def bench_concurrency_scaling(stand_in: FredStandIn, workers: List[int], calls_per_worker: int) -> Dict:
+    """Measures requests per second for each number of worker threads."""
+
+    fred_client = new_client(stand_in=stand_in)
+    series_service = fred_client.series()
+    scaling = {}
+
+    for max_workers in workers:
+        calls = max_workers * calls_per_worker
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(lambda number: series_service.get_series(series_id=str(number)), range(calls)))
+        seconds = time.perf_counter() - started
+
+        scaling[str(max_workers)] = {
+            'calls': calls,
+            'seconds': round(seconds, 4),
+            'requests_per_second': round(calls / seconds, 1)
+        }
+
+    return {
+        'latency_seconds': stand_in.latency,
+        'workers': scaling,
+        'best_requests_per_second': max(result['requests_per_second'] for result in scaling.values())
+    }
+
+
+def bench_memory_per_million_observations(observations: int) -> Dict:
+    """Measures the memory of decoded and compacted observations, scaled to one million rows."""
+
+    body = json.dumps({'observations': synthetic_observations(count=observations)})
+    scale = 1000000 / observations
+
+    def allocated(function: Callable) -> tuple:
+        gc.collect()
+        tracemalloc.start()
+        result = function()
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return result, size
+
+    content, dict_bytes = allocated(lambda: json.loads(body))
+    compact, compact_bytes = allocated(lambda: CompactObservations.from_response(content=content))
+
+    return {
+        'rows_measured': observations,
+        'dict_rows_mb': round(dict_bytes * scale / 2 ** 20, 1),
+        'compact_mb': round(compact_bytes * scale / 2 ** 20, 1),
+        'compact_nbytes_mb': round(compact.nbytes() * scale / 2 ** 20, 1)
+    }
+
+
+def run(quick: bool = False) -> Dict:
+    """Runs every benchmark.
+
+    ### Parameters
+    ----
+    quick : bool (optional, Default=False)
+        Whether to use smaller sizes, for a smoke run.
+
+    ### Returns
+    ----
+    Dict:
+        The environment and the results of each benchmark.
+    """
+
+    sizes = {
+        'calls': 50 if quick else 500,
+        'observations': 20000 if quick else 200000,
+        'listing_count': 5000 if quick else 50000,
+        'hits': 2000 if quick else 50000,
+        'workers': [1, 4, 16] if quick else [1, 2, 4, 8, 16, 32, 64],
+        'calls_per_worker': 2 if quick else 8
+    }
+
+    results = {}
+
+    with FredStandIn(observations=1000, listing_count=sizes['listing_count']) as stand_in:
+        results['make_request_overhead'] = bench_make_request_overhead(stand_in=stand_in, calls=sizes['calls'])
+        results['pagination'] = bench_pagination(stand_in=stand_in, max_workers=8)
+        results['cache_hit_latency'] = bench_cache_hit_latency(stand_in=stand_in, hits=sizes['hits'])
+
+    # Simulated server time, so threads overlap the waits like they do against FRED.
+    with FredStandIn(latency=0.02) as stand_in:
+        results['concurrency_scaling'] = bench_concurrency_scaling(
+            stand_in=stand_in,
+            workers=sizes['workers'],
+            calls_per_worker=sizes['calls_per_worker']
+        )
+
+    results['observation_parse'] = bench_observation_parse(observations=sizes['observations'])
+    results['memory_per_million_observations'] = bench_memory_per_million_observations(
+        observations=sizes['observations']
+    )
+
+    return {
+        'environment': environment(),
+        'quick': quick,
+        'sizes': sizes,
+        'results': results
+    }
+
+
+def environment() -> Dict:
+    """Describes the machine and the revision the benchmarks ran on."""
+
+    try:
+        revision = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = None
+
+    return {
+        'timestamp': datetime.now(tz=timezone.utc).isoformat(timespec='seconds'),
+        'revision': revision,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'requests': requests.__version__
+    }
+
+
+def compare(baseline: Dict, current: Dict) -> Dict[str, Dict]:
+    """Compares the headline metrics of two runs.
+
+    ### Parameters
+    ----
+    baseline : Dict
+        A previous output of `run`.
+
+    current : Dict
+        The output of `run` to compare.
+
+    ### Returns
+    ----
+    Dict[str, Dict]:
+        For each benchmark both values, the relative change and whether it improved.
+    """
+
+    comparison = {}
+
+    for name, (metric, higher_is_better) in HEADLINES.items():
+        before = baseline['results'].get(name, {}).get(metric)
+        after = current['results'].get(name, {}).get(metric)
+
+        if before is None or after is None:
+            continue
+
+        change = (after - before) / abs(before) if before else 0.0
+        comparison[name] = {
+            'metric': metric,
+            'baseline': before,
+            'current': after,
+            'change': round(change, 4),
+            'improved': change > 0 if higher_is_better else change < 0
+        }
+
+    return comparison
+
+
+def main(argv: List[str] = None) -> None:
+    """Runs the benchmarks from the command line."""
+
+    parser = argparse.ArgumentParser(description='Benchmarks of the FRED client against a local stand-in.')
+    parser.add_argument('--output', help='The JSON file the results are written to, stdout by default.')
+    parser.add_argument('--compare', help='A previous JSON output to compare the results with.')
+    parser.add_argument('--quick', action='store_true', help='Use smaller sizes, for a smoke run.')
+    arguments = parser.parse_args(argv)
+
+    results = run(quick=arguments.quick)
+
+    if arguments.compare:
+        with open(file=arguments.compare, mode='r', encoding='utf-8') as baseline_file:
+            results['comparison'] = compare(baseline=json.load(fp=baseline_file), current=results)
+
+    if arguments.output:
+        with open(file=arguments.output, mode='w', encoding='utf-8') as output_file:
+            json.dump(obj=results, fp=output_file, indent=4)
+    else:
+        json.dump(obj=results, fp=sys.stdout, indent=4)
+        print()
+
+    for name, change in results.get('comparison', {}).items():
+        print('{name:<34}{metric:<26}{baseline:>14}{current:>14}{change:>+10.1%}'.format(
+            name=name,
+            metric=change['metric'],
+            baseline=change['baseline'],
+            current=change['current'],
+            change=change['change']
+        ), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,212 @@
+import json
+import time
+import threading
+
+from datetime import date
+from datetime import timedelta
+from socketserver import ThreadingMixIn
+from http.server import BaseHTTPRequestHandler
+from http.server import HTTPServer
+from typing import Dict
+from typing import List
+from urllib.parse import parse_qs
+from urllib.parse import urlsplit
+
+
+def synthetic_observations(count: int, start: date = date(1950, 1, 1)) -> List[Dict]:
+    """Builds daily observation rows shaped like `Series.get_series_observations`.
+
+    ### Parameters
+    ----
+    count : int
+        The number of rows.
+
+    start : date (optional, Default=date(1950, 1, 1))
+        The date of the first row.
+
+    ### Returns
+    ----
+    List[Dict]:
+        The rows.
+    """
+
+    return [
+        {
+            'realtime_start': '2024-01-02',
+            'realtime_end': '9999-12-31',
+            'date': (start + timedelta(days=day)).isoformat(),
+            'value': '.' if day % 97 == 0 else '{value:.2f}'.format(value=100 + (day % 1000) / 7)
+        }
+        for day in range(count)
+    ]
+
+
+def synthetic_series(series_id: str) -> Dict:
+    """Builds the metadata of a series shaped like `Series.get_series`."""
+
+    return {
+        'id': series_id,
+        'realtime_start': '2024-01-02',
+        'realtime_end': '2024-01-02',
+        'title': 'Synthetic series {series_id}'.format(series_id=series_id),
+        'observation_start': '1950-01-01',
+        'observation_end': '2023-12-31',
+        'frequency': 'Monthly',
+        'frequency_short': 'M',
+        'units': 'Index',
+        'units_short': 'Index',
+        'seasonal_adjustment': 'Seasonally Adjusted',
+        'seasonal_adjustment_short': 'SA',
+        'last_updated': '2024-01-02 07:45:03-06',
+        'popularity': 50
+    }
+
+
+class FredStandIn():
+
+    """
+    ## Overview:
+    ----
+    A local HTTP server answering the FRED endpoints the benchmarks use with
+    synthetic payloads, so the client's own costs can be measured without
+    the network, the API key or FRED's rate limit. Payloads are built once
+    and served from memory, and an optional latency simulates the server's
+    think time.
+    """
+
+    def __init__(self, observations: int = 10000, listing_count: int = 20000, latency: float = 0.0) -> None:
+        """Initializes the `FredStandIn` object.
+
+        ### Parameters
+        ----
+        observations : int (optional, Default=10000)
+            The number of rows of each observations response.
+
+        listing_count : int (optional, Default=20000)
+            The number of series in the paginated category listing.
+
+        latency : float (optional, Default=0.0)
+            The seconds each response is held before being sent.
+
+        ### Usage
+        ----
+            >>> with FredStandIn(latency=0.02) as stand_in:
+                    fred_client.fred_session.resource = stand_in.url
+        """
+
+        self.latency = latency
+        self.listing_count = listing_count
+        self.requests = 0
+
+        self._observations = json.dumps({
+            'realtime_start': '2024-01-02',
+            'realtime_end': '2024-01-02',
+            'observation_start': '1950-01-01',
+            'observation_end': '9999-12-31',
+            'units': 'lin',
+            'output_type': 1,
+            'file_type': 'json',
+            'order_by': 'observation_date',
+            'sort_order': 'asc',
+            'count': observations,
+            'offset': 0,
+            'limit': 100000,
+            'observations': synthetic_observations(count=observations)
+        }).encode('utf-8')
+        self._listing = [
+            {'id': 'SYN{number:06d}'.format(number=number), 'title': 'Synthetic series', 'popularity': number % 100}
+            for number in range(listing_count)
+        ]
+        self._lock = threading.Lock()
+        self._server: HTTPServer = None
+        self._thread: threading.Thread = None
+
+    def __repr__(self) -> str:
+        """String representation of the `FredStandIn` object."""
+
+        # define the string representation
+        str_representation = '<FredStandIn (url={url}, latency={latency})>'.format(
+            url=self.url if self._server else None,
+            latency=self.latency
+        )
+
+        return str_representation
+
+    def __enter__(self) -> 'FredStandIn':
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """The base URL to use as `FredSession.resource`."""
+
+        host, port = self._server.server_address[:2]
+
+        return 'http://{host}:{port}'.format(host=host, port=port)
+
+    def start(self) -> None:
+        """Serves on a free local port from a background thread."""
+
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_GET(self) -> None:
+                stand_in._handle(handler=self)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        class Server(ThreadingMixIn, HTTPServer):
+
+            # Concurrency benchmarks open many connections at once.
+            request_queue_size = 128
+            daemon_threads = True
+
+        self._server = Server(('127.0.0.1', 0), Handler)
+
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops serving."""
+
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def _handle(self, handler: BaseHTTPRequestHandler) -> None:
+        """Answers one request."""
+
+        with self._lock:
+            self.requests += 1
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        url = urlsplit(handler.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        if url.path == '/series/observations':
+            body = self._observations
+        elif url.path == '/series':
+            body = json.dumps({'seriess': [synthetic_series(series_id=params.get('series_id', 'SYN'))]}).encode('utf-8')
+        elif url.path == '/category/series':
+            offset, limit = int(params.get('offset', 0)), int(params.get('limit', 1000))
+            body = json.dumps({
+                'count': self.listing_count,
+                'offset': offset,
+                'limit': limit,
+                'seriess': self._listing[offset:offset + limit]
+            }).encode('utf-8')
+        else:
+            body = b'{}'
+
+        handler.send_response(200)
+        handler.send_header('Content-Type', 'application/json')
+        handler.send_header('Content-Length', str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
@@ -0,0 +1,276 @@
+import math
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+from datetime import date
+from datetime import timedelta
+from fred.values import NAN
+from fred.values import observation_dates
+from fred.values import to_date
+from fred.values import to_float
+
+# The aggregation methods supported by FRED.
+AGGREGATION_METHODS = ['avg', 'sum', 'eop']
+
+# Week ending frequencies, mapped to the weekday the week ends on.
+WEEK_ENDING_DAYS = {
+    'w': 4,
+    'wef': 4,
+    'weth': 3,
+    'wew': 2,
+    'wetu': 1,
+    'wem': 0,
+    'wesu': 6,
+    'wesa': 5
+}
+
+# Biweekly frequencies, mapped to a known period ending date.
+BIWEEK_ENDING_ANCHORS = {
+    'bw': date(1970, 1, 7),
+    'bwew': date(1970, 1, 7),
+    'bwem': date(1970, 1, 5)
+}
+
+# Number of months in each of the calendar based frequencies.
+MONTHS_PER_PERIOD = {
+    'm': 1,
+    'q': 3,
+    'sa': 6,
+    'a': 12
+}
+
+FREQUENCIES = ['d'] + list(WEEK_ENDING_DAYS) + list(BIWEEK_ENDING_ANCHORS) + list(MONTHS_PER_PERIOD)
+
+
+class FrequencyAggregator():
+
+    """
+    ## Overview:
+    ----
+    Aggregates already fetched observations to a lower frequency, the same
+    way the `frequency` and `aggregation_method` arguments of
+    `Series.get_series_observations` do on the FRED server. Calendar periods
+    are labeled by their first day and weekly periods by the day they end,
+    matching the dates FRED returns.
+    """
+
+    def __init__(self, frequency: str, aggregation_method: str = 'avg') -> None:
+        """Initializes the `FrequencyAggregator` object.
+
+        ### Parameters
+        ----
+        frequency : str
+            The frequency to aggregate to. One of the following values: ['d', 'w',
+            'bw', 'm', 'q', 'sa', 'a', 'wef', 'weth', 'wew', 'wetu', 'wem', 'wesu',
+            'wesa', 'bwew', 'bwem'].
+
+        aggregation_method : str (optional, Default='avg')
+            One of the following values: ['avg', 'sum', 'eop'].
+
+        ### Usage
+        ----
+            >>> aggregator = FrequencyAggregator(frequency='q', aggregation_method='eop')
+            >>> aggregator.aggregate(dates=['2020-01-01', '2020-02-01'], values=[1.0, 2.0])
+        """
+
+        if frequency not in FREQUENCIES:
+            raise ValueError(
+                'Frequency must be one of the following: {frequencies}'.format(
+                    frequencies=FREQUENCIES
+                )
+            )
+
+        if aggregation_method not in AGGREGATION_METHODS:
+            raise ValueError(
+                'Aggregation method must be one of the following: {methods}'.format(
+                    methods=AGGREGATION_METHODS
+                )
+            )
+
+        self.frequency = frequency
+        self.aggregation_method = aggregation_method
+
+    def __repr__(self) -> str:
+        """String representation of the `FrequencyAggregator` object."""
+
+        # define the string representation
+        str_representation = '<FrequencyAggregator (frequency={frequency}, aggregation_method={method})>'.format(
+            frequency=self.frequency,
+            method=self.aggregation_method
+        )
+
+        return str_representation
+
+    def period_label(self, value: Union[str, date]) -> date:
+        """Returns the date FRED uses to label the period containing a date.
+
+        ### Parameters
+        ----
+        value : Union[str, date]
+            The observation date.
+
+        ### Returns
+        ----
+        date:
+            The label of the period.
+        """
+
+        value = to_date(value)
+
+        if self.frequency == 'd':
+            return value
+
+        if self.frequency in WEEK_ENDING_DAYS:
+            days_ahead = (WEEK_ENDING_DAYS[self.frequency] - value.weekday()) % 7
+            return value + timedelta(days=days_ahead)
+
+        if self.frequency in BIWEEK_ENDING_ANCHORS:
+            anchor = BIWEEK_ENDING_ANCHORS[self.frequency]
+            days_ahead = (anchor.toordinal() - value.toordinal()) % 14
+            return value + timedelta(days=days_ahead)
+
+        months = MONTHS_PER_PERIOD[self.frequency]
+        month = (value.month - 1) // months * months + 1
+
+        return date(value.year, month, 1)
+
+    def aggregate(
+        self,
+        dates: List[Union[str, date]],
+        values: List[Union[str, float]]
+    ) -> Tuple[List[date], List[float]]:
+        """Aggregates a column of observations.
+
+        ### Parameters
+        ----
+        dates : List[Union[str, date]]
+            The observation dates, in ascending order.
+
+        values : List[Union[str, float]]
+            The observation values, FRED's missing value marker '.' is
+            treated as NaN and ignored by the aggregation.
+
+        ### Returns
+        ----
+        Tuple[List[date], List[float]]:
+            The period labels and the aggregated values.
+        """
+
+        labels = [self.period_label(value) for value in dates]
+        x = [to_float(value) for value in values]
+
+        period_labels = []
+        period_values = []
+        start = 0
+
+        for index in range(1, len(labels) + 1):
+            if index == len(labels) or labels[index] != labels[start]:
+                period_labels.append(labels[start])
+                period_values.append(self._reduce(x[start:index]))
+                start = index
+
+        return period_labels, period_values
+
+    def aggregate_panel(
+        self,
+        panel: Dict[str, Dict[str, list]]
+    ) -> Dict[str, Dict[str, list]]:
+        """Aggregates every column of a panel.
+
+        ### Parameters
+        ----
+        panel : Dict[str, Dict[str, list]]
+            The panel keyed by series ID, each column being a dictionary
+            with the keys `dates` and `values`.
+
+        ### Returns
+        ----
+        Dict[str, Dict[str, list]]:
+            The aggregated panel, in the same shape.
+        """
+
+        aggregated = {}
+
+        for series_id, column in panel.items():
+            dates, values = self.aggregate(
+                dates=column['dates'],
+                values=column['values']
+            )
+            aggregated[series_id] = {'dates': dates, 'values': values}
+
+        return aggregated
+
+    def aggregate_observations(self, content: Dict) -> Dict:
+        """Aggregates a `get_series_observations` response.
+
+        ### Parameters
+        ----
+        content : Dict
+            The response returned by `Series.get_series_observations`
+            with the observations in ascending order.
+
+        ### Returns
+        ----
+        Dict:
+            A copy of the response, as FRED would have returned it for
+            the requested frequency and aggregation method.
+
+        ### Raises
+        ----
+        ValueError:
+            When a date has several rows, as returned for a real-time
+            period spanning revisions or several vintage dates, which
+            would be mixed into one value.
+        """
+
+        observations = content.get('observations', [])
+
+        dates, values = self.aggregate(
+            dates=observation_dates(observations=observations),
+            values=[row['value'] for row in observations]
+        )
+
+        # Keep the real-time period of the last row of each period.
+        realtime = {}
+        for row in observations:
+            realtime[self.period_label(row['date'])] = (
+                row.get('realtime_start'), row.get('realtime_end')
+            )
+
+        new_observations = []
+        for label, value in zip(dates, values):
+            realtime_start, realtime_end = realtime[label]
+            new_observations.append(
+                {
+                    'realtime_start': realtime_start,
+                    'realtime_end': realtime_end,
+                    'date': label.isoformat(),
+                    'value': '.' if math.isnan(value) else repr(value)
+                }
+            )
+
+        new_content = dict(content)
+        new_content['observations'] = new_observations
+        new_content['count'] = len(new_observations)
+
+        return new_content
+
+    def _reduce(self, values: List[float]) -> float:
+        """Reduces the values of a single period with the aggregation method."""
+
+        present = [value for value in values if not math.isnan(value)]
+
+        if not present:
+            return NAN
+
+        if self.aggregation_method == 'eop':
+            return present[-1]
+
+        total = math.fsum(present)
+
+        if self.aggregation_method == 'sum':
+            return total
+
+        return total / len(present)
@@ -0,0 +1,380 @@
+import bisect
+
+from array import array
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Union
+
+# Ordinals are split into chunks of 65,536 keyed by their high bits.
+CHUNK_BITS = 16
+CHUNK_MASK = (1 << CHUNK_BITS) - 1
+
+# Chunks with fewer members are kept as sorted arrays, the others as bits.
+SPARSE_LIMIT = 4096
+
+# The size of a dense chunk, one bit per value.
+DENSE_BYTES = (1 << CHUNK_BITS) // 8
+
+# The positions of the bits set in each byte value.
+BYTE_BITS = [tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)]
+
+
+def popcount(value: int) -> int:
+    """Returns the number of bits set in a non-negative integer."""
+
+    try:
+        return value.bit_count()
+    except AttributeError:
+        return bin(value).count('1')
+
+
+class ChunkedBitmap():
+
+    """
+    ## Overview:
+    ----
+    A compressed set of non-negative integers, such as series ordinals. The
+    range is split into chunks of 65,536 values; a sparse chunk is a sorted
+    `array('H')` of its low bits and a dense chunk is a `bytearray` used as
+    a bit field, so a membership test is a single byte lookup. AND, OR and
+    ANDNOT work a chunk at a time, on whole machine words for dense chunks,
+    and skip chunks missing on either side.
+    """
+
+    __slots__ = ['chunks']
+
+    def __init__(self, ordinals: Iterable[int] = None) -> None:
+        """Initializes the `ChunkedBitmap` object.
+
+        ### Parameters
+        ----
+        ordinals : Iterable[int] (optional, Default=None)
+            The initial members.
+
+        ### Usage
+        ----
+            >>> bitmap = ChunkedBitmap([1, 5, 70000])
+            >>> len(bitmap & ChunkedBitmap([5, 70000, 80000]))
+            2
+        """
+
+        self.chunks: Dict[int, Union[array, bytearray]] = {}
+
+        if ordinals is not None:
+            grouped: Dict[int, List[int]] = {}
+            for ordinal in ordinals:
+                grouped.setdefault(ordinal >> CHUNK_BITS, []).append(ordinal & CHUNK_MASK)
+            for key, low_bits in grouped.items():
+                self.chunks[key] = self._pack(low_bits=sorted(set(low_bits)))
+
+    def __repr__(self) -> str:
+        """String representation of the `ChunkedBitmap` object."""
+
+        # define the string representation
+        str_representation = '<ChunkedBitmap (count={count}, chunks={chunks})>'.format(
+            count=len(self),
+            chunks=len(self.chunks)
+        )
+
+        return str_representation
+
+    def __len__(self) -> int:
+        """Returns the number of members."""
+
+        return sum(self._count(chunk=chunk) for chunk in self.chunks.values())
+
+    def __bool__(self) -> bool:
+        """Returns whether the bitmap has any member."""
+
+        return bool(self.chunks)
+
+    def __contains__(self, ordinal: int) -> bool:
+        """Returns whether an ordinal is a member."""
+
+        chunk = self.chunks.get(ordinal >> CHUNK_BITS)
+        low = ordinal & CHUNK_MASK
+
+        if chunk is None:
+            return False
+        elif isinstance(chunk, bytearray):
+            return bool(chunk[low >> 3] >> (low & 7) & 1)
+
+        return self._find(chunk=chunk, low=low)
+
+    def __iter__(self) -> Iterator[int]:
+        """Yields the members in increasing order."""
+
+        for key in sorted(self.chunks):
+            base = key << CHUNK_BITS
+            for low in self._unpack(chunk=self.chunks[key]):
+                yield base + low
+
+    def __eq__(self, other: object) -> bool:
+        """Returns whether two bitmaps have the same members."""
+
+        if not isinstance(other, ChunkedBitmap):
+            return NotImplemented
+
+        return list(self) == list(other)
+
+    def __and__(self, other: 'ChunkedBitmap') -> 'ChunkedBitmap':
+        """Returns the members of both bitmaps."""
+
+        result = ChunkedBitmap()
+
+        for key in self.chunks.keys() & other.chunks.keys():
+            left, right = self.chunks[key], other.chunks[key]
+
+            if isinstance(left, bytearray) and isinstance(right, bytearray):
+                chunk = self._normalize(bits=self._bits(chunk=left) & self._bits(chunk=right))
+            elif isinstance(left, bytearray):
+                chunk = self._filter(chunk=right, dense=left, keep=True)
+            elif isinstance(right, bytearray):
+                chunk = self._filter(chunk=left, dense=right, keep=True)
+            else:
+                chunk = self._pack(low_bits=sorted(set(left).intersection(right)))
+
+            if chunk is not None:
+                result.chunks[key] = chunk
+
+        return result
+
+    def __or__(self, other: 'ChunkedBitmap') -> 'ChunkedBitmap':
+        """Returns the members of either bitmap."""
+
+        result = ChunkedBitmap()
+
+        for key in self.chunks.keys() | other.chunks.keys():
+            left, right = self.chunks.get(key), other.chunks.get(key)
+
+            if left is None or right is None:
+                result.chunks[key] = self._copy_chunk(chunk=left if right is None else right)
+            else:
+                result.chunks[key] = self._normalize(bits=self._bits(chunk=left) | self._bits(chunk=right))
+
+        return result
+
+    def __sub__(self, other: 'ChunkedBitmap') -> 'ChunkedBitmap':
+        """Returns the members of this bitmap not in the other, i.e. ANDNOT."""
+
+        result = ChunkedBitmap()
+
+        for key, left in self.chunks.items():
+            right = other.chunks.get(key)
+
+            if right is None:
+                chunk = self._copy_chunk(chunk=left)
+            elif isinstance(left, bytearray):
+                chunk = self._normalize(bits=self._bits(chunk=left) & ~self._bits(chunk=right))
+            elif isinstance(right, bytearray):
+                chunk = self._filter(chunk=left, dense=right, keep=False)
+            else:
+                chunk = self._pack(low_bits=sorted(set(left).difference(right)))
+
+            if chunk is not None:
+                result.chunks[key] = chunk
+
+        return result
+
+    def intersection_count(self, other: 'ChunkedBitmap') -> int:
+        """Returns the number of members of both bitmaps, without building the result."""
+
+        count = 0
+
+        for key in self.chunks.keys() & other.chunks.keys():
+            left, right = self.chunks[key], other.chunks[key]
+
+            if isinstance(left, bytearray) and isinstance(right, bytearray):
+                count += popcount(self._bits(chunk=left) & self._bits(chunk=right))
+            elif isinstance(left, bytearray):
+                count += sum(left[low >> 3] >> (low & 7) & 1 for low in right)
+            elif isinstance(right, bytearray):
+                count += sum(right[low >> 3] >> (low & 7) & 1 for low in left)
+            else:
+                count += len(set(left).intersection(right))
+
+        return count
+
+    def add(self, ordinal: int) -> None:
+        """Adds an ordinal."""
+
+        key, low = ordinal >> CHUNK_BITS, ordinal & CHUNK_MASK
+        chunk = self.chunks.get(key)
+
+        if chunk is None:
+            self.chunks[key] = array('H', [low])
+        elif isinstance(chunk, bytearray):
+            chunk[low >> 3] |= 1 << (low & 7)
+        elif not self._find(chunk=chunk, low=low):
+            # Ordinals usually arrive in increasing order, so this is an append.
+            chunk.insert(bisect.bisect_left(chunk, low), low)
+            if len(chunk) >= SPARSE_LIMIT:
+                self.chunks[key] = self._dense(low_bits=chunk)
+
+    def discard(self, ordinal: int) -> None:
+        """Removes an ordinal if it is a member."""
+
+        key, low = ordinal >> CHUNK_BITS, ordinal & CHUNK_MASK
+        chunk = self.chunks.get(key)
+
+        if chunk is None:
+            return
+        elif isinstance(chunk, bytearray):
+            if not chunk[low >> 3] >> (low & 7) & 1:
+                return
+            chunk[low >> 3] &= ~(1 << (low & 7)) & 0xFF
+            chunk = self._normalize(bits=self._bits(chunk=chunk))
+        else:
+            position = bisect.bisect_left(chunk, low)
+            if position < len(chunk) and chunk[position] == low:
+                del chunk[position]
+            chunk = chunk or None
+
+        if chunk is None:
+            del self.chunks[key]
+        else:
+            self.chunks[key] = chunk
+
+    def copy(self) -> 'ChunkedBitmap':
+        """Returns a copy of the bitmap."""
+
+        result = ChunkedBitmap()
+        result.chunks = {
+            key: self._copy_chunk(chunk=chunk) for key, chunk in self.chunks.items()
+        }
+
+        return result
+
+    def slice(self, offset: int = 0, limit: int = None) -> List[int]:
+        """Returns members by rank, skipping whole chunks before the offset.
+
+        ### Parameters
+        ----
+        offset : int (optional, Default=0)
+            The number of members skipped.
+
+        limit : int (optional, Default=None)
+            The maximum number of members returned.
+
+        ### Returns
+        ----
+        List[int]:
+            The members, in increasing order.
+        """
+
+        members = []
+
+        for key in sorted(self.chunks):
+            chunk = self.chunks[key]
+            size = self._count(chunk=chunk)
+
+            if offset >= size:
+                offset -= size
+                continue
+
+            base = key << CHUNK_BITS
+            for low in list(self._unpack(chunk=chunk))[offset:]:
+                if limit is not None and len(members) >= limit:
+                    return members
+                members.append(base + low)
+            offset = 0
+
+        return members
+
+    def nbytes(self) -> int:
+        """Returns the approximate number of bytes used by the chunks."""
+
+        return sum(
+            len(chunk) if isinstance(chunk, bytearray) else chunk.itemsize * len(chunk)
+            for chunk in self.chunks.values()
+        )
+
+    @staticmethod
+    def _pack(low_bits: List[int]) -> Union[array, bytearray]:
+        """Builds a chunk from sorted low bits, None when there are none."""
+
+        if not low_bits:
+            return None
+        elif len(low_bits) < SPARSE_LIMIT:
+            return array('H', low_bits)
+
+        return ChunkedBitmap._dense(low_bits=low_bits)
+
+    @staticmethod
+    def _dense(low_bits: Iterable[int]) -> bytearray:
+        """Builds a dense chunk from low bits."""
+
+        chunk = bytearray(DENSE_BYTES)
+        for low in low_bits:
+            chunk[low >> 3] |= 1 << (low & 7)
+
+        return chunk
+
+    @staticmethod
+    def _normalize(bits: int) -> Union[array, bytearray]:
+        """Builds a chunk from the bit field of a word-wise operation, an array when it became sparse."""
+
+        if not bits:
+            return None
+        elif popcount(bits) < SPARSE_LIMIT:
+            return array('H', ChunkedBitmap._unpack(chunk=bytearray(bits.to_bytes(DENSE_BYTES, 'little'))))
+
+        return bytearray(bits.to_bytes(DENSE_BYTES, 'little'))
+
+    @staticmethod
+    def _copy_chunk(chunk: Union[array, bytearray]) -> Union[array, bytearray]:
+        """Copies a chunk, so results never share a mutable one."""
+
+        return bytearray(chunk) if isinstance(chunk, bytearray) else array('H', chunk)
+
+    @staticmethod
+    def _count(chunk: Union[array, bytearray]) -> int:
+        """Returns the number of members of a chunk."""
+
+        if isinstance(chunk, bytearray):
+            return popcount(int.from_bytes(chunk, 'little'))
+
+        return len(chunk)
+
+    @staticmethod
+    def _bits(chunk: Union[array, bytearray]) -> int:
+        """Returns a chunk as an integer bit field, for word-wise AND, OR and ANDNOT."""
+
+        if not isinstance(chunk, bytearray):
+            chunk = ChunkedBitmap._dense(low_bits=chunk)
+
+        return int.from_bytes(chunk, 'little')
+
+    @staticmethod
+    def _unpack(chunk: Union[array, bytearray]) -> Iterable[int]:
+        """Returns the low bits of a chunk in increasing order."""
+
+        if not isinstance(chunk, bytearray):
+            return chunk
+
+        low_bits = []
+
+        for position, byte in enumerate(chunk):
+            if byte:
+                base = position << 3
+                low_bits.extend(base + bit for bit in BYTE_BITS[byte])
+
+        return low_bits
+
+    @staticmethod
+    def _filter(chunk: array, dense: bytearray, keep: bool) -> array:
+        """Keeps the members of a sparse chunk that are, or are not, in a dense chunk."""
+
+        low_bits = [low for low in chunk if bool(dense[low >> 3] >> (low & 7) & 1) == keep]
+
+        return array('H', low_bits) if low_bits else None
+
+    @staticmethod
+    def _find(chunk: array, low: int) -> bool:
+        """Binary searches a sparse chunk."""
+
+        position = bisect.bisect_left(chunk, low)
+
+        return position < len(chunk) and chunk[position] == low
@@ -0,0 +1,417 @@
+import json
+import time
+import logging
+import threading
+import requests
+
+from collections import deque
+from collections import OrderedDict
+from typing import Callable
+from typing import Dict
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# The endpoints sharing a breaker, by the first segment of their path.
+ENDPOINT_GROUPS = {
+    'category': 'categories',
+    'release': 'releases',
+    'releases': 'releases',
+    'series': 'series',
+    'source': 'sources',
+    'sources': 'sources',
+    'tags': 'tags',
+    'related_tags': 'tags'
+}
+
+# Groups whose responses are too large to keep for the fallback.
+FALLBACK_EXCLUDED_GROUPS = ('observations',)
+
+
+class CircuitOpenError(requests.RequestException):
+
+    """Raised instead of a request while the breaker of its endpoint group is open."""
+
+
+def endpoint_group(endpoint: str) -> str:
+    """Returns the group of an endpoint, observations being kept apart from the rest of `/series`.
+
+    ### Parameters
+    ----
+    endpoint : str
+        The endpoint, for example `/series/observations`.
+
+    ### Returns
+    ----
+    str:
+        The name of the group.
+    """
+
+    if endpoint.startswith('/series/observations'):
+        return 'observations'
+
+    segment = endpoint.strip('/').split('/')[0]
+
+    return ENDPOINT_GROUPS.get(segment, segment)
+
+
+class CircuitBreaker():
+
+    """
+    ## Overview:
+    ----
+    Tracks the recent calls of one endpoint group. The breaker opens when
+    too many of them failed or were slow, so callers fail fast instead of
+    waiting on a degraded upstream. After a cool down it lets a few trial
+    calls through (half-open) and closes again if they succeed. Each
+    allowed call carries the state and the generation it was admitted in,
+    so only the trial calls settle a half-open breaker and results of
+    calls admitted before the last transition are ignored.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        error_rate: float = 0.5,
+        slow_call_seconds: float = 10.0,
+        slow_call_rate: float = 0.5,
+        window: int = 20,
+        min_calls: int = 5,
+        open_seconds: float = 30.0,
+        half_open_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """Initializes the `CircuitBreaker` object.
+
+        ### Parameters
+        ----
+        name : str
+            The endpoint group.
+
+        error_rate : float (optional, Default=0.5)
+            The fraction of failed calls in the window that opens the breaker.
+
+        slow_call_seconds : float (optional, Default=10.0)
+            The duration above which a call counts as slow.
+
+        slow_call_rate : float (optional, Default=0.5)
+            The fraction of slow calls in the window that opens the breaker.
+
+        window : int (optional, Default=20)
+            The number of recent calls the rates are measured over.
+
+        min_calls : int (optional, Default=5)
+            The number of calls needed before the rates are trusted.
+
+        open_seconds : float (optional, Default=30.0)
+            How long the breaker stays open before trial calls.
+
+        half_open_calls : int (optional, Default=1)
+            The number of successful trial calls that close the breaker.
+
+        clock : Callable[[], float] (optional, Default=time.monotonic)
+            Returns the current time in seconds.
+        """
+
+        self.name = name
+        self.error_rate = error_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate = slow_call_rate
+        self.window = window
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self.half_open_calls = half_open_calls
+        self.clock = clock
+
+        self.state = CLOSED
+        self.opened_at: float = None
+        self.rejected = 0
+
+        # Counts the transitions, calls admitted under an older one are stale.
+        self.generation = 0
+
+        # (failed, slow) of the recent calls.
+        self._calls = deque(maxlen=window)
+        self._trials = 0
+        self._trial_successes = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """String representation of the `CircuitBreaker` object."""
+
+        # define the string representation
+        str_representation = '<CircuitBreaker (name={name}, state={state})>'.format(
+            name=self.name,
+            state=self.state
+        )
+
+        return str_representation
+
+    def allow(self) -> tuple:
+        """Returns whether a call may go upstream, moving an open breaker to half-open once cooled down.
+
+        ### Returns
+        ----
+        tuple:
+            None if the call is rejected, otherwise the admission: the state
+            and generation the call was let through in. It must be passed to
+            `record` with the outcome of the call, or to `release` if the
+            call never reached the upstream.
+        """
+
+        with self._lock:
+            if self.state == OPEN and self.clock() - self.opened_at >= self.open_seconds:
+                self._transition(state=HALF_OPEN)
+
+            if self.state == CLOSED:
+                return (CLOSED, self.generation)
+
+            if self.state == HALF_OPEN and self._trials < self.half_open_calls:
+                self._trials += 1
+                return (HALF_OPEN, self.generation)
+
+            self.rejected += 1
+
+            return None
+
+    def record(self, seconds: float, failed: bool, admission: tuple = None) -> None:
+        """Records the outcome of an allowed call.
+
+        ### Parameters
+        ----
+        seconds : float
+            How long the call took.
+
+        failed : bool
+            Whether the upstream failed.
+
+        admission : tuple (optional, Default=None)
+            What `allow` returned for the call, the current state and
+            generation when not provided.
+        """
+
+        slow = seconds >= self.slow_call_seconds
+
+        with self._lock:
+            state, generation = admission or (self.state, self.generation)
+
+            # Admitted before the last transition, the result says nothing about the current state.
+            if generation != self.generation or state != self.state:
+                return
+
+            if state == HALF_OPEN:
+                self._trials -= 1
+                if failed or slow:
+                    self._transition(state=OPEN)
+                else:
+                    self._trial_successes += 1
+                    if self._trial_successes >= self.half_open_calls:
+                        self._transition(state=CLOSED)
+                return
+
+            if state == OPEN:
+                return
+
+            self._calls.append((failed, slow))
+
+            if len(self._calls) >= self.min_calls:
+                failures = sum(call[0] for call in self._calls) / len(self._calls)
+                slow_calls = sum(call[1] for call in self._calls) / len(self._calls)
+                if failures >= self.error_rate or slow_calls >= self.slow_call_rate:
+                    self._transition(state=OPEN)
+
+    def release(self, admission: tuple = None) -> None:
+        """Gives back the slot of an allowed call that failed before reaching the upstream."""
+
+        with self._lock:
+            state, generation = admission or (self.state, self.generation)
+
+            if state == HALF_OPEN == self.state and generation == self.generation and self._trials > 0:
+                self._trials -= 1
+
+    def health(self) -> Dict:
+        """Returns the state of the breaker and the rates of its window.
+
+        ### Returns
+        ----
+        Dict:
+            The state, rates, rejected calls and seconds until the next trial.
+        """
+
+        with self._lock:
+            calls = len(self._calls)
+            retry_in = None
+
+            if self.state == OPEN:
+                retry_in = round(max(0.0, self.open_seconds - (self.clock() - self.opened_at)), 3)
+
+            return {
+                'state': self.state,
+                'calls': calls,
+                'error_rate': round(sum(call[0] for call in self._calls) / calls, 3) if calls else 0.0,
+                'slow_call_rate': round(sum(call[1] for call in self._calls) / calls, 3) if calls else 0.0,
+                'rejected': self.rejected,
+                'retry_in': retry_in
+            }
+
+    def _transition(self, state: str) -> None:
+        """Moves to a new state, holding the lock."""
+
+        logging.warning('Circuit breaker {name} is now {state}.'.format(name=self.name, state=state))
+
+        self.state = state
+        self.generation += 1
+        self._trials = 0
+        self._trial_successes = 0
+
+        if state == OPEN:
+            self.opened_at = self.clock()
+        elif state == CLOSED:
+            self._calls.clear()
+
+
+class CircuitBreakers():
+
+    """
+    ## Overview:
+    ----
+    The circuit breakers of a `FredSession`, one per endpoint group, and
+    the last successful responses served as a fallback while a breaker
+    is open.
+    """
+
+    def __init__(
+        self,
+        fallback_size: int = 100,
+        fallback_excluded_groups: tuple = FALLBACK_EXCLUDED_GROUPS,
+        **breaker_kwargs
+    ) -> None:
+        """Initializes the `CircuitBreakers` object.
+
+        ### Parameters
+        ----
+        fallback_size : int (optional, Default=100)
+            The number of responses kept for the fallback, 0 to always fail fast.
+
+        fallback_excluded_groups : tuple (optional, Default=FALLBACK_EXCLUDED_GROUPS)
+            The endpoint groups never kept for the fallback, observations by
+            default since their responses can be large.
+
+        **breaker_kwargs : dict
+            The arguments of each `CircuitBreaker`.
+
+        ### Usage
+        ----
+            >>> fred_client = FederalReserveClient(api_key='xxxxxx')
+            >>> fred_client.fred_session.circuit_breakers = CircuitBreakers(open_seconds=60.0)
+            >>> fred_client.fred_session.health()
+        """
+
+        self.fallback_size = fallback_size
+        self.fallback_excluded_groups = fallback_excluded_groups
+        self.breaker_kwargs = breaker_kwargs
+
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self._responses = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """String representation of the `CircuitBreakers` object."""
+
+        # define the string representation
+        str_representation = '<CircuitBreakers (breakers={breakers})>'.format(
+            breakers={name: breaker.state for name, breaker in self.breakers.items()}
+        )
+
+        return str_representation
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        """Returns the breaker of an endpoint's group, creating it on first use."""
+
+        name = endpoint_group(endpoint=endpoint)
+
+        with self._lock:
+            if name not in self.breakers:
+                self.breakers[name] = CircuitBreaker(name=name, **self.breaker_kwargs)
+
+            return self.breakers[name]
+
+    def remember(self, endpoint: str, params: Dict, content: bytes) -> None:
+        """Keeps the body of a successful response for the fallback.
+
+        ### Parameters
+        ----
+        endpoint : str
+            The endpoint of the request.
+
+        params : Dict
+            The parameters of the request.
+
+        content : bytes
+            The raw JSON body, decoded only if it is ever served.
+        """
+
+        if not self.fallback_size or endpoint_group(endpoint=endpoint) in self.fallback_excluded_groups:
+            return
+
+        key = self._key(endpoint=endpoint, params=params)
+
+        with self._lock:
+            self._responses[key] = content
+            self._responses.move_to_end(key)
+            while len(self._responses) > self.fallback_size:
+                self._responses.popitem(last=False)
+
+    def fallback(self, endpoint: str, params: Dict) -> Dict:
+        """Returns the last successful response of a request whose breaker is open.
+
+        ### Raises
+        ----
+        CircuitOpenError:
+            When no response was kept for the request.
+        """
+
+        with self._lock:
+            content = self._responses.get(self._key(endpoint=endpoint, params=params))
+
+        if content is None:
+            raise CircuitOpenError('The circuit breaker of {name} is open.'.format(
+                name=endpoint_group(endpoint=endpoint)
+            ))
+
+        logging.warning('Served a stale response for {endpoint}, its circuit breaker is open.'.format(
+            endpoint=endpoint
+        ))
+
+        # Decoded on every use, so callers never share the fallback.
+        return json.loads(content)
+
+    def health(self) -> Dict:
+        """Returns whether every breaker is closed, and the health of each one.
+
+        ### Returns
+        ----
+        Dict:
+            `healthy` is False while any breaker is open, `degraded` while any
+            one is not closed.
+        """
+
+        with self._lock:
+            breakers = dict(self.breakers)
+
+        groups = {name: breaker.health() for name, breaker in breakers.items()}
+
+        return {
+            'healthy': all(group['state'] != OPEN for group in groups.values()),
+            'degraded': any(group['state'] != CLOSED for group in groups.values()),
+            'groups': groups
+        }
+
+    @staticmethod
+    def _key(endpoint: str, params: Dict) -> tuple:
+        """Identifies a request, leaving the API key out."""
+
+        return endpoint, tuple(sorted(
+            (key, str(value)) for key, value in (params or {}).items() if key != 'api_key'
+        ))
@@ -0,0 +1,720 @@
+import time
+import threading
+
+from typing import Callable
+from typing import Dict
+from typing import List
+from datetime import date
+from datetime import datetime
+from datetime import time as datetime_time
+from datetime import timedelta
+from datetime import timezone
+from datetime import tzinfo
+from fred.series import Series
+
+
+class CentralTime(tzinfo):
+
+    """
+    ## Overview:
+    ----
+    US Central time, the clock of the FRED server, with the daylight saving
+    rules in force since 2007: from 2:00 on the second Sunday of March to
+    2:00 on the first Sunday of November. Only used when `zoneinfo` or its
+    time zone data is missing, as on Windows without the `tzdata` package.
+    """
+
+    STANDARD_OFFSET = timedelta(hours=-6)
+    HOUR = timedelta(hours=1)
+
+    def __repr__(self) -> str:
+        """String representation of the `CentralTime` object."""
+
+        # define the string representation
+        str_representation = '<CentralTime (standard_offset=-06:00)>'
+
+        return str_representation
+
+    @staticmethod
+    def dst_range(year: int) -> tuple:
+        """Returns the local times daylight saving time starts and ends in a year."""
+
+        # The second Sunday of March is the first one on or after the 8th.
+        start = datetime(year, 3, 8, 2)
+        end = datetime(year, 11, 1, 2)
+
+        return (
+            start + timedelta(days=6 - start.weekday()),
+            end + timedelta(days=6 - end.weekday())
+        )
+
+    def utcoffset(self, dt: datetime) -> timedelta:
+        return self.STANDARD_OFFSET + self.dst(dt)
+
+    def tzname(self, dt: datetime) -> str:
+        return 'CDT' if self.dst(dt) else 'CST'
+
+    def dst(self, dt: datetime) -> timedelta:
+        if dt is None:
+            return timedelta(0)
+
+        start, end = self.dst_range(year=dt.year)
+        dt = dt.replace(tzinfo=None)
+
+        if start + self.HOUR <= dt < end - self.HOUR:
+            return self.HOUR
+        elif end - self.HOUR <= dt < end:
+            # The repeated hour, the first time through is still daylight saving time.
+            return timedelta(0) if dt.fold else self.HOUR
+        elif start <= dt < start + self.HOUR:
+            # The skipped hour.
+            return self.HOUR if dt.fold else timedelta(0)
+
+        return timedelta(0)
+
+    def fromutc(self, dt: datetime) -> datetime:
+        start, end = self.dst_range(year=dt.year)
+        standard_time = dt.replace(tzinfo=None) + self.STANDARD_OFFSET
+        daylight_time = standard_time + self.HOUR
+
+        if end <= daylight_time < end + self.HOUR:
+            return standard_time.replace(tzinfo=self, fold=1)
+        elif start <= standard_time < end - self.HOUR:
+            return daylight_time.replace(tzinfo=self)
+
+        return standard_time.replace(tzinfo=self)
+
+
+try:
+    from zoneinfo import ZoneInfo
+    FRED_TIMEZONE = ZoneInfo('America/Chicago')
+except Exception:
+    FRED_TIMEZONE = CentralTime()
+
+# `Series.get_series_updates` only covers the last two weeks.
+UPDATES_HORIZON = timedelta(days=14)
+
+# How long after its last update a series of each `frequency_short` is
+# expected to change again.
+FREQUENCY_PERIODS = {
+    'D': timedelta(days=1),
+    'W': timedelta(days=7),
+    'BW': timedelta(days=14),
+    'M': timedelta(days=31),
+    'Q': timedelta(days=92),
+    'SA': timedelta(days=183),
+    'A': timedelta(days=366)
+}
+
+# The end of the real-time period meaning "as of today".
+LATEST_REALTIME = '9999-12-31'
+
+
+def fred_time(value: datetime) -> str:
+    """Formats a datetime as the YYYYMMDDHhmm string used by `get_series_updates`.
+
+    ### Parameters
+    ----
+    value : datetime
+        The datetime, naive values are assumed to be in local time.
+
+    ### Returns
+    ----
+    str:
+        The time on the FRED server clock.
+    """
+
+    return value.astimezone(FRED_TIMEZONE).strftime('%Y%m%d%H%M')
+
+
+class MetadataCache():
+
+    """
+    ## Overview:
+    ----
+    Caches the series metadata returned by `get_series`, `get_series_tags`,
+    `get_series_categories` and `get_series_release`. Entries are kept
+    indefinitely and are only dropped when `Series.get_series_updates`
+    reports that their series changed, so staleness is bounded by the
+    poll interval.
+    """
+
+    CACHED_METHODS = [
+        'get_series',
+        'get_series_tags',
+        'get_series_categories',
+        'get_series_release'
+    ]
+
+    def __init__(self, series_service: Series, poll_interval: float = 300.0) -> None:
+        """Initializes the `MetadataCache` object.
+
+        ### Parameters
+        ----
+        series_service : Series
+            The `Series` service used to fetch metadata and updates.
+
+        poll_interval : float (optional, Default=300.0)
+            The number of seconds between two polls of the updates feed.
+            Cache reads trigger a poll once the interval has elapsed.
+
+        ### Usage
+        ----
+            >>> fred_client = FederalReserveClient(api_key='xxxxxx')
+            >>> metadata_cache = MetadataCache(series_service=fred_client.series())
+            >>> metadata_cache.get_series(series_id='GNPCA')
+        """
+
+        self.series_service = series_service
+        self.poll_interval = poll_interval
+
+        self.entries: Dict[str, Dict[tuple, Dict]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.last_poll = datetime.now(tz=timezone.utc)
+
+        self._last_poll_clock = time.monotonic()
+        self._lock = threading.RLock()
+
+        # Bumped on every invalidation, so a fetch that raced with one is not stored.
+        self._generations: Dict[str, int] = {}
+        self._clears = 0
+
+    def __repr__(self) -> str:
+        """String representation of the `MetadataCache` object."""
+
+        # define the string representation
+        str_representation = '<MetadataCache (series={series}, hits={hits}, misses={misses})>'.format(
+            series=len(self.entries),
+            hits=self.hits,
+            misses=self.misses
+        )
+
+        return str_representation
+
+    def get_series(self, series_id: str, **kwargs) -> Dict:
+        """Cached version of `Series.get_series`."""
+
+        return self._get(method='get_series', series_id=series_id, **kwargs)
+
+    def get_series_tags(self, series_id: str, **kwargs) -> Dict:
+        """Cached version of `Series.get_series_tags`."""
+
+        return self._get(method='get_series_tags', series_id=series_id, **kwargs)
+
+    def get_series_categories(self, series_id: str, **kwargs) -> Dict:
+        """Cached version of `Series.get_series_categories`."""
+
+        return self._get(method='get_series_categories', series_id=series_id, **kwargs)
+
+    def get_series_release(self, series_id: str, **kwargs) -> Dict:
+        """Cached version of `Series.get_series_release`."""
+
+        return self._get(method='get_series_release', series_id=series_id, **kwargs)
+
+    def invalidate(self, series_id: str) -> None:
+        """Drops every cached entry of a series.
+
+        ### Parameters
+        ----
+        series_id : str
+            The ID of the series.
+        """
+
+        with self._lock:
+            self.entries.pop(series_id, None)
+            self._generations[series_id] = self._generations.get(series_id, 0) + 1
+
+    def clear(self) -> None:
+        """Drops every cached entry."""
+
+        with self._lock:
+            self.entries.clear()
+            self._clears += 1
+
+    def hit_rate(self) -> float:
+        """Returns the share of reads served from the cache."""
+
+        total = self.hits + self.misses
+
+        return self.hits / total if total else 0.0
+
+    def poll(self, now: datetime = None) -> List[str]:
+        """Invalidates the series updated since the last poll.
+
+        ### Overview
+        ----
+        Pages through `Series.get_series_updates` for the window between the
+        previous poll and now. If that window is older than the two weeks the
+        updates feed covers, the whole cache is cleared instead.
+
+        ### Parameters
+        ----
+        now : datetime (optional, Default=None)
+            The end of the window, the current time when not provided.
+
+        ### Returns
+        ----
+        List[str]:
+            The IDs of the series that were updated.
+        """
+
+        now = now or datetime.now(tz=timezone.utc)
+
+        # The window only moves once it was fully read, so a failed poll is retried.
+        with self._lock:
+            start = self.last_poll
+            self._last_poll_clock = time.monotonic()
+
+        if now - start >= UPDATES_HORIZON:
+            self.clear()
+            with self._lock:
+                self.last_poll = now
+            return []
+
+        updated = []
+        offset = 0
+
+        while True:
+            content = self.series_service.get_series_updates(
+                offset=offset,
+                limit=1000,
+                start_time=fred_time(start),
+                end_time=fred_time(now)
+            )
+            page = content.get('seriess', [])
+            updated.extend(series['id'] for series in page)
+            offset += len(page)
+
+            if not page or offset >= content.get('count', 0):
+                break
+
+        for series_id in updated:
+            self.invalidate(series_id=series_id)
+
+        with self._lock:
+            self.last_poll = max(self.last_poll, now)
+
+        return updated
+
+    def _get(self, method: str, series_id: str, **kwargs) -> Dict:
+        """Returns a cached response, fetching it on a miss."""
+
+        if time.monotonic() - self._last_poll_clock >= self.poll_interval:
+            self.poll()
+
+        key = (method, tuple(sorted(kwargs.items())))
+
+        with self._lock:
+            cached = self.entries.get(series_id, {}).get(key)
+            if cached is not None:
+                self.hits += 1
+                return cached
+            self.misses += 1
+            generation = (self._clears, self._generations.get(series_id, 0))
+
+        content = getattr(self.series_service, method)(series_id=series_id, **kwargs)
+
+        with self._lock:
+            if generation == (self._clears, self._generations.get(series_id, 0)):
+                self.entries.setdefault(series_id, {})[key] = content
+
+        return content
+
+
+class TTLPolicy():
+
+    """
+    ## Overview:
+    ----
+    Decides how long a cached series response stays valid. When the next
+    release date of the series' release is known, the entry lives until that
+    day starts on the FRED clock. Otherwise the expiry is estimated from the
+    series `frequency_short` and `last_updated`. Responses pinned to a past
+    real-time period can never change and live for `max_ttl`.
+    """
+
+    def __init__(
+        self,
+        release_calendar: object = None,
+        min_ttl: timedelta = timedelta(minutes=5),
+        max_ttl: timedelta = timedelta(days=30),
+        overdue_ttl: timedelta = timedelta(hours=1),
+        default_ttl: timedelta = timedelta(hours=6)
+    ) -> None:
+        """Initializes the `TTLPolicy` object.
+
+        ### Parameters
+        ----
+        release_calendar : ReleaseCalendar (optional, Default=None)
+            The calendar used to find the next release date of a series.
+            Releases it does not know yet are harvested on first use.
+
+        min_ttl : timedelta (optional, Default=5 minutes)
+            The shortest life of an entry.
+
+        max_ttl : timedelta (optional, Default=30 days)
+            The longest life of an entry.
+
+        overdue_ttl : timedelta (optional, Default=1 hour)
+            The life of an entry whose expected update has already passed.
+
+        default_ttl : timedelta (optional, Default=6 hours)
+            The life of an entry when nothing is known about its schedule.
+
+        ### Usage
+        ----
+            >>> fred_client = FederalReserveClient(api_key='xxxxxx')
+            >>> ttl_policy = TTLPolicy(
+                    release_calendar=ReleaseCalendar(paginator=fred_client.paginator())
+                )
+        """
+
+        self.release_calendar = release_calendar
+        self.min_ttl = min_ttl
+        self.max_ttl = max_ttl
+        self.overdue_ttl = overdue_ttl
+        self.default_ttl = default_ttl
+
+    def __repr__(self) -> str:
+        """String representation of the `TTLPolicy` object."""
+
+        # define the string representation
+        str_representation = '<TTLPolicy (min_ttl={min_ttl}, max_ttl={max_ttl}, calendar={calendar})>'.format(
+            min_ttl=self.min_ttl,
+            max_ttl=self.max_ttl,
+            calendar=self.release_calendar is not None
+        )
+
+        return str_representation
+
+    def expires_at(self, series_info: Dict, now: datetime = None, params: Dict = None) -> datetime:
+        """Returns when a response about a series stops being valid.
+
+        ### Parameters
+        ----
+        series_info : Dict
+            The series, as found in the `seriess` of `Series.get_series`.
+
+        now : datetime (optional, Default=None)
+            The current time, when not provided the clock is read.
+
+        params : Dict (optional, Default=None)
+            The arguments of the cached request, used to detect
+            responses pinned to the past.
+
+        ### Returns
+        ----
+        datetime:
+            The expiry, timezone aware.
+        """
+
+        now = now or datetime.now(tz=timezone.utc)
+
+        if params and self.is_immutable(params=params, now=now):
+            return now + self.max_ttl
+
+        last_updated = self.parse_last_updated(value=series_info.get('last_updated'))
+        expected = self._next_release(series_info=series_info, last_updated=last_updated, now=now)
+
+        if expected is None:
+            expected = self._next_update(series_info=series_info, last_updated=last_updated)
+
+        if expected is None:
+            ttl = self.default_ttl
+        elif expected <= now:
+            ttl = self.overdue_ttl
+        else:
+            ttl = expected - now
+
+        return now + min(max(ttl, self.min_ttl), self.max_ttl)
+
+    def is_immutable(self, params: Dict, now: datetime = None) -> bool:
+        """Returns whether request arguments pin the response to the past.
+
+        ### Parameters
+        ----
+        params : Dict
+            The arguments of the request.
+
+        now : datetime (optional, Default=None)
+            The current time.
+
+        ### Returns
+        ----
+        bool:
+            `True` if the response describes a real-time period that has ended.
+        """
+
+        today = (now or datetime.now(tz=timezone.utc)).astimezone(FRED_TIMEZONE).date()
+
+        vintage_dates = params.get('vintage_dates')
+        if vintage_dates and vintage_dates != 'all':
+            if isinstance(vintage_dates, (str, date)):
+                vintage_dates = [vintage_dates]
+            return all(self._to_date(value=value) < today for value in vintage_dates)
+
+        realtime_end = params.get('realtime_end')
+        if realtime_end and realtime_end != LATEST_REALTIME:
+            return self._to_date(value=realtime_end) < today
+
+        return False
+
+    @staticmethod
+    def parse_last_updated(value: str) -> datetime:
+        """Parses a `last_updated` value like '2013-07-31 09:26:16-05'."""
+
+        if not value:
+            return None
+
+        try:
+            return datetime.strptime(value + '00', '%Y-%m-%d %H:%M:%S%z')
+        except ValueError:
+            return None
+
+    def _next_update(self, series_info: Dict, last_updated: datetime) -> datetime:
+        """Estimates the next update from the frequency of the series."""
+
+        period = FREQUENCY_PERIODS.get(str(series_info.get('frequency_short', '')).upper())
+
+        if period is None or last_updated is None:
+            return None
+
+        expected = last_updated + period
+
+        # Daily series are only published on business days.
+        while expected.astimezone(FRED_TIMEZONE).weekday() >= 5:
+            expected += timedelta(days=1)
+
+        return expected
+
+    def _next_release(self, series_info: Dict, last_updated: datetime, now: datetime) -> datetime:
+        """Returns the start of the next release day of the series, on the FRED clock."""
+
+        if self.release_calendar is None or 'id' not in series_info:
+            return None
+
+        release_id = self.release_calendar.release_for_series(series_id=series_info['id'])
+
+        if not self.release_calendar.has_release(release_id=release_id):
+            self.release_calendar.harvest_release(release_id=release_id)
+
+        today = now.astimezone(FRED_TIMEZONE).date()
+        next_date = self.release_calendar.next_release_date(
+            release_id=release_id,
+            after=today - timedelta(days=1)
+        )
+
+        # Today's release is already out once the series was updated today.
+        if next_date == today and last_updated and last_updated.astimezone(FRED_TIMEZONE).date() >= today:
+            next_date = self.release_calendar.next_release_date(release_id=release_id, after=today)
+
+        if next_date is None:
+            return None
+
+        return datetime.combine(next_date, datetime_time.min, tzinfo=FRED_TIMEZONE)
+
+    @staticmethod
+    def _to_date(value: object) -> date:
+        """Converts a YYYY-MM-DD string, date or datetime to a date."""
+
+        if isinstance(value, datetime):
+            return value.date()
+        elif isinstance(value, date):
+            return value
+
+        return date.fromisoformat(str(value)[0:10])
+
+
+class ResponseCache():
+
+    """
+    ## Overview:
+    ----
+    Caches observation and metadata responses of the `Series` service, with
+    each entry living as long as the `TTLPolicy` says it can be valid. The
+    `get_series` response of a series drives the expiry of every other
+    response about it, and is cached the same way.
+    """
+
+    CACHED_METHODS = [
+        'get_series',
+        'get_series_observations',
+        'get_series_tags',
+        'get_series_categories',
+        'get_series_release',
+        'get_series_vintage_dates'
+    ]
+
+    def __init__(
+        self,
+        series_service: Series,
+        ttl_policy: TTLPolicy = None,
+        clock: Callable[[], datetime] = None
+    ) -> None:
+        """Initializes the `ResponseCache` object.
+
+        ### Parameters
+        ----
+        series_service : Series
+            The `Series` service used on a miss.
+
+        ttl_policy : TTLPolicy (optional, Default=None)
+            The policy deciding expiries, a calendar-less one by default.
+
+        clock : Callable[[], datetime] (optional, Default=None)
+            Returns the current time, timezone aware.
+
+        ### Usage
+        ----
+            >>> fred_client = FederalReserveClient(api_key='xxxxxx')
+            >>> response_cache = ResponseCache(series_service=fred_client.series())
+            >>> response_cache.get_series_observations(series_id='GNPCA')
+        """
+
+        self.series_service = series_service
+        self.ttl_policy = ttl_policy or TTLPolicy()
+        self.clock = clock or (lambda: datetime.now(tz=timezone.utc))
+
+        self.entries: Dict[tuple, tuple] = {}
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.RLock()
+
+    def __repr__(self) -> str:
+        """String representation of the `ResponseCache` object."""
+
+        # define the string representation
+        str_representation = '<ResponseCache (entries={entries}, hits={hits}, misses={misses})>'.format(
+            entries=len(self.entries),
+            hits=self.hits,
+            misses=self.misses
+        )
+
+        return str_representation
+
+    def get_series(self, series_id: str, **kwargs) -> Dict:
+        """Cached version of `Series.get_series`."""
+
+        return self.get(method='get_series', series_id=series_id, **kwargs)
+
+    def get_series_observations(self, series_id: str, **kwargs) -> Dict:
+        """Cached version of `Series.get_series_observations`."""
+
+        return self.get(method='get_series_observations', series_id=series_id, **kwargs)
+
+    def get_series_tags(self, series_id: str, **kwargs) -> Dict:
+        """Cached version of `Series.get_series_tags`."""
+
+        return self.get(method='get_series_tags', series_id=series_id, **kwargs)
+
+    def get_series_categories(self, series_id: str, **kwargs) -> Dict:
+        """Cached version of `Series.get_series_categories`."""
+
+        return self.get(method='get_series_categories', series_id=series_id, **kwargs)
+
+    def get_series_release(self, series_id: str, **kwargs) -> Dict:
+        """Cached version of `Series.get_series_release`."""
+
+        return self.get(method='get_series_release', series_id=series_id, **kwargs)
+
+    def get_series_vintage_dates(self, series_id: str, **kwargs) -> Dict:
+        """Cached version of `Series.get_series_vintage_dates`."""
+
+        return self.get(method='get_series_vintage_dates', series_id=series_id, **kwargs)
+
+    def get(self, method: str, series_id: str, **kwargs) -> Dict:
+        """Returns a cached response, fetching it on a miss or once it expired.
+
+        ### Parameters
+        ----
+        method : str
+            The name of the `Series` method, one of `CACHED_METHODS`.
+
+        series_id : str
+            The ID of the series.
+
+        **kwargs : dict
+            The other arguments of the method.
+
+        ### Returns
+        ----
+        Dict:
+            The response.
+        """
+
+        if method not in self.CACHED_METHODS:
+            raise ValueError('{method} is not cached.'.format(method=method))
+
+        key = (method, series_id, self._freeze(value=kwargs))
+        now = self.clock()
+
+        with self._lock:
+            cached = self.entries.get(key)
+            if cached is not None and cached[0] > now:
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+
+        content = getattr(self.series_service, method)(series_id=series_id, **kwargs)
+
+        if method == 'get_series' and content.get('seriess'):
+            series_info = content['seriess'][-1]
+        else:
+            series_info = self.get_series(series_id=series_id)['seriess'][-1]
+
+        expires_at = self.ttl_policy.expires_at(series_info=series_info, now=now, params=kwargs)
+
+        with self._lock:
+            self.entries[key] = (expires_at, content)
+
+        return content
+
+    def expires_at(self, method: str, series_id: str, **kwargs) -> datetime:
+        """Returns when a cached response expires, None when it is not cached."""
+
+        cached = self.entries.get((method, series_id, self._freeze(value=kwargs)))
+
+        return cached[0] if cached else None
+
+    def invalidate(self, series_id: str) -> None:
+        """Drops every cached response of a series."""
+
+        with self._lock:
+            for key in [key for key in self.entries if key[1] == series_id]:
+                del self.entries[key]
+
+    def purge(self) -> int:
+        """Drops the expired entries and returns how many were dropped."""
+
+        now = self.clock()
+
+        with self._lock:
+            expired = [key for key, (expires_at, _) in self.entries.items() if expires_at <= now]
+            for key in expired:
+                del self.entries[key]
+
+        return len(expired)
+
+    def clear(self) -> None:
+        """Drops every cached response."""
+
+        with self._lock:
+            self.entries.clear()
+
+    def hit_rate(self) -> float:
+        """Returns the share of reads served from the cache."""
+
+        total = self.hits + self.misses
+
+        return self.hits / total if total else 0.0
+
+    @staticmethod
+    def _freeze(value: Dict) -> tuple:
+        """Turns request arguments into a hashable key."""
+
+        return tuple(sorted(
+            (name, tuple(item) if isinstance(item, list) else item)
+            for name, item in value.items()
+        ))
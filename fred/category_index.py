@@ -0,0 +1,253 @@
+import json
+import pathlib
+
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+from typing import List
+from typing import Union
+from fred.category_tree import CategoryTree
+from fred.paginator import Paginator
+
+
+class CategorySeriesIndex():
+
+    """
+    ## Overview:
+    ----
+    A materialized mapping between categories and their series. Series IDs
+    are stored once and referred to by dense ordinals, and the series of
+    each category are laid out in the pre-order of the `CategoryTree`. The
+    series of a whole subtree are therefore one contiguous slice, which
+    answers "every series under category X" without walking the hierarchy.
+    """
+
+    def __init__(self, category_tree: CategoryTree, series_by_category: Dict[int, List[str]]) -> None:
+        """Initializes the `CategorySeriesIndex` object, see `harvest` and `load`.
+
+        ### Parameters
+        ----
+        category_tree : CategoryTree
+            The hierarchy the categories belong to.
+
+        series_by_category : Dict[int, List[str]]
+            The series IDs of each category.
+
+        ### Usage
+        ----
+            >>> fred_client = FederalReserveClient(api_key='xxxxxx')
+            >>> category_tree = CategoryTree.crawl(categories_service=fred_client.categories())
+            >>> category_index = CategorySeriesIndex.harvest(
+                    category_tree=category_tree,
+                    paginator=fred_client.paginator()
+                )
+            >>> category_index.subtree_series(category_id=32991)
+        """
+
+        self.category_tree = category_tree
+
+        self.series_ids: List[str] = []
+        self.ordinals: Dict[str, int] = {}
+
+        # `offsets[position]` is where the series of the category at that
+        # pre-order position start in `members`.
+        self.offsets = array('i', [0])
+        self.members = array('i')
+
+        for category_id in category_tree.category_ids:
+            for series_id in sorted(set(series_by_category.get(category_id, []))):
+                ordinal = self.ordinals.get(series_id)
+                if ordinal is None:
+                    ordinal = len(self.series_ids)
+                    self.ordinals[series_id] = ordinal
+                    self.series_ids.append(series_id)
+                self.members.append(ordinal)
+            self.offsets.append(len(self.members))
+
+        self._categories_by_series: Dict[int, List[int]] = None
+
+    def __repr__(self) -> str:
+        """String representation of the `CategorySeriesIndex` object."""
+
+        # define the string representation
+        str_representation = '<CategorySeriesIndex (categories={categories}, series={series}, links={links})>'.format(
+            categories=len(self.category_tree),
+            series=len(self.series_ids),
+            links=len(self.members)
+        )
+
+        return str_representation
+
+    @classmethod
+    def harvest(
+        cls,
+        category_tree: CategoryTree,
+        paginator: Paginator,
+        max_workers: int = 8
+    ) -> 'CategorySeriesIndex':
+        """Fetches the series of every category in the tree concurrently.
+
+        ### Parameters
+        ----
+        category_tree : CategoryTree
+            The hierarchy to harvest.
+
+        paginator : Paginator
+            The `Paginator` used to walk `get_category_series`.
+
+        max_workers : int (optional, Default=8)
+            The number of categories harvested concurrently.
+
+        ### Returns
+        ----
+        CategorySeriesIndex:
+            The materialized index.
+        """
+
+        def fetch_series(category_id: int) -> List[str]:
+            return [
+                series['id'] for series in
+                paginator.category_series(category_id=str(category_id))
+            ]
+
+        category_ids = category_tree.category_ids.tolist()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            series_by_category = dict(
+                zip(category_ids, executor.map(fetch_series, category_ids))
+            )
+
+        return cls(category_tree=category_tree, series_by_category=series_by_category)
+
+    def save(self, file_path: Union[str, pathlib.Path]) -> None:
+        """Saves the index to a JSON file, the tree is saved separately.
+
+        ### Parameters
+        ----
+        file_path : Union[str, pathlib.Path]
+            The path of the file.
+        """
+
+        with open(file=file_path, mode='w', encoding='utf-8') as index_file:
+            json.dump(
+                obj={
+                    'category_ids': self.category_tree.category_ids.tolist(),
+                    'series_ids': self.series_ids,
+                    'offsets': self.offsets.tolist(),
+                    'members': self.members.tolist()
+                },
+                fp=index_file
+            )
+
+    @classmethod
+    def load(cls, file_path: Union[str, pathlib.Path], category_tree: CategoryTree) -> 'CategorySeriesIndex':
+        """Loads an index saved with `save`.
+
+        ### Parameters
+        ----
+        file_path : Union[str, pathlib.Path]
+            The path of the file.
+
+        category_tree : CategoryTree
+            The hierarchy the index was built on.
+
+        ### Returns
+        ----
+        CategorySeriesIndex:
+            The index.
+        """
+
+        with open(file=file_path, mode='r', encoding='utf-8') as index_file:
+            content = json.load(fp=index_file)
+
+        if content['category_ids'] != category_tree.category_ids.tolist():
+            raise ValueError('The index was built on a different category tree.')
+
+        category_index = cls(category_tree=category_tree, series_by_category={})
+        category_index.series_ids = content['series_ids']
+        category_index.ordinals = {
+            series_id: ordinal for ordinal, series_id in enumerate(content['series_ids'])
+        }
+        category_index.offsets = array('i', content['offsets'])
+        category_index.members = array('i', content['members'])
+
+        return category_index
+
+    def series(self, category_id: int) -> List[str]:
+        """Returns the series directly in a category.
+
+        ### Parameters
+        ----
+        category_id : int
+            The ID of the category.
+
+        ### Returns
+        ----
+        List[str]:
+            The series IDs.
+        """
+
+        position = self.category_tree.positions[int(category_id)]
+
+        return [
+            self.series_ids[ordinal]
+            for ordinal in self.members[self.offsets[position]:self.offsets[position + 1]]
+        ]
+
+    def subtree_series(self, category_id: int) -> List[str]:
+        """Returns the series in a category and all of its descendants.
+
+        ### Parameters
+        ----
+        category_id : int
+            The ID of the category.
+
+        ### Returns
+        ----
+        List[str]:
+            The distinct series IDs, sorted.
+        """
+
+        start, end = self.category_tree.subtree_range(category_id=category_id)
+        ordinals = set(self.members[self.offsets[start]:self.offsets[end]])
+
+        return sorted(self.series_ids[ordinal] for ordinal in ordinals)
+
+    def subtree_count(self, category_id: int) -> int:
+        """Returns the number of distinct series under a category."""
+
+        start, end = self.category_tree.subtree_range(category_id=category_id)
+
+        return len(set(self.members[self.offsets[start]:self.offsets[end]]))
+
+    def categories(self, series_id: str) -> List[int]:
+        """Returns the categories a series belongs to, like `Series.get_series_categories`.
+
+        ### Parameters
+        ----
+        series_id : str
+            The ID of the series.
+
+        ### Returns
+        ----
+        List[int]:
+            The category IDs.
+        """
+
+        if self._categories_by_series is None:
+            self._build_reverse_map()
+
+        ordinal = self.ordinals.get(series_id)
+
+        return list(self._categories_by_series.get(ordinal, []))
+
+    def _build_reverse_map(self) -> None:
+        """Builds the series to categories map from the postings."""
+
+        categories_by_series: Dict[int, List[int]] = {}
+
+        for position, category_id in enumerate(self.category_tree.category_ids):
+            for ordinal in self.members[self.offsets[position]:self.offsets[position + 1]]:
+                categories_by_series.setdefault(ordinal, []).append(category_id)
+
+        self._categories_by_series = categories_by_series
@@ -0,0 +1,277 @@
+import json
+import pathlib
+
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+from fred.categories import Categories
+
+# The ID of the category at the top of FRED's hierarchy.
+ROOT_CATEGORY_ID = 0
+
+
+class CategoryTree():
+
+    """
+    ## Overview:
+    ----
+    A local snapshot of FRED's category hierarchy. Categories are stored in
+    pre-order, so every subtree is a contiguous range of positions, which makes
+    descendant checks O(1) and ancestor walks O(depth). Once crawled, the tree
+    answers hierarchy questions without any further API call.
+    """
+
+    def __init__(
+        self,
+        category_ids: List[int],
+        parent_ids: List[int],
+        names: List[str]
+    ) -> None:
+        """Initializes the `CategoryTree` object from its nodes, see `crawl` and `load`.
+
+        ### Parameters
+        ----
+        category_ids : List[int]
+            The IDs of the categories, the root first.
+
+        parent_ids : List[int]
+            The parent ID of each category, the root's parent is ignored.
+
+        names : List[str]
+            The name of each category.
+
+        ### Usage
+        ----
+            >>> fred_client = FederalReserveClient(api_key='xxxxxx')
+            >>> category_tree = CategoryTree.crawl(categories_service=fred_client.categories())
+            >>> category_tree.path_to_root(category_id=125)
+        """
+
+        root_id = category_ids[0]
+
+        names_by_id = dict(zip(category_ids, names))
+        children_by_id: Dict[int, List[int]] = {category_id: [] for category_id in category_ids}
+        for category_id, parent_id in zip(category_ids[1:], parent_ids[1:]):
+            children_by_id[parent_id].append(category_id)
+
+        self.category_ids = array('i')
+        self.parents = array('i')
+        self.depths = array('i')
+        self.subtree_ends = array('i')
+        self.names: List[str] = []
+        self.positions: Dict[int, int] = {}
+
+        # Lay the nodes out in pre-order with an explicit stack.
+        stack = [(root_id, -1, 0)]
+        while stack:
+            category_id, parent_position, depth = stack.pop()
+            position = len(self.category_ids)
+
+            self.positions[category_id] = position
+            self.category_ids.append(category_id)
+            self.parents.append(parent_position)
+            self.depths.append(depth)
+            self.subtree_ends.append(0)
+            self.names.append(names_by_id[category_id])
+
+            for child_id in reversed(sorted(children_by_id[category_id])):
+                stack.append((child_id, position, depth + 1))
+
+        # A subtree ends where the next node that is not a descendant starts.
+        open_positions = []
+        for position in range(len(self.category_ids)):
+            while open_positions and self.depths[open_positions[-1]] >= self.depths[position]:
+                self.subtree_ends[open_positions.pop()] = position
+            open_positions.append(position)
+        for position in open_positions:
+            self.subtree_ends[position] = len(self.category_ids)
+
+    def __repr__(self) -> str:
+        """String representation of the `CategoryTree` object."""
+
+        # define the string representation
+        str_representation = '<CategoryTree (root={root}, categories={categories}, depth={depth})>'.format(
+            root=self.category_ids[0] if self.category_ids else None,
+            categories=len(self),
+            depth=max(self.depths) if self.depths else 0
+        )
+
+        return str_representation
+
+    def __len__(self) -> int:
+        """Returns the number of categories."""
+
+        return len(self.category_ids)
+
+    def __contains__(self, category_id: int) -> bool:
+        """Checks whether a category is part of the tree."""
+
+        return int(category_id) in self.positions
+
+    @classmethod
+    def crawl(
+        cls,
+        categories_service: Categories,
+        root_id: int = ROOT_CATEGORY_ID,
+        max_workers: int = 8
+    ) -> 'CategoryTree':
+        """Crawls the hierarchy breadth-first, fetching each level concurrently.
+
+        ### Parameters
+        ----
+        categories_service : Categories
+            The `Categories` service used for the crawl.
+
+        root_id : int (optional, Default=0)
+            The category to start from, the top of the hierarchy by default.
+
+        max_workers : int (optional, Default=8)
+            The number of `get_category_children` calls made concurrently.
+
+        ### Returns
+        ----
+        CategoryTree:
+            The snapshot of the hierarchy under the root.
+        """
+
+        root = categories_service.get_category(category_id=str(root_id))['categories'][0]
+
+        category_ids = [int(root['id'])]
+        parent_ids = [int(root.get('parent_id', -1))]
+        names = [root['name']]
+
+        def fetch_children(category_id: int) -> List[Dict]:
+            content = categories_service.get_category_children(category_id=str(category_id))
+            return content.get('categories', [])
+
+        level = [int(root['id'])]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while level:
+                next_level = []
+                for parent_id, children in zip(level, executor.map(fetch_children, level)):
+                    for child in children:
+                        category_ids.append(int(child['id']))
+                        parent_ids.append(parent_id)
+                        names.append(child['name'])
+                        next_level.append(int(child['id']))
+                level = next_level
+
+        return cls(category_ids=category_ids, parent_ids=parent_ids, names=names)
+
+    def save(self, file_path: Union[str, pathlib.Path]) -> None:
+        """Saves the snapshot to a JSON file.
+
+        ### Parameters
+        ----
+        file_path : Union[str, pathlib.Path]
+            The path of the file.
+        """
+
+        parent_ids = [
+            self.category_ids[parent] if parent >= 0 else -1
+            for parent in self.parents
+        ]
+
+        with open(file=file_path, mode='w', encoding='utf-8') as tree_file:
+            json.dump(
+                obj={
+                    'category_ids': self.category_ids.tolist(),
+                    'parent_ids': parent_ids,
+                    'names': self.names
+                },
+                fp=tree_file
+            )
+
+    @classmethod
+    def load(cls, file_path: Union[str, pathlib.Path]) -> 'CategoryTree':
+        """Loads a snapshot saved with `save`.
+
+        ### Parameters
+        ----
+        file_path : Union[str, pathlib.Path]
+            The path of the file.
+
+        ### Returns
+        ----
+        CategoryTree:
+            The snapshot.
+        """
+
+        with open(file=file_path, mode='r', encoding='utf-8') as tree_file:
+            content = json.load(fp=tree_file)
+
+        return cls(**content)
+
+    def name(self, category_id: int) -> str:
+        """Returns the name of a category."""
+
+        return self.names[self.positions[int(category_id)]]
+
+    def parent(self, category_id: int) -> int:
+        """Returns the parent of a category, None for the root."""
+
+        parent = self.parents[self.positions[int(category_id)]]
+
+        return self.category_ids[parent] if parent >= 0 else None
+
+    def children(self, category_id: int) -> List[int]:
+        """Returns the direct children of a category."""
+
+        position = self.positions[int(category_id)]
+        depth = self.depths[position]
+
+        return [
+            self.category_ids[child]
+            for child in range(position + 1, self.subtree_ends[position])
+            if self.depths[child] == depth + 1
+        ]
+
+    def ancestors(self, category_id: int) -> List[int]:
+        """Returns the ancestors of a category, closest first."""
+
+        return self.path_to_root(category_id=category_id)[1:]
+
+    def path_to_root(self, category_id: int) -> List[int]:
+        """Returns the category followed by its ancestors up to the root."""
+
+        path = []
+        position = self.positions[int(category_id)]
+
+        while position >= 0:
+            path.append(self.category_ids[position])
+            position = self.parents[position]
+
+        return path
+
+    def descendants(self, category_id: int) -> List[int]:
+        """Returns every category below a category, in pre-order."""
+
+        start, end = self.subtree_range(category_id=category_id)
+
+        return self.category_ids[start + 1:end].tolist()
+
+    def subtree(self, category_id: int) -> List[int]:
+        """Returns a category and every category below it, in pre-order."""
+
+        start, end = self.subtree_range(category_id=category_id)
+
+        return self.category_ids[start:end].tolist()
+
+    def subtree_range(self, category_id: int) -> Tuple[int, int]:
+        """Returns the pre-order positions `[start, end)` of a subtree."""
+
+        position = self.positions[int(category_id)]
+
+        return position, self.subtree_ends[position]
+
+    def is_descendant(self, category_id: int, ancestor_id: int) -> bool:
+        """Checks in O(1) whether a category sits below another one."""
+
+        position = self.positions[int(category_id)]
+        start, end = self.subtree_range(category_id=ancestor_id)
+
+        return start < position < end
@@ -4,6 +4,8 @@ from fred.releases import Releases
 from fred.series import Series
 from fred.sources import Sources
 from fred.tags import Tags
+from fred.paginator import Paginator
+from fred.mirror import FredMirror
 
 
 class FederalReserveClient():
@@ -110,3 +112,51 @@ class FederalReserveClient():
         object = Tags(session=self.fred_session)
 
         return object
+
+    def paginator(self, max_workers: int = 8) -> Paginator:
+        """Used to walk every page of the listing services.
+
+        ### Parameters
+        ---
+        max_workers : int (optional, Default=8)
+            The number of pages fetched concurrently.
+
+        ### Returns
+        ---
+        Paginator:
+            The `Paginator` Object.
+        """
+
+        # Grab the `Paginator` object.
+        object = Paginator(session=self.fred_session, max_workers=max_workers)
+
+        return object
+
+    def mirror(self, database_path: str = 'fred_mirror.db', max_workers: int = 8) -> FredMirror:
+        """Used to answer the metadata services from a local SQLite mirror.
+
+        ### Parameters
+        ---
+        database_path : str (optional, Default='fred_mirror.db')
+            The path of the SQLite database.
+
+        max_workers : int (optional, Default=8)
+            The number of listings crawled concurrently.
+
+        ### Returns
+        ---
+        FredMirror:
+            The `FredMirror` Object, attached to the session. Call `build`
+            once, then `refresh` periodically.
+        """
+
+        # Grab the `FredMirror` object.
+        object = FredMirror(
+            database_path=database_path,
+            paginator=self.paginator(max_workers=max_workers),
+            max_workers=max_workers
+        )
+
+        self.fred_session.mirror = object
+
+        return object
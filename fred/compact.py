@@ -0,0 +1,238 @@
+import math
+import sys
+
+from array import array
+from typing import Dict
+from typing import Iterator
+from typing import List
+from datetime import date
+from fred.values import to_date
+from fred.values import to_float
+
+
+class CompactObservations():
+
+    """
+    ## Overview:
+    ----
+    A compact in-memory representation of `Series.get_series_observations`
+    results requested with `output_type=1` (observations by real-time period).
+    Observation dates are stored as int32 day ordinals, the real-time periods
+    are dictionary encoded since they repeat across rows, and the values are
+    held in a float64 array. Rows are materialized on demand.
+    """
+
+    __slots__ = (
+        'series_id',
+        'dates',
+        'interval_codes',
+        'interval_starts',
+        'interval_ends',
+        'values',
+        '_interval_lookup'
+    )
+
+    def __init__(self, series_id: str = None) -> None:
+        """Initializes the `CompactObservations` object.
+
+        ### Parameters
+        ----
+        series_id : str (optional, Default=None)
+            The series ID the observations belong to.
+
+        ### Usage
+        ----
+            >>> content = series_service.get_series_observations(series_id='GNPCA')
+            >>> observations = CompactObservations.from_response(content=content)
+            >>> observations[0]
+        """
+
+        self.series_id = series_id
+
+        self.dates = array('i')
+        self.interval_codes = array('i')
+        self.interval_starts = array('i')
+        self.interval_ends = array('i')
+        self.values = array('d')
+
+        self._interval_lookup = {}
+
+    def __repr__(self) -> str:
+        """String representation of the `CompactObservations` object."""
+
+        # define the string representation
+        str_representation = '<CompactObservations (series_id={series_id}, rows={rows}, intervals={intervals})>'.format(
+            series_id=self.series_id,
+            rows=len(self),
+            intervals=len(self.interval_starts)
+        )
+
+        return str_representation
+
+    def __len__(self) -> int:
+        """Returns the number of rows."""
+
+        return len(self.dates)
+
+    def __getitem__(self, index: int) -> Dict:
+        """Returns a single row, in the shape FRED returns it."""
+
+        code = self.interval_codes[index]
+        value = self.values[index]
+
+        return {
+            'realtime_start': self._to_string(self.interval_starts[code]),
+            'realtime_end': self._to_string(self.interval_ends[code]),
+            'date': self._to_string(self.dates[index]),
+            'value': '.' if math.isnan(value) else repr(value)
+        }
+
+    def __iter__(self) -> Iterator[Dict]:
+        """Iterates over the rows."""
+
+        for index in range(len(self)):
+            yield self[index]
+
+    @classmethod
+    def from_response(cls, content: Dict, series_id: str = None) -> 'CompactObservations':
+        """Builds the compact representation from an observations response.
+
+        ### Parameters
+        ----
+        content : Dict
+            The response returned by `Series.get_series_observations`.
+
+        series_id : str (optional, Default=None)
+            The series ID the observations belong to.
+
+        ### Returns
+        ----
+        CompactObservations:
+            The compact observations.
+        """
+
+        observations = cls(series_id=series_id)
+        observations.extend(rows=content.get('observations', []))
+
+        return observations
+
+    def extend(self, rows: List[Dict]) -> None:
+        """Appends observation rows, as returned by FRED.
+
+        ### Parameters
+        ----
+        rows : List[Dict]
+            The observation rows.
+        """
+
+        # Dates repeat a lot, so parse each distinct string only once.
+        parsed = {}
+
+        def to_ordinal(value: str) -> int:
+            ordinal = parsed.get(value)
+            if ordinal is None:
+                ordinal = to_date(value).toordinal()
+                parsed[value] = ordinal
+            return ordinal
+
+        for row in rows:
+            interval = (
+                to_ordinal(row['realtime_start']),
+                to_ordinal(row['realtime_end'])
+            )
+
+            code = self._interval_lookup.get(interval)
+            if code is None:
+                code = len(self.interval_starts)
+                self._interval_lookup[interval] = code
+                self.interval_starts.append(interval[0])
+                self.interval_ends.append(interval[1])
+
+            self.dates.append(to_ordinal(row['date']))
+            self.interval_codes.append(code)
+            self.values.append(to_float(row['value']))
+
+    def column(self, name: str) -> list:
+        """Returns a single column as a list.
+
+        ### Parameters
+        ----
+        name : str
+            One of the following values: ['date', 'realtime_start',
+            'realtime_end', 'value'].
+
+        ### Returns
+        ----
+        list:
+            The column, dates as `datetime.date` and values as floats.
+        """
+
+        if name == 'date':
+            return [date.fromordinal(value) for value in self.dates]
+        elif name == 'realtime_start':
+            return [date.fromordinal(self.interval_starts[code]) for code in self.interval_codes]
+        elif name == 'realtime_end':
+            return [date.fromordinal(self.interval_ends[code]) for code in self.interval_codes]
+        elif name == 'value':
+            return self.values.tolist()
+
+        raise KeyError(name)
+
+    def as_of(self, realtime_date: str) -> List[Dict]:
+        """Returns the rows whose real-time period contains a date.
+
+        ### Parameters
+        ----
+        realtime_date : str
+            A YYYY-MM-DD formatted string.
+
+        ### Returns
+        ----
+        List[Dict]:
+            The rows, as they were known on that date.
+        """
+
+        ordinal = to_date(realtime_date).toordinal()
+
+        valid_codes = {
+            code for code in range(len(self.interval_starts))
+            if self.interval_starts[code] <= ordinal <= self.interval_ends[code]
+        }
+
+        return [
+            self[index] for index in range(len(self))
+            if self.interval_codes[index] in valid_codes
+        ]
+
+    def to_response(self) -> Dict:
+        """Converts the observations back into the FRED response shape.
+
+        ### Returns
+        ----
+        Dict:
+            A collection of `Series` observations.
+        """
+
+        return {
+            'count': len(self),
+            'observations': list(self)
+        }
+
+    def nbytes(self) -> int:
+        """Returns the approximate memory used by the observations, in bytes."""
+
+        arrays = [
+            self.dates,
+            self.interval_codes,
+            self.interval_starts,
+            self.interval_ends,
+            self.values
+        ]
+
+        return sum(sys.getsizeof(item) for item in arrays) + sys.getsizeof(self._interval_lookup)
+
+    @staticmethod
+    def _to_string(ordinal: int) -> str:
+        """Converts a day ordinal back into a YYYY-MM-DD string."""
+
+        return date.fromordinal(ordinal).isoformat()
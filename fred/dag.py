@@ -0,0 +1,430 @@
+import time
+import queue
+import logging
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import List
+from fred.limiter import RateLimiter
+from fred.scheduler import inherit_priority
+
+
+def default_key(item: Any) -> Hashable:
+    """Identifies an item by its `id` when it has one, otherwise by itself."""
+
+    if isinstance(item, dict) and 'id' in item:
+        return item['id']
+
+    return item
+
+
+class NodeStats():
+
+    """
+    ## Overview:
+    ----
+    The timing of one node of a `FredDAG` run: number of tasks, errors,
+    time spent in the tasks and when the node first started and last ended.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the `NodeStats` object."""
+
+        self.tasks = 0
+        self.items = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.max_seconds = 0.0
+        self.first_start: float = None
+        self.last_end: float = None
+
+    def __repr__(self) -> str:
+        """String representation of the `NodeStats` object."""
+
+        # define the string representation
+        str_representation = (
+            '<NodeStats (tasks={tasks}, items={items}, errors={errors}, busy_seconds={busy_seconds:.3f})>'
+        ).format(
+            tasks=self.tasks,
+            items=self.items,
+            errors=self.errors,
+            busy_seconds=self.busy_seconds
+        )
+
+        return str_representation
+
+    def record(self, started: float, ended: float, failed: bool) -> None:
+        """Adds one task."""
+
+        seconds = ended - started
+
+        self.tasks += 1
+        self.errors += int(failed)
+        self.busy_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.first_start = started if self.first_start is None else min(self.first_start, started)
+        self.last_end = ended if self.last_end is None else max(self.last_end, ended)
+
+    def as_dict(self, origin: float) -> Dict:
+        """Returns the timing as a dictionary, with times relative to the start of the run."""
+
+        return {
+            'tasks': self.tasks,
+            'items': self.items,
+            'errors': self.errors,
+            'busy_seconds': round(self.busy_seconds, 6),
+            'mean_seconds': round(self.busy_seconds / self.tasks, 6) if self.tasks else 0.0,
+            'max_seconds': round(self.max_seconds, 6),
+            'started_at': round(self.first_start - origin, 6) if self.first_start is not None else None,
+            'ended_at': round(self.last_end - origin, 6) if self.last_end is not None else None
+        }
+
+
+class DAGResult():
+
+    """
+    ## Overview:
+    ----
+    The outcome of a `FredDAG` run: the outputs of every node keyed by item,
+    the errors, and the timing of each node.
+    """
+
+    def __init__(
+        self,
+        outputs: Dict[str, Dict[Hashable, Any]],
+        errors: Dict[str, Dict[Hashable, str]],
+        stats: Dict[str, NodeStats],
+        started: float,
+        ended: float
+    ) -> None:
+        """Initializes the `DAGResult` object."""
+
+        self.outputs = outputs
+        self.errors = errors
+        self.stats = stats
+        self.started = started
+        self.ended = ended
+
+    def __repr__(self) -> str:
+        """String representation of the `DAGResult` object."""
+
+        # define the string representation
+        str_representation = '<DAGResult (nodes={nodes}, errors={errors}, seconds={seconds:.3f})>'.format(
+            nodes=len(self.outputs),
+            errors=sum(len(errors) for errors in self.errors.values()),
+            seconds=self.ended - self.started
+        )
+
+        return str_representation
+
+    def timings(self) -> Dict[str, Dict]:
+        """Returns the timing of every node, plus the wall time of the run."""
+
+        timings = {
+            name: stats.as_dict(origin=self.started) for name, stats in self.stats.items()
+        }
+        timings['_run'] = {'wall_seconds': round(self.ended - self.started, 6)}
+
+        return timings
+
+
+class FredDAG():
+
+    """
+    ## Overview:
+    ----
+    Runs multi-step FRED workflows declared as a graph of nodes. A node
+    either produces items (a source, such as the series of a release) or
+    maps each item of the nodes it depends on (metadata, observations,
+    vintage dates...). Items are tracked by key and a downstream task
+    starts as soon as that key is ready in every node it depends on, so
+    the stages overlap instead of waiting for each other. Every task shares
+    one pool of workers and, optionally, one rate limiter.
+    """
+
+    def __init__(self, max_workers: int = 8, rate_limiter: RateLimiter = None) -> None:
+        """Initializes the `FredDAG` object.
+
+        ### Parameters
+        ----
+        max_workers : int (optional, Default=8)
+            The number of tasks running at once across all nodes, at least 2
+            so streaming sources never starve their consumers.
+
+        rate_limiter : RateLimiter (optional, Default=None)
+            Takes a token before each task. Requests made through the
+            session are already rate limited, so this is only needed to
+            bound work that does not go through it.
+
+        ### Usage
+        ----
+            >>> fred_client = FederalReserveClient(api_key='xxxxxx')
+            >>> paginator = fred_client.paginator()
+            >>> series_services = fred_client.series()
+            >>> fred_dag = FredDAG(max_workers=8)
+            >>> fred_dag.add_node(
+                    name='series',
+                    function=lambda: paginator.release_series(release_id='53'),
+                    fan_out=True
+                )
+            >>> fred_dag.add_node(
+                    name='observations',
+                    function=lambda series: series_services.get_series_observations(series_id=series['id']),
+                    depends_on=['series']
+                )
+            >>> fred_dag.add_node(
+                    name='vintage_dates',
+                    function=lambda series: series_services.get_series_vintage_dates(series_id=series['id']),
+                    depends_on=['series']
+                )
+            >>> result = fred_dag.run()
+            >>> result.timings()
+        """
+
+        self.max_workers = max(2, max_workers)
+        self.rate_limiter = rate_limiter
+
+        self.nodes: Dict[str, Dict] = {}
+        self.children: Dict[str, List[str]] = {}
+
+    def __repr__(self) -> str:
+        """String representation of the `FredDAG` object."""
+
+        # define the string representation
+        str_representation = '<FredDAG (nodes={nodes}, max_workers={max_workers})>'.format(
+            nodes=list(self.nodes),
+            max_workers=self.max_workers
+        )
+
+        return str_representation
+
+    def add_node(
+        self,
+        name: str,
+        function: Callable,
+        depends_on: List[str] = None,
+        fan_out: bool = False,
+        key: Callable[[Any], Hashable] = default_key
+    ) -> 'FredDAG':
+        """Adds a node, after the nodes it depends on.
+
+        ### Parameters
+        ----
+        name : str
+            The name of the node, used as a keyword argument of the nodes
+            that depend on several others.
+
+        function : Callable
+            A source takes no argument. A node with one dependency is called
+            with each of its items, a node with several dependencies with
+            one keyword argument per dependency.
+
+        depends_on : List[str] (optional, Default=None)
+            The nodes whose items this node consumes, None for a source.
+
+        fan_out : bool (optional, Default=False)
+            Whether the function returns an iterable of items instead of one
+            item. Items of a fanned out source are passed downstream as soon
+            as they are yielded, so a paginated listing streams.
+
+        key : Callable[[Any], Hashable] (optional, Default=default_key)
+            Identifies the items a fanned out node produces. Other nodes keep
+            the key of their input. A source that does not fan out produces
+            one item that is broadcast to every key.
+
+        ### Returns
+        ----
+        FredDAG:
+            The DAG, to chain calls.
+        """
+
+        if name in self.nodes:
+            raise ValueError('The node {name} already exists.'.format(name=name))
+
+        depends_on = list(depends_on or [])
+
+        for parent in depends_on:
+            if parent not in self.nodes:
+                raise ValueError('{name} depends on {parent}, which must be added first.'.format(
+                    name=name,
+                    parent=parent
+                ))
+            self.children[parent].append(name)
+
+        self.nodes[name] = {
+            'function': function,
+            'depends_on': depends_on,
+            'fan_out': fan_out,
+            'key': key
+        }
+        self.children[name] = []
+
+        return self
+
+    def run(self) -> DAGResult:
+        """Runs every node and returns their outputs and timings.
+
+        ### Returns
+        ----
+        DAGResult:
+            The outputs keyed by node and item, the errors and the timings.
+        """
+
+        return _DAGRun(fred_dag=self).run()
+
+
+class _DAGRun():
+
+    """The state of a single `FredDAG.run`, driven from the calling thread."""
+
+    def __init__(self, fred_dag: FredDAG) -> None:
+        """Initializes the `_DAGRun` object."""
+
+        self.fred_dag = fred_dag
+        self.nodes = fred_dag.nodes
+
+        self.outputs: Dict[str, Dict[Hashable, Any]] = {name: {} for name in self.nodes}
+        self.errors: Dict[str, Dict[Hashable, str]] = {name: {} for name in self.nodes}
+        self.stats: Dict[str, NodeStats] = {name: NodeStats() for name in self.nodes}
+
+        # Keys already submitted per node, and tasks still running per node.
+        self.fired: Dict[str, set] = {name: set() for name in self.nodes}
+        self.pending: Dict[str, int] = {name: 0 for name in self.nodes}
+        self.done: set = set()
+
+        self.events = queue.Queue()
+        self._stats_lock = threading.Lock()
+
+    def run(self) -> DAGResult:
+        """Submits the sources, then reacts to items until every node is done."""
+
+        started = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.fred_dag.max_workers) as self.executor:
+            for name, node in self.nodes.items():
+                if not node['depends_on']:
+                    self._submit(name=name, key=None, arguments=())
+
+            while len(self.done) < len(self.nodes):
+                self._check_done()
+                if len(self.done) == len(self.nodes):
+                    break
+
+                event = self.events.get()
+
+                if event[0] == 'item':
+                    _, name, key, value = event
+                    self.outputs[name][key] = value
+                    self.stats[name].items += 1
+                    for child in self.fred_dag.children[name]:
+                        self._fire(name=child, trigger_key=key)
+                elif event[0] == 'error':
+                    _, name, key, error = event
+                    self.errors[name][key] = repr(error)
+                elif event[0] == 'finished':
+                    self.pending[event[1]] -= 1
+
+        return DAGResult(
+            outputs=self.outputs,
+            errors=self.errors,
+            stats=self.stats,
+            started=started,
+            ended=time.perf_counter()
+        )
+
+    def _check_done(self) -> None:
+        """Marks the nodes whose inputs are exhausted and whose tasks are finished."""
+
+        progressed = True
+
+        while progressed:
+            progressed = False
+            for name, node in self.nodes.items():
+                if name in self.done or self.pending[name]:
+                    continue
+                if not node['depends_on'] and not self.fired[name]:
+                    continue
+                if all(parent in self.done for parent in node['depends_on']):
+                    self.done.add(name)
+                    progressed = True
+
+    def _fire(self, name: str, trigger_key: Hashable) -> None:
+        """Submits the tasks of a node that an item made ready."""
+
+        depends_on = self.nodes[name]['depends_on']
+
+        if trigger_key is None:
+            # A broadcast item may complete every key seen so far.
+            candidates = set()
+            for parent in depends_on:
+                candidates.update(self.outputs[parent])
+            if any(key is not None for key in candidates):
+                candidates.discard(None)
+        else:
+            candidates = {trigger_key}
+
+        for key in candidates:
+            if key in self.fired[name]:
+                continue
+
+            arguments = []
+            for parent in depends_on:
+                outputs = self.outputs[parent]
+                if key in outputs:
+                    arguments.append(outputs[key])
+                elif None in outputs:
+                    arguments.append(outputs[None])
+                else:
+                    break
+            else:
+                self._submit(name=name, key=key, arguments=tuple(arguments))
+
+    def _submit(self, name: str, key: Hashable, arguments: tuple) -> None:
+        """Schedules one task of a node."""
+
+        self.fired[name].add(key)
+        self.pending[name] += 1
+        self.executor.submit(inherit_priority(self._task), name, key, arguments)
+
+    def _task(self, name: str, key: Hashable, arguments: tuple) -> None:
+        """Runs one task and reports its items, streaming those of a fanned out node."""
+
+        node = self.nodes[name]
+        failed = False
+
+        if self.fred_dag.rate_limiter is not None:
+            self.fred_dag.rate_limiter.acquire()
+
+        started = time.perf_counter()
+
+        try:
+            if not node['depends_on']:
+                value = node['function']()
+            elif len(node['depends_on']) == 1:
+                value = node['function'](*arguments)
+            else:
+                value = node['function'](**dict(zip(node['depends_on'], arguments)))
+
+            if node['fan_out']:
+                for item in value:
+                    self.events.put(('item', name, node['key'](item), item))
+            else:
+                self.events.put(('item', name, key, value))
+
+        except Exception as error:
+            failed = True
+            logging.error(msg='DAG node {name} failed for {key}: {error}'.format(
+                name=name,
+                key=key,
+                error=error
+            ))
+            self.events.put(('error', name, key, error))
+
+        finally:
+            with self._stats_lock:
+                self.stats[name].record(started=started, ended=time.perf_counter(), failed=failed)
+            self.events.put(('finished', name))
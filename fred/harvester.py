@@ -0,0 +1,340 @@
+import time
+import logging
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from concurrent.futures import FIRST_COMPLETED
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from fred.paginator import Paginator
+from fred.scheduler import BACKGROUND
+from fred.scheduler import inherit_priority
+from fred.scheduler import priority
+
+# The largest `limit` accepted by `get_series_observations`.
+OBSERVATIONS_PAGE_SIZE = 100000
+
+
+class HarvestProgress():
+
+    """
+    ## Overview:
+    ----
+    Tracks how far a `BulkHarvester` run has gone: series resolved, series
+    downloaded or failed, observations written, throughput and ETA.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the `HarvestProgress` object."""
+
+        self.total = 0
+        self.completed = 0
+        self.failed = 0
+        self.observations = 0
+        self.resolved = False
+        self.errors: Dict[str, str] = {}
+
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """String representation of the `HarvestProgress` object."""
+
+        # define the string representation
+        str_representation = '<HarvestProgress (completed={completed}/{total}, failed={failed}, eta={eta})>'.format(
+            completed=self.completed,
+            total=self.total,
+            failed=self.failed,
+            eta=self.eta
+        )
+
+        return str_representation
+
+    @property
+    def elapsed(self) -> float:
+        """The number of seconds since the harvest started."""
+
+        return time.monotonic() - self.started
+
+    @property
+    def series_per_second(self) -> float:
+        """The number of series finished per second."""
+
+        elapsed = self.elapsed
+
+        return (self.completed + self.failed) / elapsed if elapsed else 0.0
+
+    @property
+    def observations_per_second(self) -> float:
+        """The number of observations written per second."""
+
+        elapsed = self.elapsed
+
+        return self.observations / elapsed if elapsed else 0.0
+
+    @property
+    def eta(self) -> float:
+        """The estimated number of seconds left, None until it can be estimated."""
+
+        rate = self.series_per_second
+
+        if not self.resolved or not rate:
+            return None
+
+        return (self.total - self.completed - self.failed) / rate
+
+    def as_dict(self) -> Dict:
+        """Returns the progress as a dictionary, for logging or reporting."""
+
+        return {
+            'total': self.total,
+            'completed': self.completed,
+            'failed': self.failed,
+            'observations': self.observations,
+            'resolved': self.resolved,
+            'elapsed': round(self.elapsed, 3),
+            'series_per_second': round(self.series_per_second, 3),
+            'observations_per_second': round(self.observations_per_second, 3),
+            'eta': round(self.eta, 3) if self.eta is not None else None
+        }
+
+
+class BulkHarvester():
+
+    """
+    ## Overview:
+    ----
+    Downloads every series of a release, a category, a tag set or a source
+    together with its full observations. The universe is resolved with the
+    paginated listings and observation downloads start as soon as the first
+    series IDs are known, running concurrently under the session's rate
+    limiter. Results stream to a writer callback as they arrive.
+    """
+
+    def __init__(
+        self,
+        paginator: Paginator,
+        writer: Callable[[str, Dict], None],
+        max_workers: int = 8,
+        progress_callback: Callable[[HarvestProgress], None] = None,
+        progress_interval: float = 5.0,
+        request_priority: str = BACKGROUND,
+        **observation_kwargs
+    ) -> None:
+        """Initializes the `BulkHarvester` object.
+
+        ### Parameters
+        ----
+        paginator : Paginator
+            The `Paginator` used to resolve the universe and reach the services.
+
+        writer : Callable[[str, Dict], None]
+            Called with each series ID and its observations response, for
+            example the `write` method of a local store.
+
+        max_workers : int (optional, Default=8)
+            The number of observation downloads running concurrently.
+
+        progress_callback : Callable[[HarvestProgress], None] (optional, Default=None)
+            Called with the progress at most every `progress_interval` seconds
+            and once at the end.
+
+        progress_interval : float (optional, Default=5.0)
+            The number of seconds between two progress reports.
+
+        request_priority : str (optional, Default='background')
+            The priority of the harvest's requests, so interactive calls
+            sharing the session are served first.
+
+        **observation_kwargs : dict
+            Extra arguments passed to `Series.get_series_observations`.
+
+        ### Usage
+        ----
+            >>> fred_client = FederalReserveClient(api_key='xxxxxx')
+            >>> harvester = BulkHarvester(
+                    paginator=fred_client.paginator(),
+                    writer=lambda series_id, content: print(series_id, content['count'])
+                )
+            >>> harvester.harvest_release(release_id='53')
+        """
+
+        self.paginator = paginator
+        self.writer = writer
+        self.max_workers = max_workers
+        self.progress_callback = progress_callback
+        self.progress_interval = progress_interval
+        self.request_priority = request_priority
+        self.observation_kwargs = observation_kwargs
+
+        self._writer_lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """String representation of the `BulkHarvester` object."""
+
+        # define the string representation
+        str_representation = '<BulkHarvester (max_workers={max_workers})>'.format(
+            max_workers=self.max_workers
+        )
+
+        return str_representation
+
+    def harvest_release(self, release_id: str, **kwargs) -> HarvestProgress:
+        """Harvests every series of a release."""
+
+        return self.harvest(series_ids=self.resolve_release(release_id=release_id, **kwargs))
+
+    def harvest_category(self, category_id: str, **kwargs) -> HarvestProgress:
+        """Harvests every series of a category."""
+
+        return self.harvest(series_ids=self.resolve_category(category_id=category_id, **kwargs))
+
+    def harvest_tags(self, tag_names: List[str], exclude_tag_names: List[str] = None, **kwargs) -> HarvestProgress:
+        """Harvests every series matching a tag set."""
+
+        return self.harvest(
+            series_ids=self.resolve_tags(
+                tag_names=tag_names,
+                exclude_tag_names=exclude_tag_names,
+                **kwargs
+            )
+        )
+
+    def harvest_source(self, source_id: int, **kwargs) -> HarvestProgress:
+        """Harvests every series of every release of a source."""
+
+        return self.harvest(series_ids=self.resolve_source(source_id=source_id, **kwargs))
+
+    def resolve_release(self, release_id: str, **kwargs) -> Iterator[str]:
+        """Yields the IDs of the series of a release."""
+
+        for series in self.paginator.release_series(release_id=release_id, **kwargs):
+            yield series['id']
+
+    def resolve_category(self, category_id: str, **kwargs) -> Iterator[str]:
+        """Yields the IDs of the series of a category."""
+
+        for series in self.paginator.category_series(category_id=category_id, **kwargs):
+            yield series['id']
+
+    def resolve_tags(self, tag_names: List[str], exclude_tag_names: List[str] = None, **kwargs) -> Iterator[str]:
+        """Yields the IDs of the series matching a tag set."""
+
+        for series in self.paginator.tags_series(
+            tag_names=tag_names,
+            exclude_tag_names=exclude_tag_names,
+            **kwargs
+        ):
+            yield series['id']
+
+    def resolve_source(self, source_id: int, **kwargs) -> Iterator[str]:
+        """Yields the IDs of the series of every release of a source, once each."""
+
+        seen = set()
+
+        for release in self.paginator.source_releases(source_id=source_id, **kwargs):
+            for series_id in self.resolve_release(release_id=str(release['id'])):
+                if series_id not in seen:
+                    seen.add(series_id)
+                    yield series_id
+
+    def harvest(self, series_ids: Iterable[str]) -> HarvestProgress:
+        """Downloads the observations of series IDs as they are resolved.
+
+        ### Parameters
+        ----
+        series_ids : Iterable[str]
+            The series IDs, usually one of the `resolve_*` generators.
+
+        ### Returns
+        ----
+        HarvestProgress:
+            The final progress, with the errors of the failed series.
+        """
+
+        progress = HarvestProgress()
+        last_report = time.monotonic()
+
+        with priority(self.request_priority), ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            in_flight = set()
+
+            def report(force: bool = False) -> None:
+                nonlocal last_report
+                if self.progress_callback and (force or time.monotonic() - last_report >= self.progress_interval):
+                    last_report = time.monotonic()
+                    self.progress_callback(progress)
+
+            def drain(return_when: str) -> None:
+                done, _ = wait(in_flight, return_when=return_when)
+                for future in done:
+                    in_flight.discard(future)
+                report()
+
+            for series_id in series_ids:
+                progress.total += 1
+                in_flight.add(executor.submit(inherit_priority(self._download), series_id, progress))
+
+                # Keep the resolution only slightly ahead of the downloads.
+                if len(in_flight) >= self.max_workers * 2:
+                    drain(return_when=FIRST_COMPLETED)
+
+            progress.resolved = True
+
+            while in_flight:
+                drain(return_when=FIRST_COMPLETED)
+
+        report(force=True)
+
+        return progress
+
+    def _download(self, series_id: str, progress: HarvestProgress) -> None:
+        """Downloads every observation page of a series and hands it to the writer."""
+
+        try:
+            content = self._fetch_observations(series_id=series_id)
+
+            with self._writer_lock:
+                self.writer(series_id, content)
+
+            with progress._lock:
+                progress.completed += 1
+                progress.observations += len(content.get('observations', []))
+
+        except Exception as error:
+            logging.error(msg='Harvest of {series_id} failed: {error}'.format(
+                series_id=series_id,
+                error=error
+            ))
+
+            with progress._lock:
+                progress.failed += 1
+                progress.errors[series_id] = repr(error)
+
+    def _fetch_observations(self, series_id: str) -> Dict:
+        """Fetches every observation of a series."""
+
+        series_service = self.paginator.series_service
+        kwargs = dict(self.observation_kwargs)
+        kwargs.setdefault('limit', OBSERVATIONS_PAGE_SIZE)
+
+        content = series_service.get_series_observations(series_id=series_id, offset=0, **kwargs)
+        observations = list(content.get('observations', []))
+
+        while observations and len(observations) < int(content.get('count', 0)):
+            page = series_service.get_series_observations(
+                series_id=series_id,
+                offset=len(observations),
+                **kwargs
+            )
+            if not page.get('observations'):
+                break
+            observations.extend(page['observations'])
+
+        content = dict(content)
+        content['observations'] = observations
+
+        return content
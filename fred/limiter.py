@@ -0,0 +1,97 @@
+import time
+import threading
+
+
+class RateLimiter():
+
+    """
+    ## Overview:
+    ----
+    A thread-safe token bucket shared by every request of a `FredSession`.
+    FRED allows 120 requests per minute per API key, so by default tokens
+    are refilled at two per second, with a small burst allowance.
+    """
+
+    def __init__(self, rate: float = 2.0, capacity: int = 10) -> None:
+        """Initializes the `RateLimiter` object.
+
+        ### Parameters
+        ----
+        rate : float (optional, Default=2.0)
+            The number of tokens added per second.
+
+        capacity : int (optional, Default=10)
+            The maximum number of tokens the bucket holds, i.e. the
+            largest burst of requests allowed.
+
+        ### Usage
+        ----
+            >>> fred_client = FederalReserveClient(api_key='xxxxxx')
+            >>> fred_client.fred_session.rate_limiter = RateLimiter(rate=1.0)
+        """
+
+        self.rate = rate
+        self.capacity = capacity
+
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """String representation of the `RateLimiter` object."""
+
+        # define the string representation
+        str_representation = '<RateLimiter (rate={rate}, capacity={capacity})>'.format(
+            rate=self.rate,
+            capacity=self.capacity
+        )
+
+        return str_representation
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """Takes tokens if available, without blocking.
+
+        ### Parameters
+        ----
+        tokens : float (optional, Default=1.0)
+            The number of tokens to take.
+
+        ### Returns
+        ----
+        float:
+            0.0 when the tokens were taken, otherwise the number of
+            seconds until they will be available.
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Takes tokens, blocking until they are available.
+
+        ### Parameters
+        ----
+        tokens : float (optional, Default=1.0)
+            The number of tokens to take.
+
+        ### Returns
+        ----
+        float:
+            The number of seconds spent waiting.
+        """
+
+        started = time.monotonic()
+
+        while True:
+            wait = self.try_acquire(tokens=tokens)
+            if wait == 0.0:
+                return time.monotonic() - started
+            time.sleep(wait)
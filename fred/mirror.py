@@ -0,0 +1,842 @@
+import json
+import pathlib
+import sqlite3
+import threading
+
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Union
+from datetime import datetime
+from datetime import timezone
+from fred.cache import UPDATES_HORIZON
+from fred.cache import fred_time
+from fred.category_tree import CategoryTree
+from fred.paginator import Paginator
+from fred.scheduler import inherit_priority
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS categories (id INTEGER PRIMARY KEY, name TEXT, parent_id INTEGER);
+CREATE INDEX IF NOT EXISTS categories_parent ON categories (parent_id, id);
+CREATE TABLE IF NOT EXISTS releases (id INTEGER PRIMARY KEY, name TEXT, data TEXT);
+CREATE TABLE IF NOT EXISTS sources (id INTEGER PRIMARY KEY, name TEXT, data TEXT);
+CREATE TABLE IF NOT EXISTS tags (
+    name TEXT PRIMARY KEY, group_id TEXT, popularity INTEGER,
+    series_count INTEGER, created TEXT, data TEXT
+);
+CREATE INDEX IF NOT EXISTS tags_group ON tags (group_id, name);
+CREATE TABLE IF NOT EXISTS series (
+    id TEXT PRIMARY KEY, title TEXT, units TEXT, frequency TEXT,
+    seasonal_adjustment TEXT, realtime_start TEXT, realtime_end TEXT,
+    last_updated TEXT, observation_start TEXT, observation_end TEXT,
+    popularity INTEGER, data TEXT
+);
+CREATE INDEX IF NOT EXISTS series_last_updated ON series (last_updated);
+CREATE INDEX IF NOT EXISTS series_popularity ON series (popularity);
+CREATE TABLE IF NOT EXISTS release_sources (
+    release_id INTEGER, source_id INTEGER, PRIMARY KEY (release_id, source_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS release_sources_source ON release_sources (source_id, release_id);
+CREATE TABLE IF NOT EXISTS series_releases (series_id TEXT PRIMARY KEY, release_id INTEGER);
+CREATE INDEX IF NOT EXISTS series_releases_release ON series_releases (release_id, series_id);
+CREATE TABLE IF NOT EXISTS series_categories (
+    series_id TEXT, category_id INTEGER, PRIMARY KEY (series_id, category_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS series_categories_category ON series_categories (category_id, series_id);
+CREATE TABLE IF NOT EXISTS series_tags (
+    series_id TEXT, tag_name TEXT, PRIMARY KEY (series_id, tag_name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS series_tags_tag ON series_tags (tag_name, series_id);
+"""
+
+# The columns of the `series` table, in insert order.
+SERIES_COLUMNS = [
+    'id', 'title', 'units', 'frequency', 'seasonal_adjustment', 'realtime_start',
+    'realtime_end', 'last_updated', 'observation_start', 'observation_end', 'popularity'
+]
+
+# The `order_by` values answered locally, mapped to columns.
+SERIES_ORDER_BY = {
+    'series_id': 's.id',
+    'title': 's.title',
+    'units': 's.units',
+    'frequency': 's.frequency',
+    'seasonal_adjustment': 's.seasonal_adjustment',
+    'realtime_start': 's.realtime_start',
+    'realtime_end': 's.realtime_end',
+    'last_updated': 's.last_updated',
+    'observation_start': 's.observation_start',
+    'observation_end': 's.observation_end',
+    'popularity': 's.popularity'
+}
+RELEASE_ORDER_BY = {'release_id': 'r.id', 'name': 'r.name'}
+SOURCE_ORDER_BY = {'source_id': 'o.id', 'name': 'o.name'}
+TAG_ORDER_BY = {
+    'series_count': 't.series_count',
+    'popularity': 't.popularity',
+    'created': 't.created',
+    'name': 't.name',
+    'group_id': 't.group_id'
+}
+
+# Filters the mirror does not evaluate, requests using them go to the API.
+UNSUPPORTED_FILTERS = ['filter_variable', 'filter_value', 'search_text', 'series_search_text']
+
+# The number of IDs bound per query, below the 999 variables older SQLite builds allow.
+VARIABLES_PER_QUERY = 500
+
+
+class FredMirror():
+
+    """
+    ## Overview:
+    ----
+    A local SQLite mirror of the FRED metadata: categories, releases,
+    sources, tags, series and the relationships between them, crawled
+    concurrently through the `Paginator`. Once attached to a `FredSession`
+    the existing service methods are answered with indexed local queries
+    whenever the mirror holds the data, and go to the API otherwise. The
+    mirror is kept current with `Series.get_series_updates` and the
+    real-time periods of the listings.
+    """
+
+    def __init__(
+        self,
+        database_path: Union[str, pathlib.Path],
+        paginator: Paginator,
+        max_workers: int = 8,
+        include_series_tags: bool = True
+    ) -> None:
+        """Initializes the `FredMirror` object.
+
+        ### Parameters
+        ----
+        database_path : Union[str, pathlib.Path]
+            The path of the SQLite database, created when missing.
+
+        paginator : Paginator
+            The `Paginator` used for the crawls.
+
+        max_workers : int (optional, Default=8)
+            The number of listings crawled concurrently.
+
+        include_series_tags : bool (optional, Default=True)
+            Whether to mirror the tags of every series, which is the
+            largest part of the crawl.
+
+        ### Usage
+        ----
+            >>> fred_client = FederalReserveClient(api_key='xxxxxx')
+            >>> fred_mirror = fred_client.mirror(database_path='fred.db')
+            >>> fred_mirror.build()
+            >>> fred_client.series().get_series(series_id='GNPCA')
+        """
+
+        self.database_path = database_path
+        self.paginator = paginator
+        self.max_workers = max_workers
+        self.include_series_tags = include_series_tags
+
+        self.connection = sqlite3.connect(str(database_path), check_same_thread=False)
+        self.connection.executescript(SCHEMA)
+
+        self._lock = threading.RLock()
+        self._crawling = False
+
+        self._handlers: Dict[str, Callable[[Dict], Dict]] = {
+            '/category': self._category,
+            '/category/children': self._category_children,
+            '/category/series': self._category_series,
+            '/releases': self._releases,
+            '/release': self._release,
+            '/release/series': self._release_series,
+            '/release/sources': self._release_sources,
+            '/sources': self._sources,
+            '/source': self._source,
+            '/source/releases': self._source_releases,
+            '/series': self._series,
+            '/series/categories': self._series_categories,
+            '/series/release': self._series_release,
+            '/series/tags': self._series_tags,
+            '/tags': self._tags,
+            '/tags/series': self._tags_series
+        }
+
+    def __repr__(self) -> str:
+        """String representation of the `FredMirror` object."""
+
+        # define the string representation
+        str_representation = '<FredMirror (database_path={database_path}, last_refresh={last_refresh})>'.format(
+            database_path=self.database_path,
+            last_refresh=self.get_meta(key='last_refresh')
+        )
+
+        return str_representation
+
+    @property
+    def is_built(self) -> bool:
+        """Whether a full crawl has completed."""
+
+        return self.get_meta(key='last_refresh') is not None
+
+    def get_meta(self, key: str) -> str:
+        """Returns a value of the `meta` table."""
+
+        with self._lock:
+            row = self.connection.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+
+        return row[0] if row else None
+
+    def close(self) -> None:
+        """Closes the database."""
+
+        with self._lock:
+            self.connection.close()
+
+    def build(self, now: datetime = None) -> Dict[str, int]:
+        """Crawls the whole FRED metadata into the database, replacing its content.
+
+        ### Parameters
+        ----
+        now : datetime (optional, Default=None)
+            The time recorded as the last refresh, a naive time being taken
+            as local time.
+
+        ### Returns
+        ----
+        Dict[str, int]:
+            The number of rows of each table.
+        """
+
+        now = self._to_utc(value=now or datetime.now(tz=timezone.utc))
+        paginator = self.paginator
+
+        with self._crawl():
+            category_tree = CategoryTree.crawl(
+                categories_service=paginator.categories_service,
+                max_workers=self.max_workers
+            )
+            releases = paginator.releases(collect=True)
+            sources = paginator.sources(collect=True)
+            tags = paginator.tags(collect=True)
+
+            # Each table or batch is written in its own short transaction, so the
+            # lock is never held across a request. `last_refresh` is removed first
+            # and set last, the mirror answers nothing until the crawl completes.
+            with self._lock, self.connection:
+                for table in ['categories', 'releases', 'sources', 'tags', 'series', 'release_sources',
+                              'series_releases', 'series_categories', 'series_tags', 'meta']:
+                    self.connection.execute('DELETE FROM {table}'.format(table=table))
+
+            rows = []
+            for category_id in category_tree.category_ids:
+                parent_id = category_tree.parent(category_id=category_id)
+                # The API makes the root its own parent.
+                rows.append((
+                    category_id,
+                    category_tree.name(category_id=category_id),
+                    category_id if parent_id is None else parent_id
+                ))
+
+            with self._lock, self.connection:
+                self.connection.executemany('INSERT INTO categories VALUES (?, ?, ?)', rows)
+                self._upsert_releases(releases=releases)
+                self._upsert_sources(sources=sources)
+                self._upsert_tags(tags=tags)
+
+            release_ids = [int(release['id']) for release in releases]
+
+            for release_id, items in self._map(
+                function=lambda release_id: paginator.release_series(release_id=str(release_id), collect=True),
+                items=release_ids
+            ):
+                with self._lock, self.connection:
+                    self._upsert_series(series=items)
+                    self.connection.executemany(
+                        'INSERT OR REPLACE INTO series_releases VALUES (?, ?)',
+                        [(series['id'], release_id) for series in items]
+                    )
+
+            for release_id, items in self._map(
+                function=lambda release_id: paginator.releases_service.get_release_sources(
+                    release_id=str(release_id)
+                ).get('sources', []),
+                items=release_ids
+            ):
+                with self._lock, self.connection:
+                    self.connection.executemany(
+                        'INSERT OR IGNORE INTO release_sources VALUES (?, ?)',
+                        [(release_id, int(source['id'])) for source in items]
+                    )
+
+            for category_id, items in self._map(
+                function=lambda category_id: paginator.category_series(category_id=str(category_id), collect=True),
+                items=category_tree.category_ids.tolist()
+            ):
+                with self._lock, self.connection:
+                    self._upsert_series(series=items)
+                    self.connection.executemany(
+                        'INSERT OR IGNORE INTO series_categories VALUES (?, ?)',
+                        [(series['id'], category_id) for series in items]
+                    )
+
+            if self.include_series_tags:
+                for tag_name, items in self._map(
+                    function=lambda tag_name: paginator.tags_series(tag_names=[tag_name], collect=True),
+                    items=[tag['name'] for tag in tags]
+                ):
+                    with self._lock, self.connection:
+                        self.connection.executemany(
+                            'INSERT OR IGNORE INTO series_tags VALUES (?, ?)',
+                            [(series['id'], tag_name) for series in items]
+                        )
+
+            with self._lock, self.connection:
+                self._set_meta(key='series_tags', value='1' if self.include_series_tags else None)
+                self._set_meta(key='last_refresh', value=now.isoformat())
+
+        return self.counts()
+
+    def refresh(self, now: datetime = None) -> Dict[str, int]:
+        """Applies the changes made since the last build or refresh.
+
+        ### Overview
+        ----
+        Series changed since the last refresh are read from
+        `Series.get_series_updates` and upserted; the release, category and
+        tags of the new ones are fetched. Releases, sources and tags are
+        re-read for the real-time period since the last refresh, which
+        costs a few pages. When the last refresh is older than the two weeks
+        the updates feed covers, the mirror is built again.
+
+        ### Parameters
+        ----
+        now : datetime (optional, Default=None)
+            The end of the refresh window, the current time when not provided.
+            A naive time is taken as local time.
+
+        ### Returns
+        ----
+        Dict[str, int]:
+            The number of series updated and added.
+        """
+
+        now = self._to_utc(value=now or datetime.now(tz=timezone.utc))
+        last_refresh = self.get_meta(key='last_refresh')
+
+        start = self._to_utc(value=datetime.fromisoformat(last_refresh)) if last_refresh else None
+
+        if start is None or now - start >= UPDATES_HORIZON:
+            self.build(now=now)
+            return {'updated': 0, 'added': 0, 'rebuilt': 1}
+
+        paginator = self.paginator
+        realtime_start = start.date().isoformat()
+        realtime_end = now.date().isoformat()
+
+        with self._crawl():
+            updated = paginator.series_updates(
+                collect=True,
+                filter_value='all',
+                start_time=fred_time(start),
+                end_time=fred_time(now)
+            )
+            releases = paginator.releases(collect=True, realtime_start=realtime_start, realtime_end=realtime_end)
+            sources = paginator.sources(collect=True, realtime_start=realtime_start, realtime_end=realtime_end)
+            tags = paginator.tags(collect=True)
+
+            updated_ids = [series['id'] for series in updated]
+            known = set()
+
+            with self._lock:
+                for index in range(0, len(updated_ids), VARIABLES_PER_QUERY):
+                    batch = updated_ids[index:index + VARIABLES_PER_QUERY]
+                    known.update(
+                        row[0] for row in self.connection.execute(
+                            'SELECT id FROM series WHERE id IN ({marks})'.format(marks=','.join('?' * len(batch))),
+                            batch
+                        )
+                    )
+
+            added = [series['id'] for series in updated if series['id'] not in known]
+
+            def fetch_links(series_id: str) -> tuple:
+                series_service = paginator.series_service
+                release = series_service.get_series_release(series_id=series_id).get('releases', [])
+                categories = series_service.get_series_categories(series_id=series_id).get('categories', [])
+                series_tags = []
+                if self.include_series_tags:
+                    series_tags = series_service.get_series_tags(series_id=series_id).get('tags', [])
+                return release, categories, series_tags
+
+            links = list(self._map(function=fetch_links, items=added))
+
+            # Upserts are idempotent, so a refresh failing midway is applied
+            # again by the next one: `last_refresh` only moves once all is written.
+            with self._lock, self.connection:
+                self._upsert_series(series=updated)
+                self._upsert_releases(releases=releases)
+                self._upsert_sources(sources=sources)
+                self._upsert_tags(tags=tags)
+
+            for series_id, (release, categories, series_tags) in links:
+                with self._lock, self.connection:
+                    self.connection.executemany(
+                        'INSERT OR REPLACE INTO series_releases VALUES (?, ?)',
+                        [(series_id, int(item['id'])) for item in release]
+                    )
+                    self.connection.executemany(
+                        'INSERT OR IGNORE INTO series_categories VALUES (?, ?)',
+                        [(series_id, int(item['id'])) for item in categories]
+                    )
+                    self.connection.executemany(
+                        'INSERT OR IGNORE INTO series_tags VALUES (?, ?)',
+                        [(series_id, item['name']) for item in series_tags]
+                    )
+
+            with self._lock, self.connection:
+                self._set_meta(key='last_refresh', value=now.isoformat())
+
+        return {'updated': len(updated) - len(added), 'added': len(added), 'rebuilt': 0}
+
+    def counts(self) -> Dict[str, int]:
+        """Returns the number of rows of each table."""
+
+        with self._lock:
+            return {
+                table: self.connection.execute('SELECT COUNT(*) FROM {table}'.format(table=table)).fetchone()[0]
+                for table in ['categories', 'releases', 'sources', 'tags', 'series', 'release_sources',
+                              'series_releases', 'series_categories', 'series_tags']
+            }
+
+    def answer(self, endpoint: str, params: Dict) -> Dict:
+        """Answers a request from the mirror, used by `FredSession.make_request`.
+
+        ### Parameters
+        ----
+        endpoint : str
+            The API endpoint, for example `/series`.
+
+        params : Dict
+            The request parameters.
+
+        ### Returns
+        ----
+        Dict:
+            The response in the shape of the API, None when the request has to
+            go to the API: the mirror is being crawled, the endpoint or a filter
+            is not mirrored, the real-time period is not the current one or the
+            item is unknown.
+        """
+
+        handler = self._handlers.get(endpoint)
+
+        if handler is None or self._crawling or not self.is_built:
+            return None
+
+        if not self._is_current(params=params):
+            return None
+
+        if any(params.get(name) for name in UNSUPPORTED_FILTERS):
+            return None
+
+        with self._lock:
+            return handler(params)
+
+    def _is_current(self, params: Dict) -> bool:
+        """Returns whether the real-time period of a request is the mirrored one."""
+
+        realtime_start, realtime_end = params.get('realtime_start'), params.get('realtime_end')
+
+        if realtime_start is None and realtime_end is None:
+            return True
+        elif realtime_start != realtime_end or not isinstance(realtime_start, str):
+            return False
+
+        return realtime_start >= self.get_meta(key='last_refresh')[0:10]
+
+    @staticmethod
+    def _to_utc(value: datetime) -> datetime:
+        """Converts a time to UTC, a naive time being taken as local time."""
+
+        return value.astimezone(timezone.utc)
+
+    @contextmanager
+    def _crawl(self):
+        """Sends every request to the API while the mirror is being written."""
+
+        self._crawling = True
+        try:
+            yield
+        finally:
+            self._crawling = False
+
+    def _map(self, function: Callable, items: List) -> Iterable[tuple]:
+        """Yields each item with the result of a function, computed concurrently."""
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            yield from zip(items, executor.map(inherit_priority(function), items))
+
+    def _set_meta(self, key: str, value: str) -> None:
+        """Sets a value of the `meta` table, None removes it."""
+
+        if value is None:
+            self.connection.execute('DELETE FROM meta WHERE key = ?', (key,))
+        else:
+            self.connection.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)', (key, value))
+
+    def _upsert_series(self, series: List[Dict]) -> None:
+        """Inserts or replaces series metadata."""
+
+        self.connection.executemany(
+            'INSERT OR REPLACE INTO series VALUES ({marks})'.format(marks=','.join('?' * (len(SERIES_COLUMNS) + 1))),
+            [
+                tuple(item.get(column) for column in SERIES_COLUMNS) + (json.dumps(item),)
+                for item in series
+            ]
+        )
+
+    def _upsert_releases(self, releases: List[Dict]) -> None:
+        """Inserts or replaces releases."""
+
+        self.connection.executemany(
+            'INSERT OR REPLACE INTO releases VALUES (?, ?, ?)',
+            [(int(release['id']), release.get('name'), json.dumps(release)) for release in releases]
+        )
+
+    def _upsert_sources(self, sources: List[Dict]) -> None:
+        """Inserts or replaces sources."""
+
+        self.connection.executemany(
+            'INSERT OR REPLACE INTO sources VALUES (?, ?, ?)',
+            [(int(source['id']), source.get('name'), json.dumps(source)) for source in sources]
+        )
+
+    def _upsert_tags(self, tags: List[Dict]) -> None:
+        """Inserts or replaces tags."""
+
+        self.connection.executemany(
+            'INSERT OR REPLACE INTO tags VALUES (?, ?, ?, ?, ?, ?)',
+            [
+                (tag['name'], tag.get('group_id'), tag.get('popularity'), tag.get('series_count'),
+                 tag.get('created'), json.dumps(tag))
+                for tag in tags
+            ]
+        )
+
+    def _listing(
+        self,
+        params: Dict,
+        items_key: str,
+        select: str,
+        source: str,
+        arguments: List,
+        order_columns: Dict[str, str],
+        default_order_by: str,
+        key_column: str
+    ) -> Dict:
+        """Runs a paged, ordered query and shapes it like an API collection."""
+
+        order_by = params.get('order_by') or default_order_by
+        column = order_columns.get(order_by)
+
+        if column is None:
+            return None
+
+        sort_order = 'desc' if params.get('sort_order') == 'desc' else 'asc'
+        offset = int(params.get('offset') or 0)
+        limit = int(params.get('limit') or 1000)
+
+        count = self.connection.execute(
+            'SELECT COUNT(*) {source}'.format(source=source),
+            arguments
+        ).fetchone()[0]
+        rows = self.connection.execute(
+            'SELECT {select} {source} ORDER BY {column} {sort_order}, {key_column} LIMIT ? OFFSET ?'.format(
+                select=select,
+                source=source,
+                column=column,
+                sort_order=sort_order.upper(),
+                key_column=key_column
+            ),
+            list(arguments) + [limit, offset]
+        ).fetchall()
+
+        return {
+            'realtime_start': params.get('realtime_start'),
+            'realtime_end': params.get('realtime_end'),
+            'order_by': order_by,
+            'sort_order': sort_order,
+            'count': count,
+            'offset': offset,
+            'limit': limit,
+            items_key: [json.loads(row[0]) for row in rows]
+        }
+
+    def _series_listing(self, params: Dict, source: str, arguments: List) -> Dict:
+        """Lists series, refusing the tag filters of the listing endpoints."""
+
+        if params.get('tag_names') or params.get('exclude_tag_names'):
+            return None
+
+        return self._listing(
+            params=params,
+            items_key='seriess',
+            select='s.data',
+            source=source,
+            arguments=arguments,
+            order_columns=SERIES_ORDER_BY,
+            default_order_by='series_id',
+            key_column='s.id'
+        )
+
+    def _category(self, params: Dict) -> Dict:
+        """Answers `Categories.get_category`."""
+
+        row = self.connection.execute(
+            'SELECT id, name, parent_id FROM categories WHERE id = ?',
+            (int(params['category_id']),)
+        ).fetchone()
+
+        return {'categories': [self._category_row(row=row)]} if row else None
+
+    def _category_children(self, params: Dict) -> Dict:
+        """Answers `Categories.get_category_children`, None for an unknown category."""
+
+        category_id = int(params['category_id'])
+        exists = self.connection.execute('SELECT 1 FROM categories WHERE id = ?', (category_id,)).fetchone()
+
+        if exists is None:
+            return None
+
+        rows = self.connection.execute(
+            'SELECT id, name, parent_id FROM categories WHERE parent_id = ? AND id != parent_id ORDER BY id',
+            (category_id,)
+        ).fetchall()
+
+        return {'categories': [self._category_row(row=row) for row in rows]}
+
+    def _category_series(self, params: Dict) -> Dict:
+        """Answers `Categories.get_category_series`."""
+
+        return self._series_listing(
+            params=params,
+            source='FROM series s JOIN series_categories c ON c.series_id = s.id WHERE c.category_id = ?',
+            arguments=[int(params['category_id'])]
+        )
+
+    def _releases(self, params: Dict) -> Dict:
+        """Answers `Releases.get_releases`."""
+
+        return self._listing(
+            params=params,
+            items_key='releases',
+            select='r.data',
+            source='FROM releases r',
+            arguments=[],
+            order_columns=RELEASE_ORDER_BY,
+            default_order_by='release_id',
+            key_column='r.id'
+        )
+
+    def _release(self, params: Dict) -> Dict:
+        """Answers `Releases.get_release_by_id`."""
+
+        row = self.connection.execute(
+            'SELECT data FROM releases WHERE id = ?',
+            (int(params['release_id']),)
+        ).fetchone()
+
+        return {'releases': [json.loads(row[0])]} if row else None
+
+    def _release_series(self, params: Dict) -> Dict:
+        """Answers `Releases.get_release_series`."""
+
+        return self._series_listing(
+            params=params,
+            source='FROM series s JOIN series_releases l ON l.series_id = s.id WHERE l.release_id = ?',
+            arguments=[int(params['release_id'])]
+        )
+
+    def _release_sources(self, params: Dict) -> Dict:
+        """Answers `Releases.get_release_sources`."""
+
+        rows = self.connection.execute(
+            'SELECT o.data FROM sources o JOIN release_sources l ON l.source_id = o.id '
+            'WHERE l.release_id = ? ORDER BY o.id',
+            (int(params['release_id']),)
+        ).fetchall()
+
+        return {'sources': [json.loads(row[0]) for row in rows]} if rows else None
+
+    def _sources(self, params: Dict) -> Dict:
+        """Answers `Sources.get_sources`."""
+
+        return self._listing(
+            params=params,
+            items_key='sources',
+            select='o.data',
+            source='FROM sources o',
+            arguments=[],
+            order_columns=SOURCE_ORDER_BY,
+            default_order_by='source_id',
+            key_column='o.id'
+        )
+
+    def _source(self, params: Dict) -> Dict:
+        """Answers `Sources.get_source`."""
+
+        row = self.connection.execute(
+            'SELECT data FROM sources WHERE id = ?',
+            (int(params['source_id']),)
+        ).fetchone()
+
+        return {'sources': [json.loads(row[0])]} if row else None
+
+    def _source_releases(self, params: Dict) -> Dict:
+        """Answers `Sources.get_source_releases`."""
+
+        return self._listing(
+            params=params,
+            items_key='releases',
+            select='r.data',
+            source='FROM releases r JOIN release_sources l ON l.release_id = r.id WHERE l.source_id = ?',
+            arguments=[int(params['source_id'])],
+            order_columns=RELEASE_ORDER_BY,
+            default_order_by='release_id',
+            key_column='r.id'
+        )
+
+    def _series(self, params: Dict) -> Dict:
+        """Answers `Series.get_series`."""
+
+        row = self.connection.execute(
+            'SELECT data FROM series WHERE id = ?',
+            (params['series_id'],)
+        ).fetchone()
+
+        return {'seriess': [json.loads(row[0])]} if row else None
+
+    def _series_categories(self, params: Dict) -> Dict:
+        """Answers `Series.get_series_categories`."""
+
+        rows = self.connection.execute(
+            'SELECT c.id, c.name, c.parent_id FROM categories c JOIN series_categories l '
+            'ON l.category_id = c.id WHERE l.series_id = ? ORDER BY c.id',
+            (params['series_id'],)
+        ).fetchall()
+
+        return {'categories': [self._category_row(row=row) for row in rows]} if rows else None
+
+    def _series_release(self, params: Dict) -> Dict:
+        """Answers `Series.get_series_release`."""
+
+        row = self.connection.execute(
+            'SELECT r.data FROM releases r JOIN series_releases l ON l.release_id = r.id WHERE l.series_id = ?',
+            (params['series_id'],)
+        ).fetchone()
+
+        return {'releases': [json.loads(row[0])]} if row else None
+
+    def _series_tags(self, params: Dict) -> Dict:
+        """Answers `Series.get_series_tags`."""
+
+        if not self.get_meta(key='series_tags'):
+            return None
+
+        exists = self.connection.execute(
+            'SELECT 1 FROM series_tags WHERE series_id = ? LIMIT 1',
+            (params['series_id'],)
+        ).fetchone()
+
+        if exists is None:
+            return None
+
+        return self._listing(
+            params=params,
+            items_key='tags',
+            select='t.data',
+            source='FROM tags t JOIN series_tags l ON l.tag_name = t.name WHERE l.series_id = ?',
+            arguments=[params['series_id']],
+            order_columns=TAG_ORDER_BY,
+            default_order_by='series_count',
+            key_column='t.name'
+        )
+
+    def _tags(self, params: Dict) -> Dict:
+        """Answers `Tags.get_tags`, optionally filtered by tag group."""
+
+        if params.get('tag_names'):
+            return None
+
+        source, arguments = 'FROM tags t', []
+
+        if params.get('tag_group_id'):
+            source, arguments = 'FROM tags t WHERE t.group_id = ?', [params['tag_group_id']]
+
+        return self._listing(
+            params=params,
+            items_key='tags',
+            select='t.data',
+            source=source,
+            arguments=arguments,
+            order_columns=TAG_ORDER_BY,
+            default_order_by='series_count',
+            key_column='t.name'
+        )
+
+    def _tags_series(self, params: Dict) -> Dict:
+        """Answers `Tags.get_tags_series` with indexed tag intersections."""
+
+        if not self.get_meta(key='series_tags'):
+            return None
+
+        tag_names = self._split(value=params.get('tag_names'))
+        exclude_tag_names = self._split(value=params.get('exclude_tag_names'))
+
+        if not tag_names:
+            return None
+
+        source = (
+            'FROM series s WHERE s.id IN (SELECT series_id FROM series_tags WHERE tag_name IN ({include}) '
+            'GROUP BY series_id HAVING COUNT(*) = ?)'
+        ).format(include=','.join('?' * len(tag_names)))
+        arguments = tag_names + [len(tag_names)]
+
+        if exclude_tag_names:
+            source += ' AND s.id NOT IN (SELECT series_id FROM series_tags WHERE tag_name IN ({exclude}))'.format(
+                exclude=','.join('?' * len(exclude_tag_names))
+            )
+            arguments += exclude_tag_names
+
+        return self._listing(
+            params=params,
+            items_key='seriess',
+            select='s.data',
+            source=source,
+            arguments=arguments,
+            order_columns=SERIES_ORDER_BY,
+            default_order_by='series_id',
+            key_column='s.id'
+        )
+
+    @staticmethod
+    def _category_row(row: tuple) -> Dict:
+        """Shapes a `categories` row like the API."""
+
+        return {'id': row[0], 'name': row[1], 'parent_id': row[2]}
+
+    @staticmethod
+    def _split(value: Union[str, List[str]]) -> List[str]:
+        """Accepts tag names joined by semicolons or as a list."""
+
+        if not value:
+            return []
+        elif isinstance(value, str):
+            return sorted({name for name in value.split(';') if name})
+
+        return sorted(set(value))
@@ -0,0 +1,268 @@
+import math
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Union
+from fred.session import FredSession
+from fred.scheduler import inherit_priority
+from fred.categories import Categories
+from fred.releases import Releases
+from fred.series import Series
+from fred.sources import Sources
+from fred.tags import Tags
+
+# The largest `limit` the listing endpoints accept.
+MAX_PAGE_SIZE = 1000
+
+
+class Paginator():
+
+    """
+    ## Overview:
+    ----
+    Walks every page of the FRED listing endpoints. The first page is used
+    to read the total `count`, the remaining pages are then fetched
+    concurrently and their items are yielded in order, so large listings
+    are bound by bandwidth rather than round trips.
+    """
+
+    def __init__(
+        self,
+        session: FredSession,
+        max_workers: int = 8,
+        page_size: int = MAX_PAGE_SIZE
+    ) -> None:
+        """Initializes the `Paginator` object.
+
+        ### Parameters
+        ----
+        session : `FredSession`
+            An initialized session of the `FredSession`.
+
+        max_workers : int (optional, Default=8)
+            The number of pages fetched concurrently.
+
+        page_size : int (optional, Default=1000)
+            The number of items requested per page, at most 1000.
+
+        ### Usage
+        ----
+            >>> fred_client = FederalReserveClient(api_key='xxxxxx')
+            >>> paginator = fred_client.paginator()
+            >>> for series in paginator.category_series(category_id='125'):
+                    print(series['id'])
+        """
+
+        self.fred_session: FredSession = session
+        self.max_workers = max_workers
+        self.page_size = min(page_size, MAX_PAGE_SIZE)
+
+        self.categories_service = Categories(session=session)
+        self.releases_service = Releases(session=session)
+        self.series_service = Series(session=session)
+        self.sources_service = Sources(session=session)
+        self.tags_service = Tags(session=session)
+
+    def __repr__(self) -> str:
+        """String representation of the `FederalReserveClient.Paginator` object."""
+
+        # define the string representation
+        str_representation = '<FederalReserveClient.Paginator (max_workers={max_workers}, page_size={page_size})>'.format(
+            max_workers=self.max_workers,
+            page_size=self.page_size
+        )
+
+        return str_representation
+
+    def paginate(
+        self,
+        method: Callable[..., Dict],
+        items_key: str,
+        collect: bool = False,
+        **kwargs
+    ) -> Union[Iterator[Dict], List[Dict]]:
+        """Walks every page of any listing method that takes `offset` and `limit`.
+
+        ### Parameters
+        ----
+        method : Callable[..., Dict]
+            The service method, for example `Categories.get_category_series`.
+
+        items_key : str
+            The key holding the items in the response, for example `seriess`.
+
+        collect : bool (optional, Default=False)
+            Return a list instead of a generator.
+
+        **kwargs : dict
+            The other arguments passed to the method.
+
+        ### Returns
+        ----
+        Union[Iterator[Dict], List[Dict]]:
+            The items of every page, in order.
+        """
+
+        items = self._iterate(method=method, items_key=items_key, **kwargs)
+
+        if collect:
+            return list(items)
+
+        return items
+
+    def category_series(self, category_id: str, collect: bool = False, **kwargs) -> Union[Iterator[Dict], List[Dict]]:
+        """Every page of `Categories.get_category_series`."""
+
+        return self.paginate(
+            method=self.categories_service.get_category_series,
+            items_key='seriess',
+            collect=collect,
+            category_id=category_id,
+            **kwargs
+        )
+
+    def release_series(self, release_id: str, collect: bool = False, **kwargs) -> Union[Iterator[Dict], List[Dict]]:
+        """Every page of `Releases.get_release_series`."""
+
+        return self.paginate(
+            method=self.releases_service.get_release_series,
+            items_key='seriess',
+            collect=collect,
+            release_id=release_id,
+            **kwargs
+        )
+
+    def releases(self, collect: bool = False, **kwargs) -> Union[Iterator[Dict], List[Dict]]:
+        """Every page of `Releases.get_releases`."""
+
+        return self.paginate(
+            method=self.releases_service.get_releases,
+            items_key='releases',
+            collect=collect,
+            **kwargs
+        )
+
+    def releases_dates(self, collect: bool = False, **kwargs) -> Union[Iterator[Dict], List[Dict]]:
+        """Every page of `Releases.get_releases_dates`."""
+
+        return self.paginate(
+            method=self.releases_service.get_releases_dates,
+            items_key='release_dates',
+            collect=collect,
+            **kwargs
+        )
+
+    def release_dates(self, release_id: str, collect: bool = False, **kwargs) -> Union[Iterator[Dict], List[Dict]]:
+        """Every page of `Releases.get_release_dates`."""
+
+        return self.paginate(
+            method=self.releases_service.get_release_dates,
+            items_key='release_dates',
+            collect=collect,
+            release_id=release_id,
+            **kwargs
+        )
+
+    def sources(self, collect: bool = False, **kwargs) -> Union[Iterator[Dict], List[Dict]]:
+        """Every page of `Sources.get_sources`."""
+
+        return self.paginate(
+            method=self.sources_service.get_sources,
+            items_key='sources',
+            collect=collect,
+            **kwargs
+        )
+
+    def source_releases(self, source_id: int, collect: bool = False, **kwargs) -> Union[Iterator[Dict], List[Dict]]:
+        """Every page of `Sources.get_source_releases`."""
+
+        return self.paginate(
+            method=self.sources_service.get_source_releases,
+            items_key='releases',
+            collect=collect,
+            source_id=source_id,
+            **kwargs
+        )
+
+    def tags(self, collect: bool = False, **kwargs) -> Union[Iterator[Dict], List[Dict]]:
+        """Every page of `Tags.get_tags`."""
+
+        return self.paginate(
+            method=self.tags_service.get_tags,
+            items_key='tags',
+            collect=collect,
+            **kwargs
+        )
+
+    def tags_series(self, collect: bool = False, **kwargs) -> Union[Iterator[Dict], List[Dict]]:
+        """Every page of `Tags.get_tags_series`."""
+
+        return self.paginate(
+            method=self.tags_service.get_tags_series,
+            items_key='seriess',
+            collect=collect,
+            **kwargs
+        )
+
+    def series_search(self, search_text: str, collect: bool = False, **kwargs) -> Union[Iterator[Dict], List[Dict]]:
+        """Every page of `Series.series_search`."""
+
+        return self.paginate(
+            method=self.series_service.series_search,
+            items_key='seriess',
+            collect=collect,
+            search_text=search_text,
+            **kwargs
+        )
+
+    def series_updates(self, collect: bool = False, **kwargs) -> Union[Iterator[Dict], List[Dict]]:
+        """Every page of `Series.get_series_updates`."""
+
+        return self.paginate(
+            method=self.series_service.get_series_updates,
+            items_key='seriess',
+            collect=collect,
+            **kwargs
+        )
+
+    def _iterate(self, method: Callable[..., Dict], items_key: str, **kwargs) -> Iterator[Dict]:
+        """Yields the items of the first page, then of the others fetched concurrently."""
+
+        first_page = method(offset=0, limit=self.page_size, **kwargs)
+        yield from first_page.get(items_key, [])
+
+        count = int(first_page.get('count', 0))
+        page_count = math.ceil(count / self.page_size)
+
+        if page_count <= 1:
+            return
+
+        # Pages fetched by the workers keep the priority of the caller.
+        @inherit_priority
+        def fetch_page(offset: int) -> Dict:
+            return method(offset=offset, limit=self.page_size, **kwargs)
+
+        offsets = iter(range(self.page_size, count, self.page_size))
+
+        # Keep a bounded window of pages in flight, so items stream out in
+        # order without holding every page in memory.
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            in_flight = deque()
+
+            for offset in offsets:
+                in_flight.append(executor.submit(fetch_page, offset))
+                if len(in_flight) >= self.max_workers * 2:
+                    break
+
+            while in_flight:
+                page = in_flight.popleft().result()
+
+                next_offset = next(offsets, None)
+                if next_offset is not None:
+                    in_flight.append(executor.submit(fetch_page, next_offset))
+
+                yield from page.get(items_key, [])
@@ -0,0 +1,623 @@
+import math
+import time
+import threading
+
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+from fred.paginator import MAX_PAGE_SIZE
+from fred.paginator import Paginator
+from fred.tag_index import split_tag_names
+
+# Rough size of one series in a listing response, in bytes.
+BYTES_PER_SERIES = 700
+
+# Assumed size of a listing whose count is not known.
+UNKNOWN_COUNT = 1000
+
+# The mirror listings are read in one go.
+MIRROR_LIMIT = 10 ** 9
+
+
+class SeriesQuery():
+
+    """
+    ## Overview:
+    ----
+    A declarative question about series: the series of a category or of a
+    release, or the whole universe, that carry every tag of `tag_names` and
+    none of `exclude_tag_names`.
+    """
+
+    def __init__(
+        self,
+        category_id: int = None,
+        release_id: int = None,
+        tag_names: List[str] = None,
+        exclude_tag_names: List[str] = None
+    ) -> None:
+        """Initializes the `SeriesQuery` object.
+
+        ### Parameters
+        ----
+        category_id : int (optional, Default=None)
+            Restricts the series to a category.
+
+        release_id : int (optional, Default=None)
+            Restricts the series to a release.
+
+        tag_names : List[str] (optional, Default=None)
+            The tags every series must have.
+
+        exclude_tag_names : List[str] (optional, Default=None)
+            The tags no series may have.
+
+        ### Usage
+        ----
+            >>> query = SeriesQuery(category_id=32145, tag_names=['usa', 'monthly'])
+        """
+
+        if category_id is not None and release_id is not None:
+            raise ValueError('A query is scoped to a category or a release, not both.')
+
+        self.category_id = int(category_id) if category_id is not None else None
+        self.release_id = int(release_id) if release_id is not None else None
+        self.tag_names = sorted(set(split_tag_names(tag_names=tag_names)))
+        self.exclude_tag_names = sorted(set(split_tag_names(tag_names=exclude_tag_names)))
+
+        if self.scope is None and not self.tag_names:
+            raise ValueError('A query needs a category, a release or tag names.')
+
+    def __repr__(self) -> str:
+        """String representation of the `SeriesQuery` object."""
+
+        # define the string representation
+        str_representation = (
+            '<SeriesQuery (scope={scope}, tag_names={tag_names}, exclude_tag_names={exclude_tag_names})>'
+        ).format(
+            scope=self.scope,
+            tag_names=self.tag_names,
+            exclude_tag_names=self.exclude_tag_names
+        )
+
+        return str_representation
+
+    @property
+    def scope(self) -> Tuple[str, int]:
+        """The category or release the query is restricted to, None for the universe."""
+
+        if self.category_id is not None:
+            return ('category', self.category_id)
+        elif self.release_id is not None:
+            return ('release', self.release_id)
+
+        return None
+
+    def key(self) -> tuple:
+        """A hashable identity of the query."""
+
+        return (self.scope, tuple(self.tag_names), tuple(self.exclude_tag_names))
+
+
+class Plan():
+
+    """
+    ## Overview:
+    ----
+    One way of answering a `SeriesQuery`, with its estimated cost in API
+    calls and bytes transferred.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        api_calls: int,
+        estimated_bytes: int,
+        steps: List[str],
+        run: Callable[[], List[str]]
+    ) -> None:
+        """Initializes the `Plan` object.
+
+        ### Parameters
+        ----
+        name : str
+            The name of the path.
+
+        api_calls : int
+            The estimated number of API requests.
+
+        estimated_bytes : int
+            The estimated number of bytes downloaded.
+
+        steps : List[str]
+            What the plan does, for `QueryPlanner.explain`.
+
+        run : Callable[[], List[str]]
+            Executes the plan and returns the series IDs, or None when the
+            plan turns out not to apply.
+        """
+
+        self.name = name
+        self.api_calls = api_calls
+        self.estimated_bytes = estimated_bytes
+        self.steps = steps
+        self.run = run
+
+    def __repr__(self) -> str:
+        """String representation of the `Plan` object."""
+
+        # define the string representation
+        str_representation = '<Plan (name={name}, api_calls={api_calls}, estimated_bytes={estimated_bytes})>'.format(
+            name=self.name,
+            api_calls=self.api_calls,
+            estimated_bytes=self.estimated_bytes
+        )
+
+        return str_representation
+
+    def cost(self, call_weight: float, byte_weight: float) -> float:
+        """Returns the weighted cost of the plan."""
+
+        return self.api_calls * call_weight + self.estimated_bytes * byte_weight
+
+    def as_dict(self) -> Dict:
+        """Returns the plan as a dictionary."""
+
+        return {
+            'name': self.name,
+            'api_calls': self.api_calls,
+            'estimated_bytes': self.estimated_bytes,
+            'steps': self.steps
+        }
+
+
+class QueryPlanner():
+
+    """
+    ## Overview:
+    ----
+    Answers a `SeriesQuery` through the cheapest of the paths available:
+    results it already holds, the `FredMirror`, the local `TagIndex` and
+    `CategorySeriesIndex`, a tag-filtered listing, or a tag listing
+    intersected with a category or release listing. Each path is costed in
+    API calls and bytes from the counts already known, the counts the local
+    indexes hold and the counts learned from earlier executions. The plans
+    are tried cheapest first and a plan that turns out not to apply falls
+    through to the next.
+    """
+
+    def __init__(
+        self,
+        paginator: Paginator,
+        fred_mirror: object = None,
+        tag_index: object = None,
+        category_index: object = None,
+        tag_index_complete: bool = False,
+        call_weight: float = 1.0,
+        byte_weight: float = 1.0 / 100000,
+        cache_ttl: float = 3600.0
+    ) -> None:
+        """Initializes the `QueryPlanner` object.
+
+        ### Parameters
+        ----
+        paginator : Paginator
+            The `Paginator` used by the API paths.
+
+        fred_mirror : FredMirror (optional, Default=None)
+            A built mirror answering queries locally.
+
+        tag_index : TagIndex (optional, Default=None)
+            A local tag index.
+
+        category_index : CategorySeriesIndex (optional, Default=None)
+            A local category to series index.
+
+        tag_index_complete : bool (optional, Default=False)
+            Whether the tag index covers every series, which lets it answer
+            queries that are not scoped to a category.
+
+        call_weight : float (optional, Default=1.0)
+            The cost of one API call.
+
+        byte_weight : float (optional, Default=0.00001)
+            The cost of one byte, by default 100 KB cost as much as a call.
+
+        cache_ttl : float (optional, Default=3600.0)
+            The number of seconds query results are reused.
+
+        ### Usage
+        ----
+            >>> fred_client = FederalReserveClient(api_key='xxxxxx')
+            >>> query_planner = QueryPlanner(paginator=fred_client.paginator())
+            >>> query = SeriesQuery(category_id=32145, tag_names=['usa', 'monthly'])
+            >>> query_planner.explain(query=query)
+            >>> query_planner.execute(query=query)
+        """
+
+        self.paginator = paginator
+        self.fred_mirror = fred_mirror
+        self.tag_index = tag_index
+        self.category_index = category_index
+        self.tag_index_complete = tag_index_complete
+        self.call_weight = call_weight
+        self.byte_weight = byte_weight
+        self.cache_ttl = cache_ttl
+
+        # The counts of listings seen so far, keyed like `SeriesQuery.key`.
+        self.known_counts: Dict[tuple, int] = {}
+
+        self._results: Dict[tuple, Tuple[float, List[str]]] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """String representation of the `QueryPlanner` object."""
+
+        # define the string representation
+        str_representation = (
+            '<QueryPlanner (mirror={mirror}, tag_index={tag_index}, category_index={category_index}, '
+            'known_counts={known_counts})>'
+        ).format(
+            mirror=self.fred_mirror is not None,
+            tag_index=self.tag_index is not None,
+            category_index=self.category_index is not None,
+            known_counts=len(self.known_counts)
+        )
+
+        return str_representation
+
+    def plans(self, query: SeriesQuery) -> List[Plan]:
+        """Returns every applicable plan, cheapest first.
+
+        ### Parameters
+        ----
+        query : SeriesQuery
+            The query.
+
+        ### Returns
+        ----
+        List[Plan]:
+            The plans.
+        """
+
+        plans = []
+
+        cached = self._results.get(query.key())
+        if cached is not None and cached[0] > time.monotonic():
+            plans.append(Plan('cache', 0, 0, ['reuse the result of an earlier execution'], lambda: list(cached[1])))
+
+        if self._mirror_applies(query=query):
+            plans.append(Plan('mirror', 0, 0, ['query the local mirror'], lambda: self._run_mirror(query=query)))
+
+        if self._local_index_applies(query=query):
+            plans.append(Plan(
+                'local_index', 0, 0, ['intersect the local tag and category indexes'],
+                lambda: self._run_local_index(query=query)
+            ))
+
+        if query.scope is None:
+            count = self.estimate_count(scope=None, tag_names=query.tag_names, exclude_tag_names=query.exclude_tag_names)
+            plans.append(Plan(
+                'tags_series',
+                self._pages(count=count),
+                count * BYTES_PER_SERIES,
+                ['page through get_tags_series'],
+                lambda: self._run_listing(scope=None, tag_names=query.tag_names, exclude_tag_names=query.exclude_tag_names)
+            ))
+        else:
+            scope_count = self.estimate_count(scope=query.scope)
+            filtered_count = self.estimate_count(
+                scope=query.scope,
+                tag_names=query.tag_names,
+                exclude_tag_names=query.exclude_tag_names
+            )
+            endpoint = 'get_{kind}_series'.format(kind=query.scope[0])
+
+            plans.append(Plan(
+                'filtered_listing',
+                self._pages(count=filtered_count),
+                filtered_count * BYTES_PER_SERIES,
+                ['page through {endpoint} with the tag filters'.format(endpoint=endpoint)],
+                lambda: self._run_listing(
+                    scope=query.scope,
+                    tag_names=query.tag_names,
+                    exclude_tag_names=query.exclude_tag_names
+                )
+            ))
+
+            if query.tag_names:
+                tags_count = self.estimate_count(
+                    scope=None,
+                    tag_names=query.tag_names,
+                    exclude_tag_names=query.exclude_tag_names
+                )
+                plans.append(Plan(
+                    'tags_intersection',
+                    self._pages(count=tags_count) + self._pages(count=scope_count),
+                    (tags_count + scope_count) * BYTES_PER_SERIES,
+                    ['page through get_tags_series', 'page through {endpoint}'.format(endpoint=endpoint), 'intersect'],
+                    lambda: self._run_intersection(query=query)
+                ))
+
+            if self.tag_index is not None and (query.tag_names or query.exclude_tag_names):
+                plans.append(Plan(
+                    'listing_then_tag_index',
+                    self._pages(count=scope_count),
+                    scope_count * BYTES_PER_SERIES,
+                    ['page through {endpoint}'.format(endpoint=endpoint), 'filter with the local tag index'],
+                    lambda: self._run_listing_then_tag_index(query=query)
+                ))
+
+        plans.sort(key=lambda plan: plan.cost(call_weight=self.call_weight, byte_weight=self.byte_weight))
+
+        return plans
+
+    def explain(self, query: SeriesQuery) -> List[Dict]:
+        """Returns the plans of a query with their estimated costs, cheapest first."""
+
+        return [
+            dict(plan.as_dict(), cost=plan.cost(call_weight=self.call_weight, byte_weight=self.byte_weight))
+            for plan in self.plans(query=query)
+        ]
+
+    def execute(self, query: SeriesQuery) -> Dict:
+        """Answers a query with the cheapest plan that applies.
+
+        ### Parameters
+        ----
+        query : SeriesQuery
+            The query.
+
+        ### Returns
+        ----
+        Dict:
+            The name of the plan used, its estimated API calls, the count
+            and the sorted series IDs.
+        """
+
+        for plan in self.plans(query=query):
+            series_ids = plan.run()
+
+            if series_ids is None:
+                continue
+
+            series_ids = sorted(set(series_ids))
+
+            with self._lock:
+                self.known_counts[query.key()] = len(series_ids)
+                self._results[query.key()] = (time.monotonic() + self.cache_ttl, series_ids)
+
+            return {
+                'plan': plan.name,
+                'api_calls': plan.api_calls,
+                'count': len(series_ids),
+                'series_ids': series_ids
+            }
+
+        raise RuntimeError('No plan could answer {query}.'.format(query=query))
+
+    def estimate_count(
+        self,
+        scope: Tuple[str, int],
+        tag_names: List[str] = None,
+        exclude_tag_names: List[str] = None
+    ) -> int:
+        """Estimates the number of series of a listing.
+
+        ### Overview
+        ----
+        The count is taken from earlier executions, then from the local
+        indexes and the mirror. For a filtered listing whose count is not
+        known, the smaller of the scope count and the tag count is used as
+        an upper bound.
+
+        ### Parameters
+        ----
+        scope : Tuple[str, int]
+            The category or release, None for the universe.
+
+        tag_names : List[str] (optional, Default=None)
+            The tags every series must have.
+
+        exclude_tag_names : List[str] (optional, Default=None)
+            The tags no series may have.
+
+        ### Returns
+        ----
+        int:
+            The estimated count.
+        """
+
+        tag_names = sorted(set(tag_names or []))
+        exclude_tag_names = sorted(set(exclude_tag_names or []))
+        key = (scope, tuple(tag_names), tuple(exclude_tag_names))
+
+        if key in self.known_counts:
+            return self.known_counts[key]
+
+        if not tag_names and not exclude_tag_names:
+            if scope is None:
+                return UNKNOWN_COUNT
+            return self._scope_count(scope=scope)
+
+        if scope is None:
+            return self._tags_count(tag_names=tag_names, exclude_tag_names=exclude_tag_names)
+
+        return min(
+            self._scope_count(scope=scope),
+            self._tags_count(tag_names=tag_names, exclude_tag_names=exclude_tag_names) if tag_names else UNKNOWN_COUNT * 1000
+        )
+
+    def _scope_count(self, scope: Tuple[str, int]) -> int:
+        """Returns the known or estimated number of series of a category or release."""
+
+        if (scope, (), ()) in self.known_counts:
+            return self.known_counts[(scope, (), ())]
+
+        if scope[0] == 'category' and self.category_index is not None and scope[1] in self.category_index.category_tree:
+            return len(self.category_index.series(category_id=scope[1]))
+
+        if self._mirror_is_built():
+            content = self.fred_mirror.answer(
+                endpoint='/{kind}/series'.format(kind=scope[0]),
+                params={'{kind}_id'.format(kind=scope[0]): scope[1], 'limit': 1}
+            )
+            if content is not None:
+                return content['count']
+
+        return UNKNOWN_COUNT
+
+    def _tags_count(self, tag_names: List[str], exclude_tag_names: List[str]) -> int:
+        """Returns the known or estimated number of series carrying a tag set."""
+
+        if self.tag_index is not None:
+            return self.tag_index.count_series(tag_names=tag_names, exclude_tag_names=exclude_tag_names)
+
+        if self._mirror_is_built() and self.fred_mirror.get_meta(key='series_tags'):
+            content = self.fred_mirror.answer(
+                endpoint='/tags/series',
+                params={'tag_names': tag_names, 'exclude_tag_names': exclude_tag_names, 'limit': 1}
+            )
+            if content is not None:
+                return content['count']
+
+        return UNKNOWN_COUNT
+
+    def _mirror_is_built(self) -> bool:
+        """Returns whether a built mirror is available."""
+
+        return self.fred_mirror is not None and self.fred_mirror.is_built
+
+    def _mirror_applies(self, query: SeriesQuery) -> bool:
+        """Returns whether the mirror can answer a query."""
+
+        if not self._mirror_is_built():
+            return False
+
+        return not (query.tag_names or query.exclude_tag_names) or bool(self.fred_mirror.get_meta(key='series_tags'))
+
+    def _local_index_applies(self, query: SeriesQuery) -> bool:
+        """Returns whether the local indexes can answer a query."""
+
+        if (query.tag_names or query.exclude_tag_names) and self.tag_index is None:
+            return False
+
+        if query.scope is None:
+            return self.tag_index_complete
+        elif query.scope[0] == 'category' and self.category_index is not None:
+            return query.category_id in self.category_index.category_tree
+
+        return False
+
+    def _run_mirror(self, query: SeriesQuery) -> List[str]:
+        """Answers a query from the mirror."""
+
+        series_ids = None
+
+        if query.scope is not None:
+            content = self.fred_mirror.answer(
+                endpoint='/{kind}/series'.format(kind=query.scope[0]),
+                params={'{kind}_id'.format(kind=query.scope[0]): query.scope[1], 'limit': MIRROR_LIMIT}
+            )
+            if content is None:
+                return None
+            series_ids = {series['id'] for series in content['seriess']}
+
+        if query.tag_names:
+            content = self.fred_mirror.answer(
+                endpoint='/tags/series',
+                params={'tag_names': query.tag_names, 'exclude_tag_names': query.exclude_tag_names, 'limit': MIRROR_LIMIT}
+            )
+            if content is None:
+                return None
+            tagged = {series['id'] for series in content['seriess']}
+            series_ids = tagged if series_ids is None else series_ids & tagged
+
+        elif query.exclude_tag_names:
+            return None
+
+        return list(series_ids)
+
+    def _run_local_index(self, query: SeriesQuery) -> List[str]:
+        """Answers a query from the local indexes."""
+
+        series_ids = None
+
+        if query.scope is not None:
+            series_ids = self.category_index.series(category_id=query.category_id)
+
+        if self.tag_index is None:
+            return series_ids
+
+        if series_ids is not None and any(series_id not in self.tag_index.ordinals for series_id in series_ids):
+            return None
+
+        matching = self.tag_index.matching_series(
+            tag_names=query.tag_names,
+            exclude_tag_names=query.exclude_tag_names,
+            series_ids=series_ids
+        )
+
+        return [self.tag_index.series_ids[ordinal] for ordinal in matching]
+
+    def _run_listing(
+        self,
+        scope: Tuple[str, int],
+        tag_names: List[str],
+        exclude_tag_names: List[str]
+    ) -> List[str]:
+        """Pages through one listing endpoint and records its count."""
+
+        filters = {
+            'tag_names': tag_names or None,
+            'exclude_tag_names': exclude_tag_names or None
+        }
+
+        if scope is None:
+            items = self.paginator.tags_series(**filters)
+        elif scope[0] == 'category':
+            items = self.paginator.category_series(category_id=str(scope[1]), **filters)
+        else:
+            items = self.paginator.release_series(release_id=str(scope[1]), **filters)
+
+        series_ids = [series['id'] for series in items]
+
+        with self._lock:
+            self.known_counts[(scope, tuple(tag_names or ()), tuple(exclude_tag_names or ()))] = len(series_ids)
+
+        return series_ids
+
+    def _run_intersection(self, query: SeriesQuery) -> List[str]:
+        """Intersects the tag listing with the category or release listing."""
+
+        tagged = self._run_listing(
+            scope=None,
+            tag_names=query.tag_names,
+            exclude_tag_names=query.exclude_tag_names
+        )
+        scoped = self._run_listing(scope=query.scope, tag_names=[], exclude_tag_names=[])
+
+        return list(set(tagged).intersection(scoped))
+
+    def _run_listing_then_tag_index(self, query: SeriesQuery) -> List[str]:
+        """Pages through the category or release listing and filters it locally."""
+
+        scoped = self._run_listing(scope=query.scope, tag_names=[], exclude_tag_names=[])
+
+        if any(series_id not in self.tag_index.ordinals for series_id in scoped):
+            return None
+
+        matching = self.tag_index.matching_series(
+            tag_names=query.tag_names,
+            exclude_tag_names=query.exclude_tag_names,
+            series_ids=scoped
+        )
+
+        return [self.tag_index.series_ids[ordinal] for ordinal in matching]
+
+    @staticmethod
+    def _pages(count: int) -> int:
+        """Returns the number of requests needed to page through a listing."""
+
+        return max(1, math.ceil(count / MAX_PAGE_SIZE))
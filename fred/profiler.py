@@ -0,0 +1,268 @@
+import io
+import time
+import pstats
+import socket
+import cProfile
+import threading
+import tracemalloc
+
+from typing import Dict
+from typing import List
+from urllib.parse import urlsplit
+
+# The phases of a request, in the order they happen.
+PHASES = ('limiter_wait', 'dns', 'first_byte', 'transfer', 'decode')
+
+# How a request ended: answered by FRED, failed, served by the mirror or by a breaker's fallback.
+STATUSES = ('success', 'failed', 'mirror', 'fallback')
+
+
+class SessionProfiler():
+
+    """
+    ## Overview:
+    ----
+    Records where the time of each `FredSession` request goes: waiting for
+    the rate limiter, resolving the host, connecting and waiting for the
+    first byte of the response, transferring the body and decoding the JSON.
+    Every request is counted with its status, so failures, mirror answers
+    and fallbacks show up next to the calls FRED answered.
+    The wall time the thread that opened the block spent outside the client
+    is reported as user time, which stands in for post-processing: the
+    client hands back the decoded JSON and does no post-processing of its
+    own. cProfile and tracemalloc can be captured around the block.
+    """
+
+    def __init__(self, cprofile: bool = False, memory: bool = False, top: int = 15) -> None:
+        """Initializes the `SessionProfiler` object, see `FredSession.profile`.
+
+        ### Parameters
+        ----
+        cprofile : bool (optional, Default=False)
+            Whether to run cProfile on the thread that opened the block.
+
+        memory : bool (optional, Default=False)
+            Whether to trace the memory allocated inside the block.
+
+        top : int (optional, Default=15)
+            The number of functions and allocation sites in the report.
+        """
+
+        self.cprofile = cprofile
+        self.memory = memory
+        self.top = top
+
+        self.calls: List[Dict] = []
+        self.started: float = None
+        self.ended: float = None
+        self.owner: int = None
+
+        self._profile: cProfile.Profile = None
+        self._snapshot: tracemalloc.Snapshot = None
+        self._started_tracing = False
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """String representation of the `SessionProfiler` object."""
+
+        # define the string representation
+        str_representation = '<SessionProfiler (calls={calls}, cprofile={cprofile}, memory={memory})>'.format(
+            calls=len(self.calls),
+            cprofile=self.cprofile,
+            memory=self.memory
+        )
+
+        return str_representation
+
+    def start(self) -> None:
+        """Starts the clock and the optional captures."""
+
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+        if self.cprofile:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+        self.owner = threading.get_ident()
+        self.started = time.perf_counter()
+
+    def stop(self) -> None:
+        """Stops the clock and the optional captures."""
+
+        self.ended = time.perf_counter()
+
+        if self._profile is not None:
+            self._profile.disable()
+
+        if self.memory and tracemalloc.is_tracing():
+            self._snapshot = tracemalloc.take_snapshot()
+            if self._started_tracing:
+                tracemalloc.stop()
+
+    def resolve(self, url: str) -> float:
+        """Resolves the host of a URL and returns the seconds it took.
+
+        ### Overview
+        ----
+        `requests` does not expose its own lookup, so the host is resolved
+        separately just before the request, which is then served from the
+        resolver's cache.
+        """
+
+        host = urlsplit(url).hostname
+        started = time.perf_counter()
+
+        try:
+            socket.getaddrinfo(host, 443, proto=socket.IPPROTO_TCP)
+        except OSError:
+            pass
+
+        return time.perf_counter() - started
+
+    def record(
+        self,
+        endpoint: str,
+        phases: Dict[str, float],
+        response_bytes: int = 0,
+        status: str = 'success'
+    ) -> None:
+        """Adds the phases of one request.
+
+        ### Parameters
+        ----
+        endpoint : str
+            The endpoint, which identifies the service method.
+
+        phases : Dict[str, float]
+            The seconds spent in each of `PHASES`, only those reached
+            for a request that did not succeed.
+
+        response_bytes : int (optional, Default=0)
+            The size of the response body.
+
+        status : str (optional, Default='success')
+            How the request ended, one of `STATUSES`.
+        """
+
+        if status not in STATUSES:
+            raise ValueError('Status must be one of {statuses}.'.format(statuses=STATUSES))
+
+        with self._lock:
+            self.calls.append({
+                'endpoint': endpoint,
+                'phases': dict(phases),
+                'seconds': sum(phases.values()),
+                'bytes': response_bytes,
+                'status': status,
+                'thread': threading.get_ident()
+            })
+
+    def report(self) -> Dict:
+        """Summarizes the recorded calls.
+
+        ### Returns
+        ----
+        Dict:
+            The totals, calls per status and per phase seconds of each
+            endpoint and of every call, the user time and, when captured, the cProfile and
+            tracemalloc summaries.
+        """
+
+        with self._lock:
+            calls = list(self.calls)
+
+        ended = self.ended if self.ended is not None else time.perf_counter()
+        wall = ended - self.started if self.started is not None else 0.0
+
+        endpoints = {}
+        for call in calls:
+            endpoints.setdefault(call['endpoint'], []).append(call)
+
+        # Client time spent by the thread that opened the block, the rest of its wall time is user code.
+        client_seconds = sum(call['seconds'] for call in calls if call['thread'] == self.owner)
+
+        report = {
+            'wall_seconds': round(wall, 6),
+            'user_seconds': round(max(0.0, wall - client_seconds), 6),
+            'total': self._summarize(calls=calls),
+            'endpoints': {
+                endpoint: self._summarize(calls=endpoint_calls)
+                for endpoint, endpoint_calls in sorted(endpoints.items())
+            }
+        }
+
+        if self._profile is not None:
+            stream = io.StringIO()
+            pstats.Stats(self._profile, stream=stream).sort_stats('cumulative').print_stats(self.top)
+            report['cprofile'] = stream.getvalue()
+
+        if self._snapshot is not None:
+            report['memory'] = [
+                {'location': str(stat.traceback), 'bytes': stat.size, 'allocations': stat.count}
+                for stat in self._snapshot.statistics('lineno')[:self.top]
+            ]
+
+        return report
+
+    def format_report(self) -> str:
+        """Returns the report as a table, one row per endpoint, in milliseconds.
+
+        ### Returns
+        ----
+        str:
+            The table.
+        """
+
+        report = self.report()
+
+        header = '{endpoint:<28}{calls:>7}'.format(endpoint='endpoint', calls='calls') + ''.join(
+            '{status:>10}'.format(status=status) for status in STATUSES
+        ) + ''.join(
+            '{phase:>14}'.format(phase=phase) for phase in PHASES
+        ) + '{total:>14}'.format(total='total')
+        lines = [header, '-' * len(header)]
+
+        rows = list(report['endpoints'].items()) + [('total', report['total'])]
+        for endpoint, summary in rows:
+            lines.append(
+                '{endpoint:<28}{calls:>7}'.format(endpoint=endpoint, calls=summary['calls']) + ''.join(
+                    '{count:>10}'.format(count=summary['statuses'][status]) for status in STATUSES
+                ) + ''.join(
+                    '{value:>14.1f}'.format(value=summary['phases'][phase]['seconds'] * 1000) for phase in PHASES
+                ) + '{value:>14.1f}'.format(value=summary['seconds'] * 1000)
+            )
+
+        lines.append('')
+        lines.append('wall {wall:.1f} ms, user {user:.1f} ms'.format(
+            wall=report['wall_seconds'] * 1000,
+            user=report['user_seconds'] * 1000
+        ))
+
+        return '\n'.join(lines)
+
+    @staticmethod
+    def _summarize(calls: List[Dict]) -> Dict:
+        """Totals the phases of calls."""
+
+        seconds = sum(call['seconds'] for call in calls)
+        phases = {}
+
+        for phase in PHASES:
+            values = [call['phases'].get(phase, 0.0) for call in calls]
+            total = sum(values)
+            phases[phase] = {
+                'seconds': round(total, 6),
+                'mean_seconds': round(total / len(values), 6) if values else 0.0,
+                'max_seconds': round(max(values), 6) if values else 0.0,
+                'share': round(total / seconds, 4) if seconds else 0.0
+            }
+
+        return {
+            'calls': len(calls),
+            'seconds': round(seconds, 6),
+            'bytes': sum(call['bytes'] for call in calls),
+            'statuses': {status: sum(call['status'] == status for call in calls) for status in STATUSES},
+            'phases': phases
+        }
@@ -0,0 +1,393 @@
+import json
+import bisect
+import pathlib
+import threading
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+from fred.paginator import Paginator
+from fred.series import Series
+
+
+class ReleaseCalendar():
+
+    """
+    ## Overview:
+    ----
+    A local, sorted copy of the FRED release calendar harvested from
+    `Releases.get_releases_dates`. Dates are kept as day ordinals, sorted
+    per release and globally, so next/previous release lookups and
+    "releases on date D" are binary searches. The calendar can be refreshed
+    incrementally instead of being harvested again.
+    """
+
+    def __init__(self, paginator: Paginator, series_service: Series = None) -> None:
+        """Initializes the `ReleaseCalendar` object.
+
+        ### Parameters
+        ----
+        paginator : Paginator
+            The `Paginator` used to walk `get_releases_dates`.
+
+        series_service : Series (optional, Default=None)
+            The `Series` service used to find the release of a series. When not
+            provided, the paginator's service is used.
+
+        ### Usage
+        ----
+            >>> fred_client = FederalReserveClient(api_key='xxxxxx')
+            >>> release_calendar = ReleaseCalendar(paginator=fred_client.paginator())
+            >>> release_calendar.harvest()
+            >>> release_calendar.next_release_date(release_id=53)
+        """
+
+        self.paginator = paginator
+        self.series_service = series_service or paginator.series_service
+
+        self.dates_by_release: Dict[int, List[int]] = {}
+        self.release_names: Dict[int, str] = {}
+        self.release_by_series: Dict[str, int] = {}
+        self.last_refresh: date = None
+
+        self._calendar: List[Tuple[int, int]] = []
+        self._lock = threading.RLock()
+
+    def __repr__(self) -> str:
+        """String representation of the `ReleaseCalendar` object."""
+
+        # define the string representation
+        str_representation = '<ReleaseCalendar (releases={releases}, dates={dates}, last_refresh={last_refresh})>'.format(
+            releases=len(self.dates_by_release),
+            dates=len(self._calendar),
+            last_refresh=self.last_refresh
+        )
+
+        return str_representation
+
+    def harvest(self, realtime_start: Union[str, date] = '1776-07-04') -> int:
+        """Harvests every release date, including the scheduled ones.
+
+        ### Parameters
+        ----
+        realtime_start : Union[str, date] (optional, Default='1776-07-04')
+            How far back the calendar goes.
+
+        ### Returns
+        ----
+        int:
+            The number of release dates added.
+        """
+
+        with self._lock:
+            self.dates_by_release = {}
+            self._calendar = []
+
+        return self._fetch(realtime_start=realtime_start)
+
+    def refresh(self) -> int:
+        """Reads the release dates again from the day before the last harvest or refresh.
+
+        ### Overview
+        ----
+        `get_releases_dates` returns every release date of the refresh
+        window, so the dates held inside the window are replaced by the
+        ones returned: rescheduled and cancelled dates are dropped instead
+        of lingering next to their replacements.
+
+        ### Returns
+        ----
+        int:
+            The number of release dates added.
+        """
+
+        if self.last_refresh is None:
+            return self.harvest()
+
+        return self._fetch(realtime_start=self.last_refresh - timedelta(days=1), replace=True)
+
+    def harvest_release(self, release_id: int, realtime_start: Union[str, date] = '1776-07-04') -> int:
+        """Adds the dates of a single release, with `Releases.get_release_dates`.
+
+        ### Parameters
+        ----
+        release_id : int
+            The ID of the release.
+
+        realtime_start : Union[str, date] (optional, Default='1776-07-04')
+            How far back the dates go.
+
+        ### Returns
+        ----
+        int:
+            The number of release dates added.
+        """
+
+        if isinstance(realtime_start, date):
+            realtime_start = realtime_start.isoformat()
+
+        release_dates = self.paginator.release_dates(
+            release_id=str(release_id),
+            realtime_start=realtime_start,
+            realtime_end='9999-12-31',
+            include_release_dates_with_no_data=True
+        )
+
+        with self._lock:
+            self.dates_by_release.setdefault(int(release_id), [])
+
+        return self.add_release_dates(release_dates=release_dates)
+
+    def has_release(self, release_id: int) -> bool:
+        """Returns whether the dates of a release were harvested."""
+
+        return int(release_id) in self.dates_by_release
+
+    def add_release_dates(self, release_dates: List[Dict]) -> int:
+        """Adds release dates, in the shape of the `release_dates` collections.
+
+        ### Parameters
+        ----
+        release_dates : List[Dict]
+            Items with a `release_id`, a `date` and optionally a `release_name`.
+
+        ### Returns
+        ----
+        int:
+            The number of release dates that were new.
+        """
+
+        new_dates = []
+
+        with self._lock:
+            known = {
+                release_id: set(dates) for release_id, dates in self.dates_by_release.items()
+            }
+
+            for item in release_dates:
+                release_id = int(item['release_id'])
+                ordinal = self._to_ordinal(item['date'])
+
+                if 'release_name' in item:
+                    self.release_names[release_id] = item['release_name']
+
+                dates = known.setdefault(release_id, set())
+                if ordinal not in dates:
+                    dates.add(ordinal)
+                    new_dates.append((ordinal, release_id))
+
+            # Sort once at the end rather than inserting one date at a time.
+            for ordinal, release_id in new_dates:
+                self.dates_by_release.setdefault(release_id, []).append(ordinal)
+            for release_id in {release_id for _, release_id in new_dates}:
+                self.dates_by_release[release_id].sort()
+
+            self._calendar = sorted(self._calendar + new_dates)
+
+        return len(new_dates)
+
+    def next_release_date(self, release_id: int, after: Union[str, date] = None) -> date:
+        """Returns the first release date strictly after a date.
+
+        ### Parameters
+        ----
+        release_id : int
+            The ID of the release.
+
+        after : Union[str, date] (optional, Default=None)
+            The reference date, today when not provided.
+
+        ### Returns
+        ----
+        date:
+            The next release date, None when none is scheduled.
+        """
+
+        dates = self.dates_by_release.get(int(release_id), [])
+        position = bisect.bisect_right(dates, self._to_ordinal(after or date.today()))
+
+        return date.fromordinal(dates[position]) if position < len(dates) else None
+
+    def previous_release_date(self, release_id: int, on_or_before: Union[str, date] = None) -> date:
+        """Returns the last release date on or before a date.
+
+        ### Parameters
+        ----
+        release_id : int
+            The ID of the release.
+
+        on_or_before : Union[str, date] (optional, Default=None)
+            The reference date, today when not provided.
+
+        ### Returns
+        ----
+        date:
+            The previous release date, None when there is none.
+        """
+
+        dates = self.dates_by_release.get(int(release_id), [])
+        position = bisect.bisect_right(dates, self._to_ordinal(on_or_before or date.today()))
+
+        return date.fromordinal(dates[position - 1]) if position else None
+
+    def releases_on(self, day: Union[str, date]) -> List[int]:
+        """Returns the releases published on a date.
+
+        ### Parameters
+        ----
+        day : Union[str, date]
+            The date.
+
+        ### Returns
+        ----
+        List[int]:
+            The release IDs.
+        """
+
+        ordinal = self._to_ordinal(day)
+        start = bisect.bisect_left(self._calendar, (ordinal, -1))
+        end = bisect.bisect_left(self._calendar, (ordinal + 1, -1))
+
+        return [release_id for _, release_id in self._calendar[start:end]]
+
+    def release_for_series(self, series_id: str) -> int:
+        """Returns the release a series belongs to, asking FRED only once per series.
+
+        ### Parameters
+        ----
+        series_id : str
+            The ID of the series.
+
+        ### Returns
+        ----
+        int:
+            The release ID.
+        """
+
+        release_id = self.release_by_series.get(series_id)
+
+        if release_id is None:
+            content = self.series_service.get_series_release(series_id=series_id)
+            release_id = int(content['releases'][0]['id'])
+            self.release_by_series[series_id] = release_id
+
+        return release_id
+
+    def next_series_release_date(self, series_id: str, after: Union[str, date] = None) -> date:
+        """Returns the next release date of the release a series belongs to."""
+
+        return self.next_release_date(
+            release_id=self.release_for_series(series_id=series_id),
+            after=after
+        )
+
+    def previous_series_release_date(self, series_id: str, on_or_before: Union[str, date] = None) -> date:
+        """Returns the previous release date of the release a series belongs to."""
+
+        return self.previous_release_date(
+            release_id=self.release_for_series(series_id=series_id),
+            on_or_before=on_or_before
+        )
+
+    def save(self, file_path: Union[str, pathlib.Path]) -> None:
+        """Saves the calendar to a JSON file.
+
+        ### Parameters
+        ----
+        file_path : Union[str, pathlib.Path]
+            The path of the file.
+        """
+
+        with open(file=file_path, mode='w', encoding='utf-8') as calendar_file:
+            json.dump(
+                obj={
+                    'last_refresh': self.last_refresh.isoformat() if self.last_refresh else None,
+                    'dates_by_release': self.dates_by_release,
+                    'release_names': self.release_names,
+                    'release_by_series': self.release_by_series
+                },
+                fp=calendar_file
+            )
+
+    def load(self, file_path: Union[str, pathlib.Path]) -> None:
+        """Loads a calendar saved with `save`, replacing the current one.
+
+        ### Parameters
+        ----
+        file_path : Union[str, pathlib.Path]
+            The path of the file.
+        """
+
+        with open(file=file_path, mode='r', encoding='utf-8') as calendar_file:
+            content = json.load(fp=calendar_file)
+
+        with self._lock:
+            self.dates_by_release = {
+                int(release_id): dates for release_id, dates in content['dates_by_release'].items()
+            }
+            self.release_names = {
+                int(release_id): name for release_id, name in content['release_names'].items()
+            }
+            self.release_by_series = content['release_by_series']
+            self.last_refresh = date.fromisoformat(content['last_refresh']) if content['last_refresh'] else None
+            self._calendar = sorted(
+                (ordinal, release_id)
+                for release_id, dates in self.dates_by_release.items()
+                for ordinal in dates
+            )
+
+    def _fetch(self, realtime_start: Union[str, date], replace: bool = False) -> int:
+        """Pages through `get_releases_dates` and adds what it returns, or replaces the dates from `realtime_start` on."""
+
+        today = date.today()
+
+        if isinstance(realtime_start, date):
+            realtime_start = realtime_start.isoformat()
+
+        release_dates = self.paginator.releases_dates(
+            realtime_start=realtime_start,
+            realtime_end='9999-12-31',
+            order_by='release_date',
+            include_release_dates_with_no_data=True
+        )
+
+        if replace:
+            added = self._replace_release_dates(release_dates=list(release_dates), start=realtime_start)
+        else:
+            added = self.add_release_dates(release_dates=release_dates)
+
+        self.last_refresh = today
+
+        return added
+
+    def _replace_release_dates(self, release_dates: List[Dict], start: Union[str, date]) -> int:
+        """Replaces the dates on or after `start` with the ones given, returns the number of new dates."""
+
+        start = self._to_ordinal(start)
+
+        with self._lock:
+            previous = set(self._calendar)
+
+            self.dates_by_release = {
+                release_id: [ordinal for ordinal in dates if ordinal < start]
+                for release_id, dates in self.dates_by_release.items()
+            }
+            self._calendar = [item for item in self._calendar if item[0] < start]
+            self.add_release_dates(release_dates=release_dates)
+
+            return len(set(self._calendar) - previous)
+
+    @staticmethod
+    def _to_ordinal(value: Union[str, date]) -> int:
+        """Converts a YYYY-MM-DD string, date or datetime to a day ordinal."""
+
+        if isinstance(value, datetime):
+            return value.date().toordinal()
+        elif isinstance(value, date):
+            return value.toordinal()
+
+        return date(int(value[0:4]), int(value[5:7]), int(value[8:10])).toordinal()
@@ -2,6 +2,7 @@ from typing import Dict
 from typing import List
 from typing import Union
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from fred.session import FredSession
 
 # Used for type hinting
@@ -41,6 +42,10 @@ class Releases():
         self.endpoint_collection = '/releases'
         self._todays_date = datetime.today().date().isoformat()
 
+        # The elements of each release table that have children, so
+        # later expansions of the same table can skip the discovery.
+        self._table_structures: Dict[tuple, List[int]] = {}
+
     def __repr__(self) -> str:
         """String representation of the `FederalReserveClient.Releases` object."""
 
@@ -123,7 +128,8 @@ class Releases():
         offset: int = 0,
         limit: int = 1000,
         order_by: str = 'release_id',
-        sort_order: str = 'asc'
+        sort_order: str = 'asc',
+        include_release_dates_with_no_data: bool = False
     ) -> Dict:
         """Get release dates for all releases of economic data.
 
@@ -147,13 +153,18 @@ class Releases():
 
         order_by : str (optional, Default='release_id')
             Order results by values of the specified attribute. One 
-            of the following strings: ['release_id', 'name', 'press_release',
-            'realtime_start', 'realtime_end'].
+            of the following strings: ['release_date', 'release_id', 'release_name'].
 
         sort_order : str (optional, Default='asc')
             Sort results is ascending or descending order for attribute values
             specified by order_by. One of the following strings: ['asc', 'desc'].
 
+        include_release_dates_with_no_data : bool (optional, Default=False)
+            Determines whether release dates with no data available are returned.
+            The defalut value `False` excludes release dates that do not have data.
+            In particular, this excludes future release dates which may be available
+            in the FRED release calendar or the ALFRED release calendar.
+
         ### Returns
         ----
         Dict:
@@ -168,7 +179,7 @@ class Releases():
 
         content = self.fred_session.make_request(
             method='get',
-            endpoint=self.endpoint_collection,
+            endpoint=self.endpoint_collection + '/dates',
             params={
                 'api_key': self.fred_session.client._api_key,
                 'file_type': 'json',
@@ -177,7 +188,8 @@ class Releases():
                 'realtime_end': realtime_end,
                 'limit': limit,
                 'offset': offset,
-                'sort_order': sort_order
+                'sort_order': sort_order,
+                'include_release_dates_with_no_data': str(include_release_dates_with_no_data).lower()
             }
         )
 
@@ -704,7 +716,7 @@ class Releases():
         """
 
         if isinstance(observation_date, datetime):
-            observation_date = observation_date.isoformat()
+            observation_date = observation_date.date().isoformat()
 
         content = self.fred_session.make_request(
             method='get',
@@ -720,3 +732,242 @@ class Releases():
         )
 
         return content
+
+    def get_release_table_tree(
+        self,
+        release_id: str,
+        element_id: int = None,
+        include_observations_value: bool = False,
+        observation_date: Union[str, datetime] = '9999-12-31',
+        max_workers: int = 8
+    ) -> Dict[str, list]:
+        """Expands a whole release table tree into a flat, columnar snapshot.
+
+        ### Overview:
+        ----
+        `get_release_tables` only returns one level of elements per call. This
+        method fetches every level concurrently, one level at a time, and
+        flattens the elements in table order. The elements that have children
+        are remembered, so expanding the same table again (for example at
+        another observation date) fetches every level at once.
+
+        ### Parameters
+        ----
+        release_id : str
+            The release ID you want to query.
+
+        element_id : int (optional, Default=None)
+            The element to start from, the root of the release when not passed.
+
+        include_observations_value : bool (optional, Default=False)
+            A flag to indicate that observations need to be returned.
+
+        observation_date: Union[str, datetime] (optional, Default='9999-12-31')
+            The observation date to be included with the returned
+            release table. YYYY-MM-DD formatted string.
+
+        max_workers : int (optional, Default=8)
+            The number of elements fetched concurrently.
+
+        ### Returns
+        ----
+        Dict[str, list]:
+            The table as columns: `element_id`, `parent_id`, `series_id`, `name`,
+            `type`, `level`, `line`, `observation_value` and `observation_date`.
+
+        ### Usage
+        ----
+            >>> fred_client = FederalReserveClient(api_key='xxxxxx')
+            >>> releases_service = fred_client.releases()
+            >>> releases_service.get_release_table_tree(release_id='53', element_id=12886)
+        """
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return self._expand_release_table(
+                executor=executor,
+                release_id=release_id,
+                element_id=element_id,
+                include_observations_value=include_observations_value,
+                observation_date=observation_date
+            )
+
+    def get_release_table_sweep(
+        self,
+        release_id: str,
+        observation_dates: List[Union[str, datetime]],
+        element_id: int = None,
+        max_workers: int = 8
+    ) -> Dict[str, Dict[str, list]]:
+        """Expands the same release table at several observation dates in parallel.
+
+        ### Parameters
+        ----
+        release_id : str
+            The release ID you want to query.
+
+        observation_dates : List[Union[str, datetime]]
+            The observation dates to take the table at.
+
+        element_id : int (optional, Default=None)
+            The element to start from, the root of the release when not passed.
+
+        max_workers : int (optional, Default=8)
+            The number of elements fetched concurrently, across all dates.
+
+        ### Returns
+        ----
+        Dict[str, Dict[str, list]]:
+            The columnar snapshots, keyed by observation date.
+
+        ### Usage
+        ----
+            >>> fred_client = FederalReserveClient(api_key='xxxxxx')
+            >>> releases_service = fred_client.releases()
+            >>> releases_service.get_release_table_sweep(
+                    release_id='53',
+                    element_id=12886,
+                    observation_dates=['2019-01-01', '2020-01-01']
+                )
+        """
+
+        observation_dates = [
+            value.date().isoformat() if isinstance(value, datetime) else value
+            for value in observation_dates
+        ]
+
+        if not observation_dates:
+            return {}
+
+        snapshots = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+            # The first date discovers the structure the other dates reuse.
+            snapshots[observation_dates[0]] = self._expand_release_table(
+                executor=executor,
+                release_id=release_id,
+                element_id=element_id,
+                include_observations_value=True,
+                observation_date=observation_dates[0]
+            )
+
+            with ThreadPoolExecutor(max_workers=max_workers) as date_executor:
+                tables = date_executor.map(
+                    lambda observation_date: self._expand_release_table(
+                        executor=executor,
+                        release_id=release_id,
+                        element_id=element_id,
+                        include_observations_value=True,
+                        observation_date=observation_date
+                    ),
+                    observation_dates[1:]
+                )
+                snapshots.update(zip(observation_dates[1:], tables))
+
+        return snapshots
+
+    def _expand_release_table(
+        self,
+        executor: ThreadPoolExecutor,
+        release_id: str,
+        element_id: int,
+        include_observations_value: bool,
+        observation_date: Union[str, datetime]
+    ) -> Dict[str, list]:
+        """Fetches every level of a release table and flattens it."""
+
+        def fetch(parent_id: int) -> Dict:
+            return self.get_release_tables(
+                release_id=release_id,
+                element_id=parent_id,
+                include_observations_value=include_observations_value,
+                observation_date=observation_date
+            )
+
+        structure_key = (str(release_id), element_id)
+        elements: Dict[int, Dict] = {}
+        parents_with_children = []
+
+        known_structure = self._table_structures.get(structure_key)
+
+        if known_structure is not None:
+            for parent_id, content in zip(known_structure, executor.map(fetch, known_structure)):
+                self._collect_table_elements(content=content, parent_id=parent_id, elements=elements)
+        else:
+            level = [element_id]
+
+            while level:
+                next_level = []
+                for parent_id, content in zip(level, executor.map(fetch, level)):
+                    found = self._collect_table_elements(content=content, parent_id=parent_id, elements=elements)
+                    if found:
+                        parents_with_children.append(parent_id)
+                    next_level.extend(
+                        child_id for child_id in found
+                        if not elements[child_id]['_expanded']
+                    )
+                level = next_level
+
+            self._table_structures[structure_key] = parents_with_children
+
+        return self._flatten_release_table(elements=elements, root_id=element_id)
+
+    def _collect_table_elements(self, content: Dict, parent_id: int, elements: Dict[int, Dict]) -> List[int]:
+        """Adds the (possibly nested) elements of a response, returns the new element IDs."""
+
+        found = []
+
+        def visit(element: Dict, parent: int, expanded: bool) -> None:
+            current_id = int(element['element_id'])
+            children = element.get('children') or []
+
+            row = {key: value for key, value in element.items() if key != 'children'}
+            row['parent_id'] = parent
+            row['_expanded'] = expanded or bool(children) or elements.get(current_id, {}).get('_expanded', False)
+
+            if current_id not in elements:
+                found.append(current_id)
+
+            elements[current_id] = row
+
+            for child in children:
+                visit(element=child, parent=current_id, expanded=False)
+
+        for element in (content.get('elements') or {}).values():
+            visit(element=element, parent=parent_id, expanded=False)
+
+        if parent_id in elements:
+            elements[parent_id]['_expanded'] = True
+
+        return found
+
+    def _flatten_release_table(self, elements: Dict[int, Dict], root_id: int) -> Dict[str, list]:
+        """Lays the elements out in table order, as columns."""
+
+        columns = [
+            'element_id', 'parent_id', 'series_id', 'name', 'type',
+            'level', 'line', 'observation_value', 'observation_date'
+        ]
+        table = {column: [] for column in columns}
+
+        children: Dict[int, List[Dict]] = {}
+        for element in elements.values():
+            children.setdefault(element['parent_id'], []).append(element)
+
+        def line_number(element: Dict) -> float:
+            try:
+                return float(element.get('line'))
+            except (TypeError, ValueError):
+                return float('inf')
+
+        stack = sorted(children.get(root_id, []), key=line_number, reverse=True)
+
+        while stack:
+            element = stack.pop()
+            for column in columns:
+                table[column].append(element.get(column))
+            stack.extend(
+                sorted(children.get(int(element['element_id']), []), key=line_number, reverse=True)
+            )
+
+        return table
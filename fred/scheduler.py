@@ -0,0 +1,215 @@
+import time
+import threading
+import contextlib
+
+from collections import deque
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from fred.limiter import RateLimiter
+
+INTERACTIVE = 'interactive'
+BACKGROUND = 'background'
+PRIORITIES = (INTERACTIVE, BACKGROUND)
+
+_context = threading.local()
+
+
+def current_priority() -> str:
+    """Returns the priority of the requests made by the current thread, interactive by default."""
+
+    return getattr(_context, 'priority', INTERACTIVE)
+
+
+@contextlib.contextmanager
+def priority(name: str) -> Iterator[None]:
+    """Gives every request made by the current thread inside the block a priority.
+
+    ### Parameters
+    ----
+    name : str
+        One of `PRIORITIES`.
+
+    ### Usage
+    ----
+        >>> with priority('background'):
+                harvester.harvest_release(release_id='53')
+    """
+
+    if name not in PRIORITIES:
+        raise ValueError('Priority must be one of {priorities}.'.format(priorities=PRIORITIES))
+
+    previous = current_priority()
+    _context.priority = name
+
+    try:
+        yield
+    finally:
+        _context.priority = previous
+
+
+def inherit_priority(function: Callable) -> Callable:
+    """Wraps a function so it runs with the priority of the thread wrapping it,
+    for work handed to a thread pool."""
+
+    name = current_priority()
+
+    def wrapper(*args, **kwargs):
+        with priority(name):
+            return function(*args, **kwargs)
+
+    return wrapper
+
+
+class PriorityScheduler():
+
+    """
+    ## Overview:
+    ----
+    Decides which waiting request takes the next rate limiter token. One
+    request of each priority class is at the head of a FIFO queue, and
+    interactive requests go first unless background requests got less than
+    their guaranteed share of the recent grants, so dashboards stay
+    responsive during a harvest without stalling the harvest entirely.
+    """
+
+    def __init__(self, background_share: float = 0.2, window: int = 50) -> None:
+        """Initializes the `PriorityScheduler` object.
+
+        ### Parameters
+        ----
+        background_share : float (optional, Default=0.2)
+            The minimum fraction of the recent grants that goes to
+            background requests while they are waiting.
+
+        window : int (optional, Default=50)
+            The number of recent grants the share is measured over.
+
+        ### Usage
+        ----
+            >>> fred_client = FederalReserveClient(api_key='xxxxxx')
+            >>> fred_client.fred_session.scheduler = PriorityScheduler(background_share=0.1)
+        """
+
+        self.background_share = background_share
+        self.window = window
+
+        self._waiting: Dict[str, deque] = {name: deque() for name in PRIORITIES}
+        self._recent = deque()
+        self._recent_background = 0
+        self._condition = threading.Condition()
+
+        self.granted: Dict[str, int] = {name: 0 for name in PRIORITIES}
+        self.wait_seconds: Dict[str, float] = {name: 0.0 for name in PRIORITIES}
+
+    def __repr__(self) -> str:
+        """String representation of the `PriorityScheduler` object."""
+
+        # define the string representation
+        str_representation = '<PriorityScheduler (background_share={background_share}, waiting={waiting})>'.format(
+            background_share=self.background_share,
+            waiting={name: len(tickets) for name, tickets in self._waiting.items()}
+        )
+
+        return str_representation
+
+    def acquire(self, rate_limiter: RateLimiter, priority: str = None, tokens: float = 1.0) -> float:
+        """Waits for this request's turn, then takes its tokens from the rate limiter.
+
+        ### Parameters
+        ----
+        rate_limiter : RateLimiter
+            The limiter the tokens are taken from, None to only order requests.
+
+        priority : str (optional, Default=None)
+            One of `PRIORITIES`, the priority of the current thread when not provided.
+
+        tokens : float (optional, Default=1.0)
+            The number of tokens to take.
+
+        ### Returns
+        ----
+        float:
+            The number of seconds spent waiting.
+        """
+
+        priority = priority or current_priority()
+
+        if priority not in PRIORITIES:
+            raise ValueError('Priority must be one of {priorities}.'.format(priorities=PRIORITIES))
+
+        started = time.monotonic()
+        ticket = object()
+
+        with self._condition:
+            self._waiting[priority].append(ticket)
+
+            try:
+                while True:
+                    if self._next() is not ticket:
+                        self._condition.wait()
+                        continue
+
+                    wait = rate_limiter.try_acquire(tokens=tokens) if rate_limiter is not None else 0.0
+                    if wait == 0.0:
+                        break
+
+                    # Woken early if a request that should go first arrives.
+                    self._condition.wait(timeout=wait)
+            finally:
+                self._waiting[priority].remove(ticket)
+                self._condition.notify_all()
+
+            waited = time.monotonic() - started
+            self._record(priority=priority, waited=waited)
+
+        return waited
+
+    def stats(self) -> Dict[str, Dict]:
+        """Returns the number of waiting requests, grants and wait times of each priority.
+
+        ### Returns
+        ----
+        Dict[str, Dict]:
+            The statistics, keyed by priority.
+        """
+
+        with self._condition:
+            return {
+                name: {
+                    'waiting': len(self._waiting[name]),
+                    'granted': self.granted[name],
+                    'wait_seconds': round(self.wait_seconds[name], 6),
+                    'mean_wait_seconds': round(
+                        self.wait_seconds[name] / self.granted[name], 6
+                    ) if self.granted[name] else 0.0
+                }
+                for name in PRIORITIES
+            }
+
+    def _next(self) -> object:
+        """Returns the ticket of the request that goes next."""
+
+        interactive, background = self._waiting[INTERACTIVE], self._waiting[BACKGROUND]
+
+        if not background:
+            return interactive[0] if interactive else None
+
+        if not interactive:
+            return background[0]
+
+        share = self._recent_background / len(self._recent) if self._recent else 0.0
+
+        return background[0] if share < self.background_share else interactive[0]
+
+    def _record(self, priority: str, waited: float) -> None:
+        """Adds a grant to the totals and to the recent window."""
+
+        self.granted[priority] += 1
+        self.wait_seconds[priority] += waited
+
+        self._recent.append(priority)
+        self._recent_background += priority == BACKGROUND
+
+        if len(self._recent) > self.window:
+            self._recent_background -= self._recent.popleft() == BACKGROUND
@@ -0,0 +1,744 @@
+import re
+import mmap
+import json
+import math
+import struct
+import bisect
+import pathlib
+
+from array import array
+
+from typing import Dict
+from typing import List
+from typing import Union
+
+# Words too common to be useful in a search.
+STOP_WORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'by', 'for', 'from', 'in',
+    'of', 'on', 'or', 'the', 'to', 'with'
+}
+
+# Suffixes stripped by the stemmer, longest first.
+SUFFIXES = [
+    ('ational', 'ate'), ('ization', 'ize'), ('iveness', 'ive'), ('fulness', 'ful'),
+    ('ousness', 'ous'), ('ations', 'ate'), ('ation', 'ate'), ('ments', ''),
+    ('ment', ''), ('ness', ''), ('ings', ''), ('ing', ''), ('ies', 'y'),
+    ('edly', ''), ('ed', ''), ('ly', ''), ('sses', 'ss'), ('ss', 'ss'),
+    ('s', '')
+]
+
+# How much a word counts depending on the field it appears in.
+FIELD_WEIGHTS = {
+    'title': 3.0,
+    'tags': 2.0,
+    'units': 1.0,
+    'frequency': 1.0,
+    'seasonal_adjustment': 1.0,
+    'notes': 0.5
+}
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+# Layout of the header of a saved `SeriesIdIndex` file.
+ID_INDEX_MAGIC = b'FRID'
+ID_INDEX_HEADER = struct.Struct('<4sIII')
+
+
+def stem(word: str) -> str:
+    """Reduces a word to its stem by stripping common English suffixes.
+
+    ### Parameters
+    ----
+    word : str
+        A lower case word.
+
+    ### Returns
+    ----
+    str:
+        The stem of the word.
+    """
+
+    if len(word) <= 3 or word.isdigit():
+        return word
+
+    for suffix, replacement in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            return word[:-len(suffix)] + replacement
+
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """Splits a text into stemmed search terms.
+
+    ### Parameters
+    ----
+    text : str
+        The text to tokenize.
+
+    ### Returns
+    ----
+    List[str]:
+        The stems, stop words removed.
+    """
+
+    return [
+        stem(word) for word in TOKEN_PATTERN.findall(text.lower())
+        if word not in STOP_WORDS
+    ]
+
+
+class SeriesSearchIndex():
+
+    """
+    ## Overview:
+    ----
+    A local inverted index over series metadata that answers the same
+    questions as `Series.series_search` with `search_type='full_text'`,
+    without a network round trip. Series are indexed on their title, units,
+    frequency, seasonal adjustment, notes and tags, and can be added, updated
+    or removed at any time as their metadata changes.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the `SeriesSearchIndex` object.
+
+        ### Usage
+        ----
+            >>> search_index = SeriesSearchIndex()
+            >>> search_index.add_series(series=series_metadata, tags=['gdp', 'nsa'])
+            >>> search_index.series_search(search_text='gross domestic product')
+        """
+
+        self.series: Dict[str, Dict] = {}
+        self.tags: Dict[str, List[str]] = {}
+        self.postings: Dict[str, Dict[str, float]] = {}
+
+        self._terms: Dict[str, Dict[str, float]] = {}
+        self._vocabulary: List[str] = []
+        self._vocabulary_dirty = False
+
+    def __repr__(self) -> str:
+        """String representation of the `SeriesSearchIndex` object."""
+
+        # define the string representation
+        str_representation = '<SeriesSearchIndex (series={series}, terms={terms})>'.format(
+            series=len(self.series),
+            terms=len(self.postings)
+        )
+
+        return str_representation
+
+    def __len__(self) -> int:
+        """Returns the number of indexed series."""
+
+        return len(self.series)
+
+    def __contains__(self, series_id: str) -> bool:
+        """Checks whether a series is indexed."""
+
+        return series_id in self.series
+
+    def add_series(self, series: Dict, tags: List[str] = None) -> None:
+        """Adds a series to the index, replacing it if already indexed.
+
+        ### Parameters
+        ----
+        series : Dict
+            A `Series` resource, as returned in the `seriess` collection
+            of `Series.get_series` or `Series.series_search`.
+
+        tags : List[str] (optional, Default=None)
+            The tag names of the series, as returned by `Series.get_series_tags`.
+        """
+
+        series_id = series['id']
+
+        if series_id in self.series:
+            self.remove_series(series_id=series_id)
+
+        tags = tags or []
+        self.series[series_id] = series
+        self.tags[series_id] = tags
+
+        weights = {}
+        fields = dict(series, tags=' '.join(tags))
+
+        for field, field_weight in FIELD_WEIGHTS.items():
+            for term in tokenize(str(fields.get(field) or '')):
+                weights[term] = weights.get(term, 0.0) + field_weight
+
+        for term, weight in weights.items():
+            if term not in self.postings:
+                self.postings[term] = {}
+                self._vocabulary_dirty = True
+            self.postings[term][series_id] = weight
+
+        self._terms[series_id] = weights
+
+    def add_many(self, series: List[Dict], tags: Dict[str, List[str]] = None) -> None:
+        """Adds several series to the index.
+
+        ### Parameters
+        ----
+        series : List[Dict]
+            A list of `Series` resources.
+
+        tags : Dict[str, List[str]] (optional, Default=None)
+            The tag names, keyed by series ID.
+        """
+
+        tags = tags or {}
+
+        for item in series:
+            self.add_series(series=item, tags=tags.get(item['id']))
+
+    def remove_series(self, series_id: str) -> None:
+        """Removes a series from the index.
+
+        ### Parameters
+        ----
+        series_id : str
+            The ID of the series to remove.
+        """
+
+        for term in self._terms.pop(series_id, {}):
+            postings = self.postings[term]
+            postings.pop(series_id, None)
+            if not postings:
+                del self.postings[term]
+                self._vocabulary_dirty = True
+
+        self.series.pop(series_id, None)
+        self.tags.pop(series_id, None)
+
+    def series_search(
+        self,
+        search_text: str,
+        offset: int = 0,
+        limit: int = 1000,
+        sort_order: str = 'desc',
+        order_by: str = 'search_rank',
+        filter_variable: str = None,
+        filter_value: str = None,
+        tag_names: List[str] = None,
+        exclude_tag_names: List[str] = None,
+        prefix: bool = False
+    ) -> Dict:
+        """Searches the index, mirroring `Series.series_search`.
+
+        ### Parameters
+        ----
+        search_text : str
+            The words to match against economic data series, every word
+            has to match.
+
+        offset : int (optional, Default=0)
+            Non-negative integer.
+
+        limit : int (optional, Default=1000)
+            The maximum number of results to return.
+
+        sort_order : str (optional, Default='desc')
+            One of the following strings: ['asc', 'desc'].
+
+        order_by : str (optional, Default='search_rank')
+            One of the following strings: ['search_rank', 'series_id', 'title',
+            'units', 'frequency', 'seasonal_adjustment', 'realtime_start', 'realtime_end',
+            'last_updated', 'observation_start', 'observation_end', 'popularity',
+            'group_popularity']
+
+        filter_variable : str (optional, Default=None)
+            The attribute to filter results by. One of the following strings:
+            ['frequency', 'units', 'seasonal_adjustment'].
+
+        filter_value : str (optional, Default=None)
+            The value of the filter_variable attribute to filter results by.
+
+        tag_names : List[str] (optional, Default=None)
+            A list of tag names that series match all of.
+
+        exclude_tag_names : List[str] (optional, Default=None)
+            A list of tag names that series match None of.
+
+        prefix : bool (optional, Default=False)
+            Treat the last word as a prefix, for search as you type.
+
+        ### Returns
+        ----
+        Dict:
+            A collection of `Series` resources, in the shape FRED returns them.
+        """
+
+        scores = self._score(search_text=search_text, prefix=prefix)
+
+        if filter_variable and filter_value is not None:
+            scores = {
+                series_id: score for series_id, score in scores.items()
+                if self.series[series_id].get(filter_variable) == filter_value
+            }
+
+        if tag_names or exclude_tag_names:
+            required = set(tag_names or [])
+            excluded = set(exclude_tag_names or [])
+            scores = {
+                series_id: score for series_id, score in scores.items()
+                if required.issubset(self.tags[series_id])
+                and excluded.isdisjoint(self.tags[series_id])
+            }
+
+        reverse = sort_order == 'desc'
+
+        if order_by == 'search_rank':
+            ordered = sorted(
+                scores,
+                key=lambda series_id: (scores[series_id], self.series[series_id].get('popularity', 0)),
+                reverse=reverse
+            )
+        elif order_by == 'series_id':
+            ordered = sorted(scores, reverse=reverse)
+        else:
+            # Series without the attribute come last in either order, the others are never compared to them.
+            missing = {
+                series_id for series_id in scores
+                if self.series[series_id].get(order_by) in (None, '')
+            }
+            ordered = sorted(
+                (series_id for series_id in scores if series_id not in missing),
+                key=lambda series_id: self.series[series_id][order_by],
+                reverse=reverse
+            ) + sorted(missing)
+
+        return {
+            'order_by': order_by,
+            'sort_order': sort_order,
+            'count': len(ordered),
+            'offset': offset,
+            'limit': limit,
+            'seriess': [
+                dict(self.series[series_id], search_rank=round(scores[series_id], 6))
+                for series_id in ordered[offset:offset + limit]
+            ]
+        }
+
+    def save(self, file_path: Union[str, pathlib.Path]) -> None:
+        """Saves the indexed metadata to a JSON file.
+
+        ### Parameters
+        ----
+        file_path : Union[str, pathlib.Path]
+            The path of the file.
+        """
+
+        with open(file=file_path, mode='w', encoding='utf-8') as index_file:
+            json.dump(
+                obj={'series': self.series, 'tags': self.tags},
+                fp=index_file
+            )
+
+    @classmethod
+    def load(cls, file_path: Union[str, pathlib.Path]) -> 'SeriesSearchIndex':
+        """Loads an index saved with `save`.
+
+        ### Parameters
+        ----
+        file_path : Union[str, pathlib.Path]
+            The path of the file.
+
+        ### Returns
+        ----
+        SeriesSearchIndex:
+            The rebuilt index.
+        """
+
+        with open(file=file_path, mode='r', encoding='utf-8') as index_file:
+            content = json.load(fp=index_file)
+
+        search_index = cls()
+        search_index.add_many(
+            series=list(content['series'].values()),
+            tags=content['tags']
+        )
+
+        return search_index
+
+    def _score(self, search_text: str, prefix: bool = False) -> Dict[str, float]:
+        """Scores the series matching every search term with tf-idf."""
+
+        terms = tokenize(search_text)
+
+        if not terms:
+            return {}
+
+        groups = [[term] for term in terms]
+
+        # The word being typed may be incomplete, so expand it to every
+        # indexed term it's a prefix of.
+        partial = TOKEN_PATTERN.findall(search_text.lower())[-1]
+        if prefix and partial not in STOP_WORDS:
+            groups[-1] = self._expand_prefix(partial=partial)
+
+        total = len(self.series)
+        group_postings = []
+
+        for group in groups:
+            merged = {}
+            for term in group:
+                postings = self.postings.get(term, {})
+                idf = math.log(1.0 + total / (1.0 + len(postings)))
+                for series_id, weight in postings.items():
+                    merged[series_id] = max(merged.get(series_id, 0.0), weight * idf)
+            if not merged:
+                return {}
+            group_postings.append(merged)
+
+        # Intersect starting with the rarest term.
+        group_postings.sort(key=len)
+        scores = dict(group_postings[0])
+
+        for postings in group_postings[1:]:
+            scores = {
+                series_id: score + postings[series_id]
+                for series_id, score in scores.items()
+                if series_id in postings
+            }
+
+        return scores
+
+    def _expand_prefix(self, partial: str) -> List[str]:
+        """Returns every indexed term starting with a prefix."""
+
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self.postings)
+            self._vocabulary_dirty = False
+
+        start = bisect.bisect_left(self._vocabulary, partial)
+        end = bisect.bisect_left(self._vocabulary, partial + '\uffff')
+
+        return self._vocabulary[start:end] or [stem(partial)]
+
+
+class SeriesIdIndex():
+
+    """
+    ## Overview:
+    ----
+    A suffix array over every known series ID, answering the substring
+    searches of `Series.series_search` with `search_type='series_id'`
+    locally. Matches are ordered by popularity. The index can be saved
+    to a flat binary file and memory mapped at startup, so loading it
+    costs next to nothing.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty `SeriesIdIndex` object, see `build` and `load`.
+
+        ### Usage
+        ----
+            >>> id_index = SeriesIdIndex.build(series_ids=['GDP', 'GNPCA'], popularity=[90, 60])
+            >>> id_index.search(search_text='GN')
+        """
+
+        self.text = b''
+        self.id_starts = array('i')
+        self.popularity = array('i')
+        self.suffixes = array('i')
+
+        self._mmap = None
+
+    def __repr__(self) -> str:
+        """String representation of the `SeriesIdIndex` object."""
+
+        # define the string representation
+        str_representation = '<SeriesIdIndex (series={series}, suffixes={suffixes})>'.format(
+            series=len(self),
+            suffixes=len(self.suffixes)
+        )
+
+        return str_representation
+
+    def __len__(self) -> int:
+        """Returns the number of indexed series IDs."""
+
+        return len(self.id_starts)
+
+    @classmethod
+    def build(cls, series_ids: List[str], popularity: List[int] = None) -> 'SeriesIdIndex':
+        """Builds the index from a list of series IDs.
+
+        ### Parameters
+        ----
+        series_ids : List[str]
+            The series IDs, usually from a catalog harvest.
+
+        popularity : List[int] (optional, Default=None)
+            The popularity of each series, used to order the matches.
+
+        ### Returns
+        ----
+        SeriesIdIndex:
+            The built index.
+        """
+
+        popularity = popularity or [0] * len(series_ids)
+        pairs = sorted(zip((value.upper() for value in series_ids), popularity))
+
+        id_index = cls()
+        id_index.popularity = array('i', [pair[1] for pair in pairs])
+
+        # IDs are separated by a newline so no suffix spans two IDs.
+        text = '\n'.join(pair[0] for pair in pairs) + '\n'
+        id_index.text = text.encode('ascii')
+
+        position = 0
+        for series_id, _ in pairs:
+            id_index.id_starts.append(position)
+            position += len(series_id) + 1
+
+        id_index.suffixes = cls._suffix_array(text=id_index.text)
+
+        return id_index
+
+    @staticmethod
+    def _suffix_array(text: bytes) -> array:
+        """Sorts the positions of every character of the IDs by the suffix of its ID, by prefix doubling.
+
+        ### Overview
+        ----
+        Positions are ranked by their first character, then by their first
+        2, 4, 8... characters from the ranks of the previous round, so only
+        integers are sorted and no suffix string is ever built. Each newline
+        gets its own rank below every character, ordered by position, so a
+        suffix ends with its ID and equal suffixes keep the order of their IDs.
+        """
+
+        size = len(text)
+        newlines = [index for index in range(size) if text[index] == 10]
+
+        rank = [len(newlines) + value for value in text]
+        for order, index in enumerate(newlines):
+            rank[index] = order
+
+        positions = sorted(range(size), key=rank.__getitem__)
+        span = 1
+
+        while span < size:
+            width = max(rank) + 2
+
+            def key(index: int) -> int:
+                return rank[index] * width + (rank[index + span] + 1 if index + span < size else 0)
+
+            positions.sort(key=key)
+            keys = [key(index) for index in positions]
+
+            # Positions sharing their first 2 * span characters share a rank.
+            new_rank = [0] * size
+            for order in range(1, size):
+                new_rank[positions[order]] = new_rank[positions[order - 1]] + (keys[order] != keys[order - 1])
+
+            rank = new_rank
+
+            if rank[positions[-1]] == size - 1:
+                break
+
+            span *= 2
+
+        return array('i', [index for index in positions if text[index] != 10])
+
+    @classmethod
+    def from_series(cls, series: List[Dict]) -> 'SeriesIdIndex':
+        """Builds the index from `Series` resources.
+
+        ### Parameters
+        ----
+        series : List[Dict]
+            The `Series` resources, as returned in the `seriess` collections.
+
+        ### Returns
+        ----
+        SeriesIdIndex:
+            The built index.
+        """
+
+        return cls.build(
+            series_ids=[item['id'] for item in series],
+            popularity=[int(item.get('popularity') or 0) for item in series]
+        )
+
+    def save(self, file_path: Union[str, pathlib.Path]) -> None:
+        """Saves the index to a flat binary file.
+
+        ### Parameters
+        ----
+        file_path : Union[str, pathlib.Path]
+            The path of the file.
+        """
+
+        with open(file=file_path, mode='wb') as index_file:
+            index_file.write(
+                ID_INDEX_HEADER.pack(
+                    ID_INDEX_MAGIC,
+                    len(self.id_starts),
+                    len(self.suffixes),
+                    len(self.text)
+                )
+            )
+            index_file.write(array('i', self.id_starts).tobytes())
+            index_file.write(array('i', self.popularity).tobytes())
+            index_file.write(array('i', self.suffixes).tobytes())
+            index_file.write(bytes(self.text))
+
+    @classmethod
+    def load(cls, file_path: Union[str, pathlib.Path]) -> 'SeriesIdIndex':
+        """Memory maps an index saved with `save`.
+
+        ### Parameters
+        ----
+        file_path : Union[str, pathlib.Path]
+            The path of the file.
+
+        ### Returns
+        ----
+        SeriesIdIndex:
+            The index, backed by the file.
+        """
+
+        with open(file=file_path, mode='rb') as index_file:
+            mapped = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, id_count, suffix_count, text_length = ID_INDEX_HEADER.unpack_from(mapped, 0)
+
+        if magic != ID_INDEX_MAGIC:
+            raise ValueError('{file_path} is not a series ID index.'.format(file_path=file_path))
+
+        view = memoryview(mapped)
+        start = ID_INDEX_HEADER.size
+        int_size = array('i').itemsize
+
+        def take(count: int) -> memoryview:
+            nonlocal start
+            section = view[start:start + count * int_size].cast('i')
+            start += count * int_size
+            return section
+
+        id_index = cls()
+        id_index.id_starts = take(id_count)
+        id_index.popularity = take(id_count)
+        id_index.suffixes = take(suffix_count)
+        id_index.text = view[start:start + text_length]
+        id_index._mmap = mapped
+
+        return id_index
+
+    def search(self, search_text: str, limit: int = 1000, prefix: bool = False) -> List[str]:
+        """Finds the series IDs containing a substring, most popular first.
+
+        ### Parameters
+        ----
+        search_text : str
+            The substring to look for, case insensitive.
+
+        limit : int (optional, Default=1000)
+            The maximum number of results to return.
+
+        prefix : bool (optional, Default=False)
+            Only match series IDs starting with the search text.
+
+        ### Returns
+        ----
+        List[str]:
+            The matching series IDs.
+        """
+
+        matches = self._match(search_text=search_text, prefix=prefix)
+        matches.sort(key=lambda id_number: (-self.popularity[id_number], id_number))
+
+        return [self._series_id(id_number) for id_number in matches[:limit]]
+
+    def series_search(self, search_text: str, offset: int = 0, limit: int = 1000) -> Dict:
+        """Searches the index, mirroring `Series.series_search` with `search_type='series_id'`.
+
+        ### Parameters
+        ----
+        search_text : str
+            The substring to look for, case insensitive.
+
+        offset : int (optional, Default=0)
+            Non-negative integer.
+
+        limit : int (optional, Default=1000)
+            The maximum number of results to return.
+
+        ### Returns
+        ----
+        Dict:
+            A collection of series IDs with their popularity.
+        """
+
+        matches = self._match(search_text=search_text, prefix=False)
+        matches.sort(key=lambda id_number: (-self.popularity[id_number], id_number))
+
+        return {
+            'order_by': 'popularity',
+            'sort_order': 'desc',
+            'count': len(matches),
+            'offset': offset,
+            'limit': limit,
+            'seriess': [
+                {
+                    'id': self._series_id(id_number),
+                    'popularity': self.popularity[id_number]
+                }
+                for id_number in matches[offset:offset + limit]
+            ]
+        }
+
+    def _match(self, search_text: str, prefix: bool) -> List[int]:
+        """Returns the numbers of the IDs matching the search text."""
+
+        needle = search_text.upper().encode('ascii', errors='ignore')
+        size = len(needle)
+
+        if not size:
+            return []
+
+        text = self.text
+        suffixes = self.suffixes
+
+        # Lower bound of the suffixes starting with the needle.
+        low, high = 0, len(suffixes)
+        while low < high:
+            middle = (low + high) // 2
+            if bytes(text[suffixes[middle]:suffixes[middle] + size]) < needle:
+                low = middle + 1
+            else:
+                high = middle
+        first = low
+
+        # Upper bound of the suffixes starting with the needle.
+        high = len(suffixes)
+        while low < high:
+            middle = (low + high) // 2
+            if bytes(text[suffixes[middle]:suffixes[middle] + size]) == needle:
+                low = middle + 1
+            else:
+                high = middle
+
+        id_starts = self.id_starts
+        matches = set()
+
+        for rank in range(first, low):
+            position = suffixes[rank]
+            id_number = bisect.bisect_right(id_starts, position) - 1
+            if not prefix or id_starts[id_number] == position:
+                matches.add(id_number)
+
+        return list(matches)
+
+    def _series_id(self, id_number: int) -> str:
+        """Returns the series ID stored under a number."""
+
+        start = self.id_starts[id_number]
+        end = self.id_starts[id_number + 1] - 1 if id_number + 1 < len(self.id_starts) else len(self.text) - 1
+
+        return bytes(self.text[start:end]).decode('ascii')
@@ -1,12 +1,20 @@
 from typing import Dict
 from typing import List
 from typing import Union
+from datetime import date
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from fred.session import FredSession
+from fred.transforms import UnitsTransformer
+from fred.transforms import UNITS
 
 # Used for type hinting
 todays_date = datetime.today().date().isoformat()
 
+# FRED rejects requests that carry too many vintage dates (and very long
+# query strings), so large vintage lists are split into chunks of this size.
+MAX_VINTAGE_DATES = 500
+
 
 class Series():
 
@@ -156,7 +164,9 @@ class Series():
         frequency: str = None,
         aggregation_method: str = 'avg',
         output_type: int = 1,
-        vintage_dates: Union[List[str], List[datetime]] = None
+        vintage_dates: Union[str, List[str], List[datetime]] = None,
+        vintage_chunk_size: int = MAX_VINTAGE_DATES,
+        max_workers: int = 4
     ) -> Dict:
         """Get the observations or data values for an economic data series.
 
@@ -215,11 +225,20 @@ class Series():
             3 = Observations by Vintage Date, New and Revised Observations Only
             4 = Observations, Initial Release Only
 
-        vintage_dates : Union[List[str], List[datetime]] (optional, Default=None)
-            A comma separated string of YYYY-MM-DD formatted dates in history (e.g. 2000-01-01,2005-02-24).
+        vintage_dates : Union[str, List[str], List[datetime]] (optional, Default=None)
+            A list of YYYY-MM-DD formatted dates in history (e.g. ['2000-01-01', '2005-02-24']).
             Vintage dates are used to download data as it existed on these specified dates in history.
             Vintage dates can be specified instead of a real-time period using realtime_start and
-            realtime_end.
+            realtime_end. A comma separated string is accepted too (e.g. '2000-01-01,2005-02-24').
+            Pass `'all'` to use every vintage date of the series.
+
+        vintage_chunk_size : int (optional, Default=500)
+            The maximum number of vintage dates sent in a single request. Larger
+            lists are split into chunks that are fetched concurrently and merged.
+            Must be at least 1.
+
+        max_workers : int (optional, Default=4)
+            The number of threads used to fetch the vintage date chunks.
 
         ### Returns
         -------
@@ -233,40 +252,239 @@ class Series():
             >>> series_service.get_series_observations(series_id='GNPCA')
         """
 
-        # Conver the date to proper formats.
-        if vintage_dates:
-            iso_dates = []
-            for date in vintage_dates:
-                if isinstance(date, datetime):
-                    iso_dates.append(date.date().isoformat())
-                else:
-                    iso_dates.append(iso_dates)
+        if vintage_chunk_size < 1:
+            raise ValueError('vintage_chunk_size must be at least 1, got {size}.'.format(size=vintage_chunk_size))
+
+        if vintage_dates == 'all':
+            vintage_dates = self._get_all_vintage_dates(series_id=series_id)
+        elif isinstance(vintage_dates, str):
+            vintage_dates = [value.strip() for value in vintage_dates.split(',') if value.strip()]
+
+        params = {
+            'series_id': series_id,
+            'api_key': self.fred_session.client._api_key,
+            'file_type': 'json',
+            'realtime_start': realtime_start,
+            'realtime_end': realtime_end,
+            'observation_start': observation_start,
+            'observation_end': observation_end,
+            'offset': offset,
+            'limit': limit,
+            'sort_order': sort_order,
+            'units': units,
+            'frequency': frequency,
+            'aggregation_method': aggregation_method,
+            'output_type': output_type,
+            'vintage_dates': None
+        }
+
+        if not vintage_dates:
+            return self.fred_session.make_request(
+                method='get',
+                endpoint=self.endpoint + '/observations',
+                params=params
+            )
+
+        # Convert the dates to proper formats.
+        iso_dates = []
+        for vintage_date in vintage_dates:
+            if isinstance(vintage_date, datetime):
+                iso_dates.append(vintage_date.date().isoformat())
+            elif isinstance(vintage_date, date):
+                iso_dates.append(vintage_date.isoformat())
+            else:
+                iso_dates.append(vintage_date)
+
+        # Split the dates into chunks FRED will accept.
+        chunks = [
+            iso_dates[index:index + vintage_chunk_size]
+            for index in range(0, len(iso_dates), vintage_chunk_size)
+        ]
+
+        def fetch_chunk(chunk: List[str]) -> Dict:
+            chunk_params = params.copy()
+            chunk_params['vintage_dates'] = ','.join(chunk)
+            return self.fred_session.make_request(
+                method='get',
+                endpoint=self.endpoint + '/observations',
+                params=chunk_params
+            )
+
+        if len(chunks) == 1:
+            return fetch_chunk(chunks[0])
+
+        # Every chunk is read whole, the offset and limit apply to the merged rows.
+        params['offset'] = None
+        params['limit'] = None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            contents = list(executor.map(fetch_chunk, chunks))
+
+        return self._merge_observations(contents=contents, sort_order=sort_order, offset=offset, limit=limit)
+
+    def get_series_observations_units(
+        self,
+        series_id: str,
+        units: List[str] = None,
+        frequency: str = None,
+        **kwargs
+    ) -> Dict[str, Dict]:
+        """Get the observations of a series under several units with a single request.
 
-            vintage_dates = ','.join(vintage_dates)
+        ### Overview
+        ----------
+        The observations are requested once with `lin` units and every other
+        unit is derived locally by the `UnitsTransformer`, saving one API call
+        per additional unit. The response must hold one row per date, so the
+        real-time period has to be a single one and at most one vintage date
+        can be requested, a `ValueError` is raised otherwise.
 
-        content = self.fred_session.make_request(
-            method='get',
-            endpoint=self.endpoint + '/observations',
-            params={
-                'series_id': series_id,
-                'api_key': self.fred_session.client._api_key,
-                'file_type': 'json',
-                'realtime_start': realtime_start,
-                'realtime_end': realtime_end,
-                'observation_start': observation_start,
-                'observation_end': observation_end,
-                'offset': offset,
-                'limit': limit,
-                'sort_order': sort_order,
-                'units': units,
-                'frequency': frequency,
-                'aggregation_method': aggregation_method,
-                'output_type': output_type,
-                'vintage_dates': vintage_dates
-            }
+        ### Parameters
+        ----------
+        series_id : str
+            The series ID you want to query.
+
+        units : List[str] (optional, Default=None)
+            The units to return, one or more of the following values: ['lin',
+            'chg', 'ch1', 'pch', 'pc1', 'pca', 'cch', 'cca', 'log']. All of
+            them are returned when not provided.
+
+        frequency : str (optional, Default=None)
+            An optional parameter that indicates a lower frequency to aggregate
+            values to, passed through to `get_series_observations`.
+
+        **kwargs : dict
+            Any other argument accepted by `get_series_observations`, except
+            `units`.
+
+        ### Returns
+        -------
+        Dict[str, Dict]
+            A collection of `Series` observations keyed by their units.
+
+        ### Usage
+        ----
+            >>> fred_client = FederalReserveClient(api_key='xxxxxx')
+            >>> series_service = fred_client.series()
+            >>> series_service.get_series_observations_units(
+                    series_id='GNPCA',
+                    units=['lin', 'pch', 'pc1']
+                )
+        """
+
+        content = self.get_series_observations(
+            series_id=series_id,
+            units='lin',
+            frequency=frequency,
+            **kwargs
         )
 
-        return content
+        transformer = UnitsTransformer(frequency=frequency)
+
+        return {
+            unit: transformer.transform_observations(content=content, units=unit)
+            for unit in (units or UNITS)
+        }
+
+    def _get_all_vintage_dates(self, series_id: str) -> List[str]:
+        """Grabs every vintage date for a series, following the pagination.
+
+        ### Parameters
+        ----------
+        series_id : str
+            The ID for a series.
+
+        ### Returns
+        -------
+        List[str]
+            The vintage dates in ascending order.
+        """
+
+        vintage_dates = []
+
+        while True:
+            content = self.get_series_vintage_dates(
+                series_id=series_id,
+                offset=len(vintage_dates),
+                limit=10000
+            )
+            page = content.get('vintage_dates', [])
+            vintage_dates.extend(page)
+
+            if not page or len(vintage_dates) >= content.get('count', 0):
+                break
+
+        return vintage_dates
+
+    def _merge_observations(
+        self,
+        contents: List[Dict],
+        sort_order: str = 'asc',
+        offset: int = 0,
+        limit: int = None
+    ) -> Dict:
+        """Merges the observation responses of several vintage date chunks.
+
+        ### Overview
+        ----------
+        Rows are keyed by their date and real-time period, so rows that show
+        up in more than one chunk are combined into one, including the
+        per-vintage columns returned by the vintage date output types.
+
+        ### Parameters
+        ----------
+        contents : List[Dict]
+            The responses returned for each chunk.
+
+        sort_order : str (optional, Default='asc')
+            The order of the merged observations, one of ['asc', 'desc'].
+
+        offset : int (optional, Default=0)
+            The number of merged observations skipped.
+
+        limit : int (optional, Default=None)
+            The maximum number of merged observations returned, all when not
+            provided.
+
+        ### Returns
+        -------
+        Dict
+            A single collection of `Series` observations, `count` being the
+            number of merged observations before the offset and limit.
+        """
+
+        merged_rows = {}
+
+        for content in contents:
+            for row in content.get('observations', []):
+                key = (
+                    row.get('date', ''),
+                    row.get('realtime_start', ''),
+                    row.get('realtime_end', '')
+                )
+                if key in merged_rows:
+                    merged_rows[key].update(row)
+                else:
+                    merged_rows[key] = dict(row)
+
+        observations = [
+            merged_rows[key] for key in sorted(
+                merged_rows, reverse=(sort_order == 'desc')
+            )
+        ]
+
+        offset = offset or 0
+        end = None if limit is None else offset + limit
+
+        merged = dict(contents[0])
+        merged['count'] = len(observations)
+        merged['offset'] = offset
+        merged['observations'] = observations[offset:end]
+
+        if limit is not None:
+            merged['limit'] = limit
+
+        return merged
 
     def get_series_release(
         self,
@@ -1,11 +1,21 @@
 import json
+import time
+import contextlib
 import requests
 import logging
 import pathlib
 
 from typing import Dict
+from typing import Iterator
+from typing import Tuple
 from datetime import datetime
-from datetime import date
+from fred.limiter import RateLimiter
+from fred.scheduler import PRIORITIES
+from fred.scheduler import PriorityScheduler
+from fred.breaker import CircuitBreaker
+from fred.breaker import CircuitBreakers
+from fred.breaker import CircuitOpenError
+from fred.profiler import SessionProfiler
 
 
 class FredSession():
@@ -44,6 +54,24 @@ class FredSession():
         self.client: FederalReserveClient = client
         self.resource = 'https://api.stlouisfed.org/fred'
 
+        # Shared by every request, set it to `None` to disable rate limiting.
+        self.rate_limiter: RateLimiter = RateLimiter()
+
+        # Orders the requests waiting for the limiter, set it to `None` to serve them as they come.
+        self.scheduler: PriorityScheduler = PriorityScheduler()
+
+        # Fail fast per endpoint group while FRED is degraded, set it to `None` to disable.
+        self.circuit_breakers: CircuitBreakers = CircuitBreakers()
+
+        # The seconds to wait for FRED to connect and to answer.
+        self.timeout: float = 30.0
+
+        # Records the phases of each request while profiling, see `profile`.
+        self.profiler: SessionProfiler = None
+
+        # A local `FredMirror` answering metadata requests, see `FederalReserveClient.mirror`.
+        self.mirror = None
+
         if not pathlib.Path('logs').exists():
             pathlib.Path('logs').mkdir()
             pathlib.Path('logs/fred_api_log.log').touch()
@@ -87,7 +115,8 @@ class FredSession():
         endpoint: str,
         params: dict = None,
         data: dict = None,
-        json_payload: dict = None
+        json_payload: dict = None,
+        priority: str = None
     ) -> Dict:
         """Handles all the requests in the library.
 
@@ -106,7 +135,7 @@ class FredSession():
         endpoint : str
             The API URL endpoint.
 
-        params : dict (optional, Default=None) 
+        params : dict (optional, Default=None)
             The URL params for the request.
 
         data : dict (optional, Default=None)
@@ -115,11 +144,18 @@ class FredSession():
         json : dict (optional, Default=None)
             A json data payload for a request
 
+        priority : str (optional, Default=None)
+            Either 'interactive' or 'background', the priority set
+            with `fred.scheduler.priority` when not provided.
+
         ### Returns:
         ----
             A Dictionary object containing the JSON values.
         """
 
+        if priority is not None and priority not in PRIORITIES:
+            raise ValueError('Priority must be one of {priorities}.'.format(priorities=PRIORITIES))
+
         # Build the URL.
         url = self.build_url(endpoint=endpoint)
 
@@ -127,6 +163,74 @@ class FredSession():
             "URL: {url}".format(url=url)
         )
 
+        self._normalize_params(params=params)
+
+        # Keep the profiler of this request, even if the block ends meanwhile.
+        profiler = self.profiler
+
+        # Answer from the local mirror when it holds the data.
+        content = self._from_mirror(profiler=profiler, endpoint=endpoint, params=params)
+        if content is not None:
+            return content
+
+        params_cleaned = params.copy()
+        params_cleaned['api_key'] = 'xxxxxxxx'
+
+        logging.info(
+            "PARAMS: {params}".format(params=params_cleaned)
+        )
+
+        # Fail fast, or fall back to the last response, while the endpoint's group is failing.
+        circuit_breaker = None
+        admission = None
+        if self.circuit_breakers is not None:
+            circuit_breaker = self.circuit_breakers.breaker(endpoint=endpoint)
+            admission = circuit_breaker.allow()
+            if admission is None:
+                return self._fall_back(profiler=profiler, endpoint=endpoint, params=params)
+
+        # The seconds spent in each phase, and the clock at each step of the request.
+        phases = {}
+        timings = {}
+
+        # Whether FRED failed the request, for the breaker, None when it never reached FRED.
+        failed = None
+
+        try:
+            response, response_bytes = self._send(
+                request=requests.Request(method=method.upper(), url=url, params=params, data=data, json=json_payload),
+                priority=priority,
+                profiler=profiler,
+                phases=phases,
+                timings=timings
+            )
+
+            # Server errors and throttling count against the breaker, bad requests do not.
+            failed = response.status_code >= 500 or response.status_code == 429
+
+        except Exception as error:
+            if isinstance(error, requests.RequestException) and 'started' in timings:
+                failed = True
+            self._profile_call(profiler=profiler, endpoint=endpoint, phases=phases, timings=timings, status='failed')
+            raise
+
+        finally:
+            if circuit_breaker is not None:
+                self._settle(circuit_breaker=circuit_breaker, admission=admission, timings=timings, failed=failed)
+
+        return self._read_response(
+            response=response,
+            response_bytes=response_bytes,
+            endpoint=endpoint,
+            params=params,
+            profiler=profiler,
+            phases=phases,
+            timings=timings
+        )
+
+    def _normalize_params(self, params: dict) -> None:
+        """Converts the dates and tag lists of the URL params to the strings FRED expects."""
+
         if 'realtime_start' in params and isinstance(params['realtime_start'], datetime):
             params['realtime_start'] = params['realtime_start'].date().isoformat()
 
@@ -143,45 +247,168 @@ class FredSession():
                 lst=params['exclude_tag_names']))
             params['exclude_tag_names'] = ';'.join(params['exclude_tag_names'])
 
-        params_cleaned = params.copy()
-        params_cleaned['api_key'] = 'xxxxxxxx'
+    def _from_mirror(self, profiler: SessionProfiler, endpoint: str, params: dict) -> Dict:
+        """Returns the mirror's answer, None when there is no mirror or it does not hold the data."""
 
-        logging.info(
-            "PARAMS: {params}".format(params=params_cleaned)
-        )
+        if self.mirror is None:
+            return None
+
+        content = self.mirror.answer(endpoint=endpoint, params=params)
+
+        if content is not None:
+            logging.info('Answered from the mirror.')
+            self._profile_call(profiler=profiler, endpoint=endpoint, phases={}, timings={}, status='mirror')
+
+        return content
+
+    def _fall_back(self, profiler: SessionProfiler, endpoint: str, params: dict) -> Dict:
+        """Returns the last response remembered by the open breaker, or raises `CircuitOpenError`."""
+
+        try:
+            content = self.circuit_breakers.fallback(endpoint=endpoint, params=params)
+        except CircuitOpenError:
+            self._profile_call(profiler=profiler, endpoint=endpoint, phases={}, timings={}, status='failed')
+            raise
+
+        self._profile_call(profiler=profiler, endpoint=endpoint, phases={}, timings={}, status='fallback')
+
+        return content
+
+    def _send(
+        self,
+        request: requests.Request,
+        priority: str,
+        profiler: SessionProfiler,
+        phases: Dict[str, float],
+        timings: Dict[str, float]
+    ) -> Tuple[requests.Response, int]:
+        """Waits for the limiter, then sends the request and reads its body.
+
+        ### Overview
+        ----
+        The seconds waited and spent resolving the host are added to `phases`,
+        and the clock when the request left, its first byte arrived and its
+        body was read are added to `timings`.
+
+        ### Returns
+        ----
+        Tuple[requests.Response, int]:
+            The response and the size of its body.
+        """
+
+        # Wait for our turn under FRED's rate limit.
+        if self.scheduler is not None:
+            phases['limiter_wait'] = self.scheduler.acquire(rate_limiter=self.rate_limiter, priority=priority)
+        elif self.rate_limiter is not None:
+            phases['limiter_wait'] = self.rate_limiter.acquire()
+
+        if profiler is not None:
+            phases['dns'] = profiler.resolve(url=request.url)
 
         # Define a new session.
         request_session = requests.Session()
         request_session.verify = True
 
         # Define a new request.
-        request_request = requests.Request(
-            method=method.upper(),
-            url=url,
-            params=params,
-            data=data,
-            json=json_payload
-        ).prepare()
+        request_request = request.prepare()
 
         # Send the request.
-        response: requests.Response = request_session.send(
-            request=request_request
-        )
+        timings['started'] = time.monotonic()
+
+        try:
+            # Streaming when profiling separates the first byte from the body transfer.
+            response: requests.Response = request_session.send(
+                request=request_request,
+                timeout=self.timeout,
+                stream=profiler is not None
+            )
+            timings['first_byte'] = time.monotonic()
+
+            # Read the body before the session closes.
+            response_bytes = len(response.content)
+            timings['transferred'] = time.monotonic()
+        finally:
+            # Close the session.
+            request_session.close()
+
+        return response, response_bytes
+
+    def _settle(self, circuit_breaker: CircuitBreaker, admission: tuple, timings: Dict[str, float], failed: bool) -> None:
+        """Reports the outcome of an admitted request to its breaker."""
+
+        if failed is None:
+            # Never reached FRED, which says nothing about its health.
+            circuit_breaker.release(admission=admission)
+        else:
+            circuit_breaker.record(seconds=time.monotonic() - timings['started'], failed=failed, admission=admission)
+
+    def _profile_call(
+        self,
+        profiler: SessionProfiler,
+        endpoint: str,
+        phases: Dict[str, float],
+        timings: Dict[str, float],
+        status: str,
+        response_bytes: int = 0
+    ) -> None:
+        """Records a request with the profiler, with the phases it reached."""
+
+        if profiler is None:
+            return
 
-        # Close the session.
-        request_session.close()
+        if 'started' in timings:
+            # A request failing in flight spent the rest of its time waiting for FRED.
+            first_byte = timings.get('first_byte', time.monotonic())
+            phases['first_byte'] = first_byte - timings['started']
+
+        if 'transferred' in timings:
+            phases['transfer'] = timings['transferred'] - timings['first_byte']
+
+        if 'decoded' in timings:
+            phases['decode'] = timings['decoded'] - timings['transferred']
+
+        profiler.record(endpoint=endpoint, phases=phases, response_bytes=response_bytes, status=status)
+
+    def _read_response(
+        self,
+        response: requests.Response,
+        response_bytes: int,
+        endpoint: str,
+        params: dict,
+        profiler: SessionProfiler,
+        phases: Dict[str, float],
+        timings: Dict[str, float]
+    ) -> Dict:
+        """Decodes a response FRED answered, or logs and raises its error."""
 
         # If it's okay and no details.
-        if response.ok and len(response.content) > 0:
-            return response.json()
+        if response.ok and response_bytes > 0:
+            content = response.json()
+            timings['decoded'] = time.monotonic()
+
+            self._profile_call(
+                profiler=profiler,
+                endpoint=endpoint,
+                phases=phases,
+                timings=timings,
+                status='success',
+                response_bytes=response_bytes
+            )
 
-        elif len(response.content) > 0 and response.ok:
-            return {
-                'message': 'response successful',
-                'status_code': response.status_code
-            }
+            if self.circuit_breakers is not None:
+                self.circuit_breakers.remember(endpoint=endpoint, params=params, content=response.content)
+            return content
+
+        self._profile_call(
+            profiler=profiler,
+            endpoint=endpoint,
+            phases=phases,
+            timings=timings,
+            status='success' if response.ok else 'failed',
+            response_bytes=response_bytes
+        )
 
-        elif not response.ok:
+        if not response.ok:
 
             # Define the error dict.
             error_dict = {
@@ -198,3 +425,61 @@ class FredSession():
             )
 
             raise requests.HTTPError()
+
+    def health(self) -> Dict:
+        """Returns the health of the session's circuit breakers, for a load balancer check.
+
+        ### Returns
+        ----
+        Dict:
+            `healthy` is False while the breaker of any endpoint group is open.
+
+        ### Usage
+        ----
+            >>> fred_client = FederalReserveClient(api_key='xxxxxx')
+            >>> fred_client.fred_session.health()
+        """
+
+        if self.circuit_breakers is None:
+            return {'healthy': True, 'degraded': False, 'groups': {}}
+
+        return self.circuit_breakers.health()
+
+    @contextlib.contextmanager
+    def profile(self, cprofile: bool = False, memory: bool = False, top: int = 15) -> Iterator[SessionProfiler]:
+        """Profiles the requests made inside the block.
+
+        ### Parameters
+        ----
+        cprofile : bool (optional, Default=False)
+            Whether to run cProfile on the calling thread.
+
+        memory : bool (optional, Default=False)
+            Whether to trace the memory allocated inside the block.
+
+        top : int (optional, Default=15)
+            The number of functions and allocation sites in the report.
+
+        ### Returns
+        ----
+        Iterator[SessionProfiler]:
+            The profiler, whose `report` and `format_report` summarize the block.
+
+        ### Usage
+        ----
+            >>> fred_client = FederalReserveClient(api_key='xxxxxx')
+            >>> series_services = fred_client.series()
+            >>> with fred_client.fred_session.profile(cprofile=True) as profiler:
+                    series_services.get_series_observations(series_id='GNPCA')
+            >>> print(profiler.format_report())
+        """
+
+        profiler = SessionProfiler(cprofile=cprofile, memory=memory, top=top)
+        profiler.start()
+        self.profiler = profiler
+
+        try:
+            yield profiler
+        finally:
+            self.profiler = None
+            profiler.stop()
@@ -0,0 +1,384 @@
+import json
+import bisect
+import pathlib
+import threading
+
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Union
+from datetime import date
+from fred.paginator import Paginator
+
+
+class SourceCatalog():
+
+    """
+    ## Overview:
+    ----
+    A snapshot of every FRED source, every release and which source
+    publishes which release. The bipartite mapping is stored as two compact
+    adjacency arrays, one sorted by source and one by release, so
+    source to releases and release to sources lookups are binary searches
+    served from memory. The snapshot is refreshed incrementally from the
+    real-time periods of the source and release listings.
+    """
+
+    def __init__(
+        self,
+        sources: Dict[int, Dict],
+        releases: Dict[int, Dict],
+        releases_by_source: Dict[int, Iterable[int]]
+    ) -> None:
+        """Initializes the `SourceCatalog` object, see `crawl` and `load`.
+
+        ### Parameters
+        ----
+        sources : Dict[int, Dict]
+            The sources, keyed by ID.
+
+        releases : Dict[int, Dict]
+            The releases, keyed by ID.
+
+        releases_by_source : Dict[int, Iterable[int]]
+            The release IDs of each source.
+
+        ### Usage
+        ----
+            >>> fred_client = FederalReserveClient(api_key='xxxxxx')
+            >>> source_catalog = SourceCatalog.crawl(paginator=fred_client.paginator())
+            >>> source_catalog.source_releases(source_id=1)
+            >>> source_catalog.release_sources(release_id=53)
+        """
+
+        self.sources = sources
+        self.releases = releases
+        self.last_refresh: date = None
+
+        self._lock = threading.RLock()
+        self._build(releases_by_source=releases_by_source)
+
+    def __repr__(self) -> str:
+        """String representation of the `SourceCatalog` object."""
+
+        # define the string representation
+        str_representation = '<SourceCatalog (sources={sources}, releases={releases}, links={links})>'.format(
+            sources=len(self.sources),
+            releases=len(self.releases),
+            links=len(self.source_members)
+        )
+
+        return str_representation
+
+    @classmethod
+    def crawl(cls, paginator: Paginator, max_workers: int = 8) -> 'SourceCatalog':
+        """Crawls every source and the releases of each source concurrently.
+
+        ### Parameters
+        ----
+        paginator : Paginator
+            The `Paginator` used to walk the listings.
+
+        max_workers : int (optional, Default=8)
+            The number of sources crawled concurrently.
+
+        ### Returns
+        ----
+        SourceCatalog:
+            The catalog.
+        """
+
+        today = date.today()
+        sources = {int(source['id']): source for source in paginator.sources()}
+
+        releases = {}
+        releases_by_source = cls._fetch_source_releases(
+            paginator=paginator,
+            source_ids=list(sources),
+            releases=releases,
+            max_workers=max_workers
+        )
+
+        source_catalog = cls(sources=sources, releases=releases, releases_by_source=releases_by_source)
+        source_catalog.last_refresh = today
+
+        return source_catalog
+
+    def refresh(
+        self,
+        paginator: Paginator,
+        realtime_start: Union[str, date] = None,
+        realtime_end: Union[str, date] = None,
+        max_workers: int = 8
+    ) -> Dict[str, List[int]]:
+        """Applies the changes made to sources and releases during a real-time period.
+
+        ### Overview
+        ----
+        The source and release listings are fetched for the real-time period,
+        which costs a page or two each. Items whose `realtime_start` falls
+        after the start of the period are new or changed: the releases of
+        changed sources and the sources of changed releases are fetched
+        again. Items missing from the listings are dropped.
+
+        ### Parameters
+        ----
+        paginator : Paginator
+            The `Paginator` used to walk the listings.
+
+        realtime_start : Union[str, date] (optional, Default=None)
+            The start of the period, the last refresh when not provided.
+
+        realtime_end : Union[str, date] (optional, Default=None)
+            The end of the period, today when not provided.
+
+        max_workers : int (optional, Default=8)
+            The number of items fetched concurrently.
+
+        ### Returns
+        ----
+        Dict[str, List[int]]:
+            The IDs of the changed and removed sources and releases.
+        """
+
+        today = date.today()
+        since = self._to_iso(value=realtime_start or self.last_refresh or today)
+        until = self._to_iso(value=realtime_end or today)
+
+        sources = {
+            int(source['id']): source
+            for source in paginator.sources(realtime_start=since, realtime_end=until)
+        }
+        releases = {
+            int(release['id']): release
+            for release in paginator.releases(realtime_start=since, realtime_end=until)
+        }
+
+        changed_sources = sorted(
+            source_id for source_id, source in sources.items()
+            if source_id not in self.sources or source.get('realtime_start', since) > since
+        )
+        changed_releases = sorted(
+            release_id for release_id, release in releases.items()
+            if release_id not in self.releases or release.get('realtime_start', since) > since
+        )
+        removed_sources = sorted(set(self.sources) - set(sources))
+        removed_releases = sorted(set(self.releases) - set(releases))
+
+        with self._lock:
+            releases_by_source = {
+                source_id: set(self.source_releases(source_id=source_id))
+                for source_id in self.sources if source_id in sources
+            }
+
+        fetched = self._fetch_source_releases(
+            paginator=paginator,
+            source_ids=changed_sources,
+            releases={},
+            max_workers=max_workers
+        )
+        for source_id, release_ids in fetched.items():
+            releases_by_source[source_id] = set(release_ids)
+
+        def fetch_sources(release_id: int) -> List[int]:
+            content = paginator.releases_service.get_release_sources(
+                release_id=str(release_id),
+                realtime_start=since,
+                realtime_end=until
+            )
+            return [int(source['id']) for source in content.get('sources', [])]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            release_sources = dict(zip(changed_releases, executor.map(fetch_sources, changed_releases)))
+
+        for release_id, source_ids in release_sources.items():
+            for release_ids in releases_by_source.values():
+                release_ids.discard(release_id)
+            for source_id in source_ids:
+                releases_by_source.setdefault(source_id, set()).add(release_id)
+
+        for release_ids in releases_by_source.values():
+            release_ids.difference_update(removed_releases)
+
+        with self._lock:
+            self.sources = sources
+            self.releases = releases
+            self._build(releases_by_source=releases_by_source)
+            self.last_refresh = today
+
+        return {
+            'changed_sources': changed_sources,
+            'changed_releases': changed_releases,
+            'removed_sources': removed_sources,
+            'removed_releases': removed_releases
+        }
+
+    def source_releases(self, source_id: int) -> List[int]:
+        """Returns the IDs of the releases of a source, like `Sources.get_source_releases`."""
+
+        return self._lookup(
+            keys=self.source_ids,
+            offsets=self.source_offsets,
+            members=self.source_members,
+            key=int(source_id)
+        )
+
+    def release_sources(self, release_id: int) -> List[int]:
+        """Returns the IDs of the sources of a release, like `Releases.get_release_sources`."""
+
+        return self._lookup(
+            keys=self.release_ids,
+            offsets=self.release_offsets,
+            members=self.release_members,
+            key=int(release_id)
+        )
+
+    def get_source_releases(self, source_id: int) -> Dict:
+        """Returns the releases of a source in the shape of `Sources.get_source_releases`."""
+
+        releases = [
+            self.releases.get(release_id, {'id': release_id})
+            for release_id in self.source_releases(source_id=source_id)
+        ]
+
+        return {'count': len(releases), 'offset': 0, 'limit': len(releases), 'releases': releases}
+
+    def get_release_sources(self, release_id: int) -> Dict:
+        """Returns the sources of a release in the shape of `Releases.get_release_sources`."""
+
+        sources = [
+            self.sources.get(source_id, {'id': source_id})
+            for source_id in self.release_sources(release_id=release_id)
+        ]
+
+        return {'sources': sources}
+
+    def save(self, file_path: Union[str, pathlib.Path]) -> None:
+        """Saves the catalog to a JSON file.
+
+        ### Parameters
+        ----
+        file_path : Union[str, pathlib.Path]
+            The path of the file.
+        """
+
+        with open(file=file_path, mode='w', encoding='utf-8') as catalog_file:
+            json.dump(
+                obj={
+                    'last_refresh': self.last_refresh.isoformat() if self.last_refresh else None,
+                    'sources': self.sources,
+                    'releases': self.releases,
+                    'source_ids': self.source_ids.tolist(),
+                    'offsets': self.source_offsets.tolist(),
+                    'members': self.source_members.tolist()
+                },
+                fp=catalog_file
+            )
+
+    @classmethod
+    def load(cls, file_path: Union[str, pathlib.Path]) -> 'SourceCatalog':
+        """Loads a catalog saved with `save`.
+
+        ### Parameters
+        ----
+        file_path : Union[str, pathlib.Path]
+            The path of the file.
+
+        ### Returns
+        ----
+        SourceCatalog:
+            The catalog.
+        """
+
+        with open(file=file_path, mode='r', encoding='utf-8') as catalog_file:
+            content = json.load(fp=catalog_file)
+
+        offsets, members = content['offsets'], content['members']
+        releases_by_source = {
+            source_id: members[offsets[position]:offsets[position + 1]]
+            for position, source_id in enumerate(content['source_ids'])
+        }
+
+        source_catalog = cls(
+            sources={int(source_id): source for source_id, source in content['sources'].items()},
+            releases={int(release_id): release for release_id, release in content['releases'].items()},
+            releases_by_source=releases_by_source
+        )
+
+        if content['last_refresh']:
+            source_catalog.last_refresh = date.fromisoformat(content['last_refresh'])
+
+        return source_catalog
+
+    def _build(self, releases_by_source: Dict[int, Iterable[int]]) -> None:
+        """Lays the mapping out as adjacency arrays in both directions."""
+
+        pairs = sorted(
+            (int(source_id), int(release_id))
+            for source_id, release_ids in releases_by_source.items()
+            for release_id in set(release_ids)
+        )
+
+        self.source_ids, self.source_offsets, self.source_members = self._adjacency(pairs=pairs)
+        self.release_ids, self.release_offsets, self.release_members = self._adjacency(
+            pairs=sorted((release_id, source_id) for source_id, release_id in pairs)
+        )
+
+    @staticmethod
+    def _adjacency(pairs: List[tuple]) -> tuple:
+        """Builds the keys, offsets and members arrays of sorted (key, member) pairs."""
+
+        keys, offsets, members = array('i'), array('i', [0]), array('i')
+
+        for key, member in pairs:
+            if not keys or keys[-1] != key:
+                if keys:
+                    offsets.append(len(members))
+                keys.append(key)
+            members.append(member)
+
+        if keys:
+            offsets.append(len(members))
+
+        return keys, offsets, members
+
+    @staticmethod
+    def _lookup(keys: array, offsets: array, members: array, key: int) -> List[int]:
+        """Binary searches the keys and returns the members of one."""
+
+        position = bisect.bisect_left(keys, key)
+
+        if position == len(keys) or keys[position] != key:
+            return []
+
+        return members[offsets[position]:offsets[position + 1]].tolist()
+
+    @staticmethod
+    def _fetch_source_releases(
+        paginator: Paginator,
+        source_ids: List[int],
+        releases: Dict[int, Dict],
+        max_workers: int
+    ) -> Dict[int, List[int]]:
+        """Fetches the releases of sources concurrently, collecting their metadata."""
+
+        def fetch_releases(source_id: int) -> List[Dict]:
+            return paginator.source_releases(source_id=source_id, collect=True)
+
+        releases_by_source = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for source_id, items in zip(source_ids, executor.map(fetch_releases, source_ids)):
+                releases_by_source[source_id] = [int(release['id']) for release in items]
+                for release in items:
+                    releases[int(release['id'])] = release
+
+        return releases_by_source
+
+    @staticmethod
+    def _to_iso(value: Union[str, date]) -> str:
+        """Converts a date to a YYYY-MM-DD string."""
+
+        return value.isoformat() if isinstance(value, date) else value
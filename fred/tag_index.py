@@ -0,0 +1,463 @@
+import json
+import pathlib
+
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Union
+from fred.bitmap import ChunkedBitmap
+from fred.series import Series
+
+# The attributes `order_by` accepts, as in `Tags.get_related_tags`.
+TAG_ORDER_BY = ['series_count', 'popularity', 'created', 'name', 'group_id']
+
+
+def split_tag_names(tag_names: Union[str, List[str]]) -> List[str]:
+    """Accepts tag names as a list or as the semicolon separated string of the API."""
+
+    if not tag_names:
+        return []
+    elif isinstance(tag_names, str):
+        return [name for name in tag_names.split(';') if name]
+
+    return list(tag_names)
+
+
+class TagIndex():
+
+    """
+    ## Overview:
+    ----
+    A local series by tag incidence index, built from harvested
+    `Series.get_series_tags` responses. Each tag keeps a compressed bitmap
+    of the series ordinals carrying it, so `tag_names`/`exclude_tag_names`
+    filters are AND/ANDNOT of bitmaps. Related tags with their series counts
+    and filtered, paged series listings are then answered locally instead of
+    with a round trip to `/related_tags`, `/tags/series`,
+    `/series/search/related_tags`, `/release/related_tags` or
+    `/category/related_tags`.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the `TagIndex` object.
+
+        ### Usage
+        ----
+            >>> fred_client = FederalReserveClient(api_key='xxxxxx')
+            >>> tag_index = TagIndex.harvest(
+                    series_ids=['GNPCA', 'UNRATE'],
+                    series_service=fred_client.series()
+                )
+            >>> tag_index.get_related_tags(tag_names=['usa'])
+        """
+
+        self.series_ids: List[str] = []
+        self.ordinals: Dict[str, int] = {}
+
+        # The attributes of each tag, as returned by the API.
+        self.tags: Dict[str, Dict] = {}
+
+        self.postings: Dict[str, ChunkedBitmap] = {}
+        self.series_tags: Dict[int, List[str]] = {}
+        self.universe = ChunkedBitmap()
+
+    def __repr__(self) -> str:
+        """String representation of the `TagIndex` object."""
+
+        # define the string representation
+        str_representation = '<TagIndex (series={series}, tags={tags})>'.format(
+            series=len(self.series_ids),
+            tags=len(self.tags)
+        )
+
+        return str_representation
+
+    @classmethod
+    def harvest(
+        cls,
+        series_ids: Iterable[str],
+        series_service: Series,
+        max_workers: int = 8
+    ) -> 'TagIndex':
+        """Fetches the tags of every series concurrently.
+
+        ### Parameters
+        ----
+        series_ids : Iterable[str]
+            The series to index, for example from a `BulkHarvester` resolver.
+
+        series_service : Series
+            The `Series` service, or a cache in front of it.
+
+        max_workers : int (optional, Default=8)
+            The number of series fetched concurrently.
+
+        ### Returns
+        ----
+        TagIndex:
+            The index.
+        """
+
+        tag_index = cls()
+
+        def fetch_tags(series_id: str) -> List[Dict]:
+            return series_service.get_series_tags(series_id=series_id).get('tags', [])
+
+        series_ids = list(series_ids)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for series_id, tags in zip(series_ids, executor.map(fetch_tags, series_ids)):
+                tag_index.add_series_tags(series_id=series_id, tags=tags)
+
+        return tag_index
+
+    def add_series_tags(self, series_id: str, tags: List[Dict]) -> None:
+        """Adds or replaces the tags of a series.
+
+        ### Parameters
+        ----
+        series_id : str
+            The ID of the series.
+
+        tags : List[Dict]
+            The `tags` collection of `Series.get_series_tags`.
+        """
+
+        ordinal = self.ordinals.get(series_id)
+
+        if ordinal is None:
+            ordinal = len(self.series_ids)
+            self.ordinals[series_id] = ordinal
+            self.series_ids.append(series_id)
+            self.universe.add(ordinal)
+        else:
+            for name in self.series_tags.get(ordinal, []):
+                self.postings[name].discard(ordinal)
+
+        names = []
+
+        for tag in tags:
+            name = tag['name']
+            self.tags[name] = {
+                key: value for key, value in tag.items() if key != 'series_count'
+            }
+            self.postings.setdefault(name, ChunkedBitmap()).add(ordinal)
+            names.append(name)
+
+        self.series_tags[ordinal] = names
+
+    def get_series_tags(self, series_id: str) -> List[str]:
+        """Returns the tag names of a series."""
+
+        return list(self.series_tags.get(self.ordinals[series_id], []))
+
+    def matching_series(
+        self,
+        tag_names: List[str] = None,
+        exclude_tag_names: List[str] = None,
+        series_ids: Iterable[str] = None
+    ) -> ChunkedBitmap:
+        """Returns the ordinals of the series carrying every tag of a set and none of another.
+
+        ### Parameters
+        ----
+        tag_names : List[str] (optional, Default=None)
+            The tags every series must have.
+
+        exclude_tag_names : List[str] (optional, Default=None)
+            The tags no series may have.
+
+        series_ids : Iterable[str] (optional, Default=None)
+            Restricts the universe, for example to the series of a release,
+            a category or a search.
+
+        ### Returns
+        ----
+        ChunkedBitmap:
+            The series ordinals, a bitmap the caller owns.
+        """
+
+        matching = self._matching_series(
+            tag_names=tag_names,
+            exclude_tag_names=exclude_tag_names,
+            series_ids=series_ids
+        )
+
+        # A single tag or no tag at all leaves the index's own bitmap.
+        if matching is self.universe or any(matching is posting for posting in self.postings.values()):
+            matching = matching.copy()
+
+        return matching
+
+    def _matching_series(
+        self,
+        tag_names: List[str] = None,
+        exclude_tag_names: List[str] = None,
+        series_ids: Iterable[str] = None
+    ) -> ChunkedBitmap:
+        """Same as `matching_series`, but may return a bitmap of the index, which must not be changed."""
+
+        tag_names = split_tag_names(tag_names=tag_names)
+        exclude_tag_names = split_tag_names(tag_names=exclude_tag_names)
+
+        if series_ids is not None:
+            matching = ChunkedBitmap(
+                self.ordinals[series_id] for series_id in series_ids if series_id in self.ordinals
+            )
+        else:
+            matching = None
+
+        # AND the rarest tags first, the running bitmap only shrinks.
+        for name in sorted(tag_names, key=lambda name: len(self.postings.get(name, ChunkedBitmap()))):
+            posting = self.postings.get(name, ChunkedBitmap())
+            matching = posting if matching is None else matching & posting
+            if not matching:
+                return ChunkedBitmap()
+
+        if matching is None:
+            matching = self.universe
+
+        for name in exclude_tag_names:
+            if name in self.postings:
+                matching = matching - self.postings[name]
+
+        return matching
+
+    def get_related_tags(
+        self,
+        tag_names: List[str],
+        exclude_tag_names: List[str] = None,
+        tag_group_id: str = None,
+        search_text: str = None,
+        series_ids: Iterable[str] = None,
+        order_by: str = 'series_count',
+        sort_order: str = 'asc',
+        offset: int = 0,
+        limit: int = 1000
+    ) -> Dict:
+        """Local version of `Tags.get_related_tags`.
+
+        ### Overview
+        ----
+        The related tags are the other tags of the series that have every
+        tag in `tag_names` and none in `exclude_tag_names`, with the number
+        of those series carrying each of them.
+
+        ### Parameters
+        ----
+        tag_names : List[str]
+            The tags every series must have.
+
+        exclude_tag_names : List[str] (optional, Default=None)
+            The tags no series may have.
+
+        tag_group_id : str (optional, Default=None)
+            Only return tags of a group, one of: ['freq', 'gen', 'geo',
+            'geot', 'rls', 'seas', 'src'].
+
+        search_text : str (optional, Default=None)
+            Only return tags whose name contains every word of the text.
+
+        series_ids : Iterable[str] (optional, Default=None)
+            Restricts the universe, which gives the release, category and
+            series search variants of the endpoint.
+
+        order_by : str (optional, Default='series_count')
+            One of: ['series_count', 'popularity', 'created', 'name', 'group_id'].
+
+        sort_order : str (optional, Default='asc')
+            One of: ['asc', 'desc'].
+
+        offset : int (optional, Default=0)
+            Non-negative integer.
+
+        limit : int (optional, Default=1000)
+            The maximum number of tags returned.
+
+        ### Returns
+        ----
+        Dict:
+            A collection of tags, in the shape of the API response.
+        """
+
+        if order_by not in TAG_ORDER_BY:
+            raise ValueError('order_by must be one of {options}.'.format(options=TAG_ORDER_BY))
+
+        matching = self._matching_series(
+            tag_names=tag_names,
+            exclude_tag_names=exclude_tag_names,
+            series_ids=series_ids
+        )
+
+        counts = self._count_tags(matching=matching)
+        for name in split_tag_names(tag_names=tag_names) + split_tag_names(tag_names=exclude_tag_names):
+            counts.pop(name, None)
+
+        words = search_text.lower().split() if search_text else []
+
+        tags = []
+        for name, series_count in counts.items():
+            tag = self.tags[name]
+            if tag_group_id and tag.get('group_id') != tag_group_id:
+                continue
+            if words and not all(word in name for word in words):
+                continue
+            tags.append(dict(tag, series_count=series_count))
+
+        missing = 0 if order_by in ('series_count', 'popularity') else ''
+        tags.sort(
+            key=lambda tag: (tag.get(order_by) or missing, tag['name']),
+            reverse=sort_order == 'desc'
+        )
+
+        return {
+            'order_by': order_by,
+            'sort_order': sort_order,
+            'count': len(tags),
+            'offset': offset,
+            'limit': limit,
+            'tags': tags[offset:offset + limit]
+        }
+
+    def get_tags_series(
+        self,
+        tag_names: List[str] = None,
+        exclude_tag_names: List[str] = None,
+        series_ids: Iterable[str] = None,
+        order_by: str = 'series_id',
+        sort_order: str = 'asc',
+        offset: int = 0,
+        limit: int = 1000
+    ) -> Dict:
+        """Local version of `Tags.get_tags_series`.
+
+        ### Parameters
+        ----
+        tag_names : List[str] (optional, Default=None)
+            The tags every series must have.
+
+        exclude_tag_names : List[str] (optional, Default=None)
+            The tags no series may have.
+
+        series_ids : Iterable[str] (optional, Default=None)
+            Restricts the universe, for example to the series of a category
+            for the tag filters of `get_category_series`.
+
+        order_by : str (optional, Default='series_id')
+            Either 'series_id', or None to page in index order without
+            sorting the whole match.
+
+        sort_order : str (optional, Default='asc')
+            One of: ['asc', 'desc'].
+
+        offset : int (optional, Default=0)
+            Non-negative integer.
+
+        limit : int (optional, Default=1000)
+            The maximum number of series returned.
+
+        ### Returns
+        ----
+        Dict:
+            A collection of series, in the shape of the API response.
+        """
+
+        matching = self._matching_series(
+            tag_names=tag_names,
+            exclude_tag_names=exclude_tag_names,
+            series_ids=series_ids
+        )
+
+        if order_by == 'series_id':
+            page = sorted(
+                (self.series_ids[ordinal] for ordinal in matching),
+                reverse=sort_order == 'desc'
+            )[offset:offset + limit]
+        elif order_by is None:
+            page = [self.series_ids[ordinal] for ordinal in matching.slice(offset=offset, limit=limit)]
+        else:
+            raise ValueError('order_by must be series_id or None.')
+
+        return {
+            'order_by': order_by,
+            'sort_order': sort_order,
+            'count': len(matching),
+            'offset': offset,
+            'limit': limit,
+            'seriess': [{'id': series_id} for series_id in page]
+        }
+
+    def count_series(self, tag_names: List[str] = None, exclude_tag_names: List[str] = None) -> int:
+        """Returns the number of series matching a tag filter."""
+
+        return len(self._matching_series(tag_names=tag_names, exclude_tag_names=exclude_tag_names))
+
+    def save(self, file_path: Union[str, pathlib.Path]) -> None:
+        """Saves the index to a JSON file.
+
+        ### Parameters
+        ----
+        file_path : Union[str, pathlib.Path]
+            The path of the file.
+        """
+
+        with open(file=file_path, mode='w', encoding='utf-8') as index_file:
+            json.dump(
+                obj={
+                    'tags': self.tags,
+                    'series_tags': {
+                        series_id: self.series_tags.get(ordinal, [])
+                        for ordinal, series_id in enumerate(self.series_ids)
+                    }
+                },
+                fp=index_file
+            )
+
+    @classmethod
+    def load(cls, file_path: Union[str, pathlib.Path]) -> 'TagIndex':
+        """Loads an index saved with `save`.
+
+        ### Parameters
+        ----
+        file_path : Union[str, pathlib.Path]
+            The path of the file.
+
+        ### Returns
+        ----
+        TagIndex:
+            The index.
+        """
+
+        with open(file=file_path, mode='r', encoding='utf-8') as index_file:
+            content = json.load(fp=index_file)
+
+        tag_index = cls()
+
+        for series_id, names in content['series_tags'].items():
+            tag_index.add_series_tags(
+                series_id=series_id,
+                tags=[content['tags'][name] for name in names]
+            )
+
+        return tag_index
+
+    def _count_tags(self, matching: ChunkedBitmap) -> Counter:
+        """Counts the series of a set carrying each tag."""
+
+        counts = Counter()
+
+        # A small match is cheaper to walk series by series, a large one
+        # is cheaper to AND against every tag bitmap.
+        if len(matching) <= len(self.tags):
+            for ordinal in matching:
+                counts.update(self.series_tags.get(ordinal, []))
+            return counts
+
+        for name, posting in self.postings.items():
+            count = posting.intersection_count(matching)
+            if count:
+                counts[name] = count
+
+        return counts
@@ -0,0 +1,324 @@
+import math
+
+from typing import Dict
+from typing import List
+from typing import Union
+from datetime import date
+from fred.values import NAN
+from fred.values import observation_dates
+from fred.values import to_date
+from fred.values import to_float
+
+# The `units` keys supported by FRED.
+UNITS = ['lin', 'chg', 'ch1', 'pch', 'pc1', 'pca', 'cch', 'cca', 'log']
+
+# Number of observations per year, keyed by the FRED frequency code.
+OBSERVATIONS_PER_YEAR = {
+    'd': 260,
+    'w': 52,
+    'bw': 26,
+    'm': 12,
+    'q': 4,
+    'sa': 2,
+    'a': 1
+}
+
+
+class UnitsTransformer():
+
+    """
+    ## Overview:
+    ----
+    Applies the FRED `units` transformations locally, so a single `lin`
+    request can be turned into every other unit without another round
+    trip. The formulas follow the ALFRED growth formulas published at
+    https://alfred.stlouisfed.org/help#growth_formulas and operate on
+    whole columns of values at once.
+    """
+
+    def __init__(self, frequency: str = None) -> None:
+        """Initializes the `UnitsTransformer` object.
+
+        ### Parameters
+        ----
+        frequency : str (optional, Default=None)
+            The FRED frequency code of the data, one of ['d', 'w', 'bw',
+            'm', 'q', 'sa', 'a']. When not provided, the frequency is
+            inferred from the observation dates.
+
+        ### Usage
+        ----
+            >>> transformer = UnitsTransformer(frequency='q')
+            >>> transformer.transform(values=[100.0, 101.0], units='pch')
+        """
+
+        self.frequency = frequency
+
+    def __repr__(self) -> str:
+        """String representation of the `UnitsTransformer` object."""
+
+        # define the string representation
+        str_representation = '<UnitsTransformer (frequency={frequency})>'.format(
+            frequency=self.frequency
+        )
+
+        return str_representation
+
+    def transform(
+        self,
+        values: List[Union[str, float]],
+        units: str,
+        dates: List[Union[str, date]] = None
+    ) -> List[float]:
+        """Transforms a column of `lin` values into the requested units.
+
+        ### Parameters
+        ----
+        values : List[Union[str, float]]
+            The `lin` values, FRED's missing value marker '.' is
+            treated as NaN.
+
+        units : str
+            One of the following values: ['lin', 'chg', 'ch1', 'pch',
+            'pc1', 'pca', 'cch', 'cca', 'log'].
+
+        dates : List[Union[str, date]] (optional, Default=None)
+            The observation dates, required when the frequency has
+            to be inferred or for the year ago units of daily data.
+
+        ### Returns
+        ----
+        List[float]:
+            The transformed values, NaN where the value is undefined.
+        """
+
+        if units not in UNITS:
+            raise ValueError(
+                'Units must be one of the following: {units}'.format(units=UNITS)
+            )
+
+        x = [to_float(value) for value in values]
+
+        if units == 'lin':
+            return x
+
+        if units == 'log':
+            return [self._log(value) for value in x]
+
+        if units in ('chg', 'pch', 'cch'):
+            previous = [NAN] + x[:-1]
+        else:
+            frequency = self._resolve_frequency(dates=dates)
+            n = OBSERVATIONS_PER_YEAR[frequency]
+
+            if units in ('ch1', 'pc1'):
+                previous = self._year_ago(x=x, dates=dates, frequency=frequency, n=n)
+            else:
+                previous = [NAN] + x[:-1]
+
+        if units in ('chg', 'ch1'):
+            return [a - b for a, b in zip(x, previous)]
+
+        if units in ('pch', 'pc1'):
+            return [
+                (a / b - 1.0) * 100.0 if b else NAN
+                for a, b in zip(x, previous)
+            ]
+
+        if units == 'pca':
+            return [
+                (math.pow(a / b, n) - 1.0) * 100.0 if b and a / b > 0 else NAN
+                for a, b in zip(x, previous)
+            ]
+
+        scale = 100.0 if units == 'cch' else 100.0 * n
+
+        return [
+            (self._log(a) - self._log(b)) * scale
+            for a, b in zip(x, previous)
+        ]
+
+    def transform_all(
+        self,
+        values: List[Union[str, float]],
+        units: List[str] = None,
+        dates: List[Union[str, date]] = None
+    ) -> Dict[str, List[float]]:
+        """Transforms a column of `lin` values into several units at once.
+
+        ### Parameters
+        ----
+        values : List[Union[str, float]]
+            The `lin` values.
+
+        units : List[str] (optional, Default=None)
+            The units to compute, all of them when not provided.
+
+        dates : List[Union[str, date]] (optional, Default=None)
+            The observation dates.
+
+        ### Returns
+        ----
+        Dict[str, List[float]]:
+            The transformed values keyed by their units.
+        """
+
+        units = units or UNITS
+
+        return {
+            unit: self.transform(values=values, units=unit, dates=dates)
+            for unit in units
+        }
+
+    def transform_panel(
+        self,
+        panel: Dict[str, Dict[str, list]],
+        units: str
+    ) -> Dict[str, List[float]]:
+        """Transforms every column of a panel into the requested units.
+
+        ### Parameters
+        ----
+        panel : Dict[str, Dict[str, list]]
+            The panel keyed by series ID, each column being a dictionary
+            with the keys `dates` and `values`.
+
+        units : str
+            The units to compute.
+
+        ### Returns
+        ----
+        Dict[str, List[float]]:
+            The transformed values keyed by series ID.
+        """
+
+        return {
+            series_id: self.transform(
+                values=column['values'],
+                units=units,
+                dates=column.get('dates')
+            )
+            for series_id, column in panel.items()
+        }
+
+    def transform_observations(self, content: Dict, units: str) -> Dict:
+        """Transforms a `get_series_observations` response fetched with `lin` units.
+
+        ### Parameters
+        ----
+        content : Dict
+            The response returned by `Series.get_series_observations`.
+
+        units : str
+            The units to compute.
+
+        ### Returns
+        ----
+        Dict:
+            A copy of the response, as FRED would have returned it for
+            the requested units.
+
+        ### Raises
+        ----
+        ValueError:
+            When a date has several rows, as returned for a real-time
+            period spanning revisions or several vintage dates. The units
+            of each vintage depend on the whole series as of that vintage,
+            so the response cannot be transformed row by row.
+        """
+
+        observations = content.get('observations', [])
+        dates = observation_dates(observations=observations)
+
+        transformed = self.transform(
+            values=[row['value'] for row in observations],
+            units=units,
+            dates=dates
+        )
+
+        new_content = dict(content)
+        new_content['units'] = units
+        new_content['observations'] = [
+            dict(row, value=self._to_string(value))
+            for row, value in zip(observations, transformed)
+        ]
+
+        return new_content
+
+    def _resolve_frequency(self, dates: List[Union[str, date]]) -> str:
+        """Returns the frequency, inferring it from the dates if needed."""
+
+        if self.frequency in OBSERVATIONS_PER_YEAR:
+            return self.frequency
+        elif self.frequency and self.frequency.startswith('bw'):
+            return 'bw'
+        elif self.frequency and self.frequency.startswith('w'):
+            return 'w'
+
+        if not dates or len(dates) < 2:
+            raise ValueError(
+                'A frequency or at least two dates are needed for this transformation.'
+            )
+
+        ordinals = [to_date(value).toordinal() for value in dates]
+        gaps = sorted(b - a for a, b in zip(ordinals, ordinals[1:]))
+        median_gap = gaps[len(gaps) // 2]
+
+        if median_gap <= 3:
+            return 'd'
+        elif median_gap <= 7:
+            return 'w'
+        elif median_gap <= 14:
+            return 'bw'
+        elif median_gap <= 31:
+            return 'm'
+        elif median_gap <= 92:
+            return 'q'
+        elif median_gap <= 184:
+            return 'sa'
+
+        return 'a'
+
+    def _year_ago(
+        self,
+        x: List[float],
+        dates: List[Union[str, date]],
+        frequency: str,
+        n: int
+    ) -> List[float]:
+        """Returns the values observed one year before each observation."""
+
+        # Daily data is not evenly spaced, so match the dates instead.
+        if frequency == 'd' and dates:
+            parsed = [to_date(value) for value in dates]
+            lookup = dict(zip(parsed, x))
+            return [lookup.get(self._shift_year(value), NAN) for value in parsed]
+
+        return [NAN] * min(n, len(x)) + x[:-n]
+
+    @staticmethod
+    def _shift_year(value: date) -> date:
+        """Returns the same day one year earlier, Feb 29th maps to Feb 28th."""
+
+        try:
+            return value.replace(year=value.year - 1)
+        except ValueError:
+            return value.replace(year=value.year - 1, day=28)
+
+    @staticmethod
+    def _to_string(value: float) -> str:
+        """Converts a float back into FRED's string representation."""
+
+        if math.isnan(value):
+            return '.'
+
+        return repr(value)
+
+    @staticmethod
+    def _log(value: float) -> float:
+        """Natural log that returns NaN instead of raising."""
+
+        if value > 0:
+            return math.log(value)
+
+        return NAN
@@ -0,0 +1,81 @@
+from typing import Dict
+from typing import List
+from typing import Union
+from datetime import date
+from datetime import datetime
+
+# FRED's missing values, '.' in the responses.
+NAN = float('nan')
+
+
+def to_date(value: Union[str, date]) -> date:
+    """Converts a YYYY-MM-DD string or datetime to a date.
+
+    ### Parameters
+    ----
+    value : Union[str, date]
+        The observation date.
+
+    ### Returns
+    ----
+    date:
+        The date.
+    """
+
+    if isinstance(value, datetime):
+        return value.date()
+    elif isinstance(value, date):
+        return value
+
+    return date(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+
+
+def to_float(value: Union[str, float]) -> float:
+    """Converts an observation value to a float, '.' becomes NaN.
+
+    ### Parameters
+    ----
+    value : Union[str, float]
+        The observation value.
+
+    ### Returns
+    ----
+    float:
+        The value, NaN when missing.
+    """
+
+    if value is None or value == '.':
+        return NAN
+
+    return float(value)
+
+
+def observation_dates(observations: List[Dict]) -> List[str]:
+    """Returns the dates of observation rows, checking that each date has a single row.
+
+    ### Parameters
+    ----
+    observations : List[Dict]
+        The `observations` of a `Series.get_series_observations` response.
+
+    ### Returns
+    ----
+    List[str]:
+        The dates, in the order of the rows.
+
+    ### Raises
+    ----
+    ValueError:
+        When a date has several rows, as returned for a real-time period
+        spanning revisions or several vintage dates. Each vintage has to be
+        computed on the series as of that vintage, not on a mix of them.
+    """
+
+    dates = [row['date'] for row in observations]
+
+    if len(set(dates)) != len(dates):
+        raise ValueError(
+            'The observations hold several rows per date, request a single real-time period or vintage date.'
+        )
+
+    return dates
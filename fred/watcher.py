@@ -0,0 +1,279 @@
+import json
+import queue
+import logging
+import pathlib
+import threading
+
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Union
+from datetime import datetime
+from datetime import timezone
+from fred.cache import UPDATES_HORIZON
+from fred.cache import fred_time
+from fred.series import Series
+
+
+class UpdatesWatcher():
+
+    """
+    ## Overview:
+    ----
+    A long-running poller over `Series.get_series_updates`. Each poll pages
+    through a window with a fixed end, drops the updates already seen and
+    dispatches the updated series IDs in batches to the registered callbacks
+    and, optionally, a queue. The high-water mark only moves forward, to the
+    end of the window, once it has been fully dispatched.
+
+    The feed changes while it is paged by offset: a series updated again
+    leaves the window and shifts the rows after it, so one of them can be
+    skipped. Each window therefore starts at the high-water mark before the
+    last one, paging the last window again, and `seen` drops the updates
+    already dispatched.
+    """
+
+    def __init__(
+        self,
+        series_service: Series,
+        state_path: Union[str, pathlib.Path] = None,
+        filter_value: str = 'all',
+        batch_size: int = 100,
+        output_queue: queue.Queue = None
+    ) -> None:
+        """Initializes the `UpdatesWatcher` object.
+
+        ### Parameters
+        ----
+        series_service : Series
+            The `Series` service used to fetch the updates.
+
+        state_path : Union[str, pathlib.Path] (optional, Default=None)
+            A JSON file the high-water mark is persisted to, so a restarted
+            watcher picks up where it left off.
+
+        filter_value : str (optional, Default='all')
+            Limit results by geographic type of economic data series;
+            namely 'macro', 'regional', and 'all'.
+
+        batch_size : int (optional, Default=100)
+            The maximum number of series IDs dispatched at once.
+
+        output_queue : queue.Queue (optional, Default=None)
+            A queue every batch is put on, in addition to the callbacks.
+
+        ### Usage
+        ----
+            >>> fred_client = FederalReserveClient(api_key='xxxxxx')
+            >>> watcher = UpdatesWatcher(series_service=fred_client.series(), state_path='updates.json')
+            >>> watcher.register(callback=print)
+            >>> watcher.run(interval=300)
+        """
+
+        self.series_service = series_service
+        self.state_path = pathlib.Path(state_path) if state_path else None
+        self.filter_value = filter_value
+        self.batch_size = batch_size
+        self.output_queue = output_queue
+
+        self.callbacks: List[Callable[[List[str]], None]] = []
+        self.high_water_mark: datetime = None
+        self.previous_high_water_mark: datetime = None
+        self.seen: Dict[str, str] = {}
+
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread = None
+
+        self._load_state()
+
+    def __repr__(self) -> str:
+        """String representation of the `UpdatesWatcher` object."""
+
+        # define the string representation
+        str_representation = '<UpdatesWatcher (high_water_mark={mark}, running={running})>'.format(
+            mark=self.high_water_mark.isoformat() if self.high_water_mark else None,
+            running=self.is_running
+        )
+
+        return str_representation
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background polling thread is alive."""
+
+        return self._thread is not None and self._thread.is_alive()
+
+    def register(self, callback: Callable[[List[str]], None]) -> None:
+        """Registers a callback called with each batch of updated series IDs.
+
+        ### Parameters
+        ----
+        callback : Callable[[List[str]], None]
+            The function to call.
+        """
+
+        self.callbacks.append(callback)
+
+    def poll_once(self, now: datetime = None) -> List[str]:
+        """Fetches and dispatches every update since the high-water mark.
+
+        ### Parameters
+        ----
+        now : datetime (optional, Default=None)
+            The end of the window, the current time when not provided,
+            truncated to the minute as FRED's `end_time` is.
+
+        ### Returns
+        ----
+        List[str]:
+            The IDs of the series dispatched.
+        """
+
+        now = (now or datetime.now(tz=timezone.utc)).replace(second=0, microsecond=0)
+
+        # Page the last window again, the feed only goes back two weeks.
+        start = max(self.previous_high_water_mark or now - UPDATES_HORIZON, now - UPDATES_HORIZON)
+
+        # Only marked as seen once dispatched, so a failed poll is retried in full.
+        updated = []
+        fresh = {}
+        offset = 0
+
+        while True:
+            content = self.series_service.get_series_updates(
+                offset=offset,
+                limit=1000,
+                filter_value=self.filter_value,
+                start_time=fred_time(start),
+                end_time=fred_time(now)
+            )
+            page = content.get('seriess', [])
+            offset += len(page)
+
+            for series in page:
+                last_updated = series.get('last_updated', '')
+                if fresh.get(series['id'], self.seen.get(series['id'])) != last_updated:
+                    fresh[series['id']] = last_updated
+                    updated.append(series['id'])
+
+            if not page or offset >= content.get('count', 0):
+                break
+
+        for index in range(0, len(updated), self.batch_size):
+            self._dispatch(batch=updated[index:index + self.batch_size])
+
+        self.seen.update(fresh)
+        self.previous_high_water_mark, self.high_water_mark = self.high_water_mark, now
+        self._prune_seen(now=now)
+        self._save_state()
+
+        return updated
+
+    def run(self, interval: float = 300.0, block: bool = False) -> None:
+        """Polls the updates feed every `interval` seconds.
+
+        ### Parameters
+        ----
+        interval : float (optional, Default=300.0)
+            The number of seconds between two polls.
+
+        block : bool (optional, Default=False)
+            Run in the calling thread instead of a background thread.
+        """
+
+        self._stop_event.clear()
+
+        if block:
+            self._loop(interval=interval)
+            return
+
+        self._thread = threading.Thread(
+            target=self._loop,
+            kwargs={'interval': interval},
+            name='fred-updates-watcher',
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = None) -> None:
+        """Stops the polling loop.
+
+        ### Parameters
+        ----
+        timeout : float (optional, Default=None)
+            How long to wait for the background thread to finish.
+        """
+
+        self._stop_event.set()
+
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+
+    def _loop(self, interval: float) -> None:
+        """Polls until stopped, logging failures instead of dying."""
+
+        while not self._stop_event.is_set():
+            try:
+                self.poll_once()
+            except Exception as error:
+                logging.error(msg='Updates watcher poll failed: {error}'.format(error=error))
+
+            self._stop_event.wait(timeout=interval)
+
+    def _dispatch(self, batch: List[str]) -> None:
+        """Hands a batch to the callbacks and the queue."""
+
+        for callback in self.callbacks:
+            callback(batch)
+
+        if self.output_queue is not None:
+            self.output_queue.put(batch)
+
+    def _prune_seen(self, now: datetime) -> None:
+        """Forgets the updates older than the feed horizon."""
+
+        cutoff = (now - UPDATES_HORIZON).astimezone(timezone.utc).strftime('%Y-%m-%d')
+
+        self.seen = {
+            series_id: last_updated for series_id, last_updated in self.seen.items()
+            if last_updated[0:10] >= cutoff
+        }
+
+    def _load_state(self) -> None:
+        """Reads the high-water mark from the state file."""
+
+        if not self.state_path or not self.state_path.exists():
+            return
+
+        with open(file=self.state_path, mode='r', encoding='utf-8') as state_file:
+            state = json.load(fp=state_file)
+
+        if state.get('high_water_mark'):
+            self.high_water_mark = datetime.fromisoformat(state['high_water_mark'])
+
+        if state.get('previous_high_water_mark'):
+            self.previous_high_water_mark = datetime.fromisoformat(state['previous_high_water_mark'])
+
+        self.seen = state.get('seen', {})
+
+    def _save_state(self) -> None:
+        """Writes the high-water mark to the state file, atomically."""
+
+        if not self.state_path:
+            return
+
+        temporary_path = self.state_path.with_suffix(self.state_path.suffix + '.tmp')
+
+        with open(file=temporary_path, mode='w', encoding='utf-8') as state_file:
+            json.dump(
+                obj={
+                    'high_water_mark': self.high_water_mark.isoformat(),
+                    'previous_high_water_mark': (
+                        self.previous_high_water_mark.isoformat() if self.previous_high_water_mark else None
+                    ),
+                    'seen': self.seen
+                },
+                fp=state_file
+            )
+
+        temporary_path.replace(self.state_path)
@@ -0,0 +1,48 @@
+import json
+import threading
+
+
+class FakeClient():
+
+    """A `FederalReserveClient` stand-in holding an API key."""
+
+    _api_key = 'xxxxxx'
+
+
+class FakeResponse():
+
+    """A `requests.Response` stand-in with a JSON body."""
+
+    status_code = 200
+    ok = True
+
+    def __init__(self, body: dict) -> None:
+        self.content = json.dumps(body).encode()
+
+    def json(self) -> dict:
+        return json.loads(self.content)
+
+
+class FakeSession():
+
+    """A `FredSession` stand-in recording every request, answered by `respond` in each test."""
+
+    def __init__(self) -> None:
+        self.client = FakeClient()
+        self.lock = threading.Lock()
+        self.requests = []
+
+    @property
+    def endpoints(self) -> list:
+        """The endpoints requested, in order."""
+
+        return [endpoint for endpoint, _ in self.requests]
+
+    def make_request(self, method: str, endpoint: str, params: dict) -> dict:
+        with self.lock:
+            self.requests.append((endpoint, params))
+
+        return self.respond(endpoint=endpoint, params=params)
+
+    def respond(self, endpoint: str, params: dict) -> dict:
+        raise NotImplementedError
@@ -0,0 +1,85 @@
+import unittest
+
+from datetime import date
+from unittest import TestCase
+from fred.aggregation import FrequencyAggregator
+
+
+class FrequencyAggregatorTest(TestCase):
+
+    """Will perform a unit test for the `FrequencyAggregator` object."""
+
+    def setUp(self) -> None:
+        """Set up the monthly observations."""
+
+        self.dates = [
+            '2020-01-01', '2020-02-01', '2020-03-01',
+            '2020-04-01', '2020-05-01', '2020-06-01'
+        ]
+        self.values = ['1', '2', '3', '4', '.', '6']
+
+    def test_quarterly_average(self):
+        """Test the `avg` aggregation method."""
+
+        aggregator = FrequencyAggregator(frequency='q')
+        labels, values = aggregator.aggregate(dates=self.dates, values=self.values)
+        self.assertEqual(labels, [date(2020, 1, 1), date(2020, 4, 1)])
+        self.assertEqual(values, [2.0, 5.0])
+
+    def test_semiannual_sum_and_eop(self):
+        """Test the `sum` and `eop` aggregation methods."""
+
+        total = FrequencyAggregator(frequency='sa', aggregation_method='sum')
+        last = FrequencyAggregator(frequency='sa', aggregation_method='eop')
+        self.assertEqual(total.aggregate(dates=self.dates, values=self.values)[1], [16.0])
+        self.assertEqual(last.aggregate(dates=self.dates, values=self.values)[1], [6.0])
+
+    def test_week_ending_labels(self):
+        """Test the week ending frequencies."""
+
+        # 2021-01-06 is a Wednesday.
+        friday = FrequencyAggregator(frequency='wef')
+        sunday = FrequencyAggregator(frequency='wesu')
+        wednesday = FrequencyAggregator(frequency='bwew')
+        self.assertEqual(friday.period_label('2021-01-06'), date(2021, 1, 8))
+        self.assertEqual(sunday.period_label('2021-01-06'), date(2021, 1, 10))
+        self.assertEqual(wednesday.period_label('2021-01-06').weekday(), 2)
+
+    def test_aggregate_observations(self):
+        """Test the `aggregate_observations` method."""
+
+        content = {
+            'observations': [
+                {'realtime_start': '2021-01-01', 'realtime_end': '2021-01-01', 'date': day, 'value': value}
+                for day, value in zip(self.dates, self.values)
+            ]
+        }
+
+        aggregator = FrequencyAggregator(frequency='a')
+        result = aggregator.aggregate_observations(content=content)
+        self.assertEqual(result['count'], 1)
+        self.assertEqual(result['observations'][0]['date'], '2020-01-01')
+        self.assertEqual(result['observations'][0]['value'], '3.2')
+
+    def test_aggregate_observations_rejects_revisions(self):
+        """Test that several rows per date, one per real-time period, raise a `ValueError`."""
+
+        content = {
+            'observations': [
+                {'realtime_start': '2020-02-01', 'realtime_end': '2020-02-27', 'date': '2020-01-01', 'value': '1.0'},
+                {'realtime_start': '2020-02-28', 'realtime_end': '9999-12-31', 'date': '2020-01-01', 'value': '1.5'}
+            ]
+        }
+
+        with self.assertRaises(ValueError):
+            FrequencyAggregator(frequency='a').aggregate_observations(content=content)
+
+    def test_invalid_frequency(self):
+        """Test that unknown frequencies raise a `ValueError`."""
+
+        with self.assertRaises(ValueError):
+            FrequencyAggregator(frequency='x')
+
+
+if __name__ == '__main__':
+    unittest.main()
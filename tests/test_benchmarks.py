@@ -0,0 +1,36 @@
+import unittest
+
+from unittest import TestCase
+from benchmarks.run import bench_pagination
+from benchmarks.run import compare
+from benchmarks.stand_in import FredStandIn
+
+
+class BenchmarksTest(TestCase):
+
+    """Will perform a unit test for the benchmark suite."""
+
+    def test_stand_in_pagination(self):
+        """Test that the `Paginator` walks the stand-in's listing."""
+
+        with FredStandIn(observations=10, listing_count=2500) as stand_in:
+            results = bench_pagination(stand_in=stand_in, max_workers=2)
+
+        self.assertEqual((results['items'], results['pages']), (2500, 3))
+        self.assertEqual(stand_in.requests, 3)
+
+    def test_compare(self):
+        """Test that changes are judged by the direction of each metric."""
+
+        baseline = {'results': {'pagination': {'items_per_second': 100}, 'cache_hit_latency': {'mean_us': 2.0}}}
+        current = {'results': {'pagination': {'items_per_second': 150}, 'cache_hit_latency': {'mean_us': 3.0}}}
+
+        comparison = compare(baseline=baseline, current=current)
+
+        self.assertEqual(comparison['pagination']['change'], 0.5)
+        self.assertTrue(comparison['pagination']['improved'])
+        self.assertFalse(comparison['cache_hit_latency']['improved'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import random
+import unittest
+
+from unittest import TestCase
+from fred.bitmap import ChunkedBitmap
+
+
+class ChunkedBitmapTest(TestCase):
+
+    """Will perform a unit test for the `ChunkedBitmap` object."""
+
+    def setUp(self) -> None:
+        """Set up a sparse and a partly dense bitmap over several chunks."""
+
+        generator = random.Random(7)
+        self.left = set(generator.sample(range(300000), 20000))
+        self.right = set(generator.sample(range(300000), 30000)) | set(range(1000, 9000))
+
+    def test_set_operations(self):
+        """Test AND, OR, ANDNOT and counts against Python sets."""
+
+        left, right = ChunkedBitmap(self.left), ChunkedBitmap(self.right)
+
+        self.assertEqual(list(left & right), sorted(self.left & self.right))
+        self.assertEqual(list(left | right), sorted(self.left | self.right))
+        self.assertEqual(list(left - right), sorted(self.left - self.right))
+        self.assertEqual(list(right - left), sorted(self.right - self.left))
+        self.assertEqual(left.intersection_count(right), len(self.left & self.right))
+        self.assertEqual(len(right), len(self.right))
+
+    def test_add_discard_and_slice(self):
+        """Test incremental updates and paging by rank."""
+
+        bitmap = ChunkedBitmap()
+        for ordinal in sorted(self.right):
+            bitmap.add(ordinal)
+        self.assertEqual(bitmap, ChunkedBitmap(self.right))
+
+        removed = sorted(self.right)[::3]
+        for ordinal in removed:
+            bitmap.discard(ordinal)
+
+        expected = sorted(self.right - set(removed))
+        self.assertEqual(list(bitmap), expected)
+        self.assertEqual(bitmap.slice(offset=5000, limit=20), expected[5000:5020])
+        self.assertIn(expected[0], bitmap)
+        self.assertNotIn(removed[0], bitmap)
+
+    def test_dense_chunks_are_not_shared(self):
+        """Test that dense chunks are changed in place without touching copies and results."""
+
+        bitmap = ChunkedBitmap(range(1000, 9000))
+        copied, united = bitmap.copy(), bitmap | ChunkedBitmap([70000])
+
+        bitmap.discard(5000)
+        bitmap.add(20000)
+
+        self.assertNotIn(5000, bitmap)
+        self.assertIn(20000, bitmap)
+        self.assertEqual(list(copied), list(range(1000, 9000)))
+        self.assertEqual(len(united), 8001)
+        self.assertEqual(bitmap.intersection_count(ChunkedBitmap([5000, 5001, 20000])), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
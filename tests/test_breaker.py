@@ -0,0 +1,201 @@
+import json
+import unittest
+import requests
+
+from unittest import TestCase
+from unittest import mock
+from fred.breaker import CircuitBreaker
+from fred.breaker import CircuitBreakers
+from fred.breaker import CircuitOpenError
+from fred.breaker import endpoint_group
+from fred.session import FredSession
+from fakes import FakeClient
+from fakes import FakeResponse
+
+
+class FakeClock():
+
+    """A clock the test moves forward by hand."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CircuitBreakerTest(TestCase):
+
+    """Will perform a unit test for the `CircuitBreaker` object."""
+
+    def setUp(self) -> None:
+        """Set up the `CircuitBreaker` object."""
+
+        self.clock = FakeClock()
+        self.circuit_breaker = CircuitBreaker(
+            name='series',
+            min_calls=4,
+            open_seconds=30.0,
+            slow_call_seconds=5.0,
+            clock=self.clock
+        )
+
+    def test_groups(self):
+        """Test that endpoints are grouped by resource."""
+
+        self.assertEqual(endpoint_group('/series/observations'), 'observations')
+        self.assertEqual(endpoint_group('/series/tags'), 'series')
+        self.assertEqual(endpoint_group('/release/series'), 'releases')
+        self.assertEqual(endpoint_group('/related_tags'), 'tags')
+
+    def test_opens_on_errors_then_recovers(self):
+        """Test the closed, open, half-open and closed states."""
+
+        for failed in [False, True, False, True]:
+            self.assertTrue(self.circuit_breaker.allow())
+            self.circuit_breaker.record(seconds=0.1, failed=failed)
+
+        self.assertEqual(self.circuit_breaker.state, 'open')
+        self.assertFalse(self.circuit_breaker.allow())
+        self.assertEqual(self.circuit_breaker.health()['retry_in'], 30.0)
+
+        # One trial after the cool down, a failed trial opens it again.
+        self.clock.now = 30.0
+        self.assertTrue(self.circuit_breaker.allow())
+        self.assertFalse(self.circuit_breaker.allow())
+        self.circuit_breaker.record(seconds=0.1, failed=True)
+        self.assertEqual(self.circuit_breaker.state, 'open')
+
+        self.clock.now = 60.0
+        self.assertTrue(self.circuit_breaker.allow())
+        self.circuit_breaker.record(seconds=0.1, failed=False)
+        self.assertEqual(self.circuit_breaker.state, 'closed')
+        self.assertEqual(self.circuit_breaker.health()['calls'], 0)
+
+    def test_only_trials_settle_half_open(self):
+        """Test that late results of calls admitted before the trip leave the half-open state alone."""
+
+        admissions = [self.circuit_breaker.allow() for _ in range(6)]
+
+        for admission in admissions[0:4]:
+            self.circuit_breaker.record(seconds=0.1, failed=True, admission=admission)
+
+        self.assertEqual(self.circuit_breaker.state, 'open')
+
+        self.clock.now = 30.0
+        trial = self.circuit_breaker.allow()
+        self.assertEqual(trial[0], 'half_open')
+
+        # A success and a failure admitted while closed finish during the trial.
+        self.circuit_breaker.record(seconds=0.1, failed=False, admission=admissions[4])
+        self.circuit_breaker.record(seconds=0.1, failed=True, admission=admissions[5])
+        self.circuit_breaker.release(admission=admissions[5])
+        self.assertEqual(self.circuit_breaker.state, 'half_open')
+        self.assertIsNone(self.circuit_breaker.allow())
+
+        self.circuit_breaker.record(seconds=0.1, failed=False, admission=trial)
+        self.assertEqual(self.circuit_breaker.state, 'closed')
+
+    def test_opens_on_latency(self):
+        """Test that slow successful calls open the breaker too."""
+
+        for seconds in [6.0, 0.1, 7.0, 0.2]:
+            self.circuit_breaker.allow()
+            self.circuit_breaker.record(seconds=seconds, failed=False)
+
+        self.assertEqual(self.circuit_breaker.health()['slow_call_rate'], 0.5)
+        self.assertEqual(self.circuit_breaker.state, 'open')
+
+
+class SessionCircuitBreakerTest(TestCase):
+
+    """Will perform a unit test for the circuit breakers of `FredSession`."""
+
+    def setUp(self) -> None:
+        """Set up the `FredSession` object."""
+
+        self.fred_session = FredSession(client=FakeClient())
+        self.fred_session.rate_limiter = None
+        self.response = FakeResponse(body={'seriess': [{'id': 'GNPCA'}]})
+
+    def request(self, series_id: str) -> dict:
+        return self.fred_session.make_request(
+            method='get',
+            endpoint='/series',
+            params={'series_id': series_id, 'api_key': 'xxxxxx', 'file_type': 'json'}
+        )
+
+    def test_fallback_and_fail_fast(self):
+        """Test that an open breaker serves the last response or fails without a request."""
+
+        with mock.patch.object(requests.Session, 'send', return_value=self.response):
+            self.request(series_id='GNPCA')
+
+        with mock.patch.object(requests.Session, 'send', side_effect=requests.ConnectionError()) as send:
+            for _ in range(4):
+                with self.assertRaises(requests.ConnectionError):
+                    self.request(series_id='UNRATE')
+
+            self.assertFalse(self.fred_session.health()['healthy'])
+            self.assertEqual(self.request(series_id='GNPCA')['seriess'][0]['id'], 'GNPCA')
+
+            with self.assertRaises(CircuitOpenError):
+                self.request(series_id='UNRATE')
+
+            self.assertEqual(send.call_count, 4)
+            self.assertEqual(send.call_args.kwargs['timeout'], 30.0)
+
+    def test_fallback_copies_and_skips_observations(self):
+        """Test that the fallback decodes a fresh copy on every use and leaves observations out."""
+
+        circuit_breakers = CircuitBreakers(fallback_size=1)
+        params = {'series_id': 'GNPCA', 'api_key': 'xxxxxx'}
+        content = {'seriess': [{'id': 'GNPCA'}]}
+
+        circuit_breakers.remember(endpoint='/series', params=params, content=json.dumps(content).encode())
+        circuit_breakers.fallback(endpoint='/series', params=params)['seriess'].clear()
+        self.assertEqual(circuit_breakers.fallback(endpoint='/series', params=params), content)
+
+        circuit_breakers.remember(endpoint='/series/observations', params=params, content=b'{"observations": []}')
+        with self.assertRaises(CircuitOpenError):
+            circuit_breakers.fallback(endpoint='/series/observations', params=params)
+
+        # Only the most recent response is kept.
+        circuit_breakers.remember(endpoint='/series/tags', params=params, content=b'{"tags": []}')
+        with self.assertRaises(CircuitOpenError):
+            circuit_breakers.fallback(endpoint='/series', params=params)
+
+    def test_trial_slot_released_on_local_errors(self):
+        """Test that a half-open trial failing before the send does not block later requests."""
+
+        clock = FakeClock()
+        self.fred_session.circuit_breakers = CircuitBreakers(min_calls=1, clock=clock)
+
+        with mock.patch.object(requests.Session, 'send', side_effect=requests.ConnectionError()):
+            with self.assertRaises(requests.ConnectionError):
+                self.request(series_id='UNRATE')
+
+        clock.now = 60.0
+
+        with self.assertRaises(ValueError):
+            self.fred_session.make_request(
+                method='get',
+                endpoint='/series',
+                params={'series_id': 'UNRATE', 'api_key': 'xxxxxx'},
+                priority='bogus'
+            )
+
+        with mock.patch.object(self.fred_session.scheduler, 'acquire', side_effect=RuntimeError()):
+            with self.assertRaises(RuntimeError):
+                self.request(series_id='UNRATE')
+
+        self.assertEqual(self.fred_session.health()['groups']['series']['state'], 'half_open')
+
+        with mock.patch.object(requests.Session, 'send', return_value=self.response):
+            self.assertEqual(self.request(series_id='UNRATE')['seriess'][0]['id'], 'GNPCA')
+
+        self.assertEqual(self.fred_session.health()['groups']['series']['state'], 'closed')
+
+
+if __name__ == '__main__':
+    unittest.main()
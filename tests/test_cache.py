@@ -0,0 +1,257 @@
+import unittest
+
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from unittest import TestCase
+from fred.cache import CentralTime
+from fred.cache import MetadataCache
+from fred.cache import ResponseCache
+from fred.cache import TTLPolicy
+from fred.release_calendar import ReleaseCalendar
+from fred.series import Series
+
+
+class FakeSeriesService():
+
+    """A `Series` service stand-in that records the calls made to it."""
+
+    def __init__(self) -> None:
+        self.calls = []
+        self.updated = []
+        self.failing_offsets = set()
+
+    def get_series(self, series_id: str, **kwargs) -> dict:
+        self.calls.append(('get_series', series_id))
+        return {'seriess': [{'id': series_id, 'call': len(self.calls)}]}
+
+    def get_series_tags(self, series_id: str, **kwargs) -> dict:
+        self.calls.append(('get_series_tags', series_id))
+        return {'tags': []}
+
+    def get_series_updates(self, offset: int = 0, limit: int = 1000, **kwargs) -> dict:
+        self.calls.append(('get_series_updates', kwargs['start_time'], kwargs['end_time']))
+        if offset in self.failing_offsets:
+            raise ConnectionError('Page {offset} failed.'.format(offset=offset))
+        page = [{'id': series_id} for series_id in self.updated[offset:offset + 2]]
+        return {'count': len(self.updated), 'seriess': page}
+
+
+class MetadataCacheTest(TestCase):
+
+    """Will perform a unit test for the `MetadataCache` object."""
+
+    def setUp(self) -> None:
+        """Set up the `MetadataCache` object."""
+
+        self.series_service = FakeSeriesService()
+        self.metadata_cache = MetadataCache(
+            series_service=self.series_service,
+            poll_interval=3600
+        )
+
+    def test_hits_after_first_read(self):
+        """Test that repeated reads are served from the cache."""
+
+        first = self.metadata_cache.get_series(series_id='GNPCA')
+        second = self.metadata_cache.get_series(series_id='GNPCA')
+        self.metadata_cache.get_series_tags(series_id='GNPCA')
+
+        self.assertIs(first, second)
+        self.assertEqual(self.metadata_cache.hits, 1)
+        self.assertEqual(self.metadata_cache.misses, 2)
+
+    def test_poll_invalidates_updated_series(self):
+        """Test that updated series are refetched after a poll."""
+
+        self.metadata_cache.get_series(series_id='GNPCA')
+        self.metadata_cache.get_series(series_id='UNRATE')
+
+        self.series_service.updated = ['GNPCA', 'GDP', 'PAYEMS']
+        updated = self.metadata_cache.poll(
+            now=self.metadata_cache.last_poll + timedelta(minutes=5)
+        )
+
+        self.assertEqual(updated, ['GNPCA', 'GDP', 'PAYEMS'])
+        self.assertNotIn('GNPCA', self.metadata_cache.entries)
+        self.assertIn('UNRATE', self.metadata_cache.entries)
+
+    def test_failed_poll_keeps_its_window(self):
+        """Test that a poll failing on a page is retried over the same window."""
+
+        self.metadata_cache.get_series(series_id='GDP')
+        start = self.metadata_cache.last_poll
+
+        self.series_service.updated = ['GNPCA', 'GDP', 'PAYEMS']
+        self.series_service.failing_offsets = {2}
+
+        with self.assertRaises(ConnectionError):
+            self.metadata_cache.poll(now=start + timedelta(minutes=5))
+
+        self.assertEqual(self.metadata_cache.last_poll, start)
+        self.assertIn('GDP', self.metadata_cache.entries)
+
+        self.series_service.failing_offsets = set()
+        updated = self.metadata_cache.poll(now=start + timedelta(minutes=10))
+
+        self.assertEqual(updated, ['GNPCA', 'GDP', 'PAYEMS'])
+        self.assertEqual(self.series_service.calls[-1][1], self.series_service.calls[-3][1])
+        self.assertNotIn('GDP', self.metadata_cache.entries)
+        self.assertEqual(self.metadata_cache.last_poll, start + timedelta(minutes=10))
+
+    def test_poll_clears_when_window_is_too_old(self):
+        """Test that a window older than the updates feed clears the cache."""
+
+        self.metadata_cache.get_series(series_id='GNPCA')
+        self.metadata_cache.poll(now=datetime.now(tz=timezone.utc) + timedelta(days=15))
+        self.assertEqual(self.metadata_cache.entries, {})
+
+
+class FakeScheduledSeriesService():
+
+    """A `Series` service stand-in for a daily and a monthly series."""
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def get_series(self, series_id: str, **kwargs) -> dict:
+        self.calls.append(('get_series', series_id))
+        frequency_short = {'DGS10': 'D', 'UNRATE': 'M'}[series_id]
+        return {'seriess': [{
+            'id': series_id,
+            'frequency_short': frequency_short,
+            'last_updated': '2024-06-14 15:01:02-05'
+        }]}
+
+    def get_series_observations(self, series_id: str, **kwargs) -> dict:
+        self.calls.append(('get_series_observations', series_id))
+        return {'observations': []}
+
+    def get_series_release(self, series_id: str, **kwargs) -> dict:
+        self.calls.append(('get_series_release', series_id))
+        return {'releases': [{'id': 50}]}
+
+    def get_series_tags(self, series_id: str, **kwargs) -> dict:
+        self.calls.append(('get_series_tags', series_id))
+        return {'tags': []}
+
+    def get_series_categories(self, series_id: str, **kwargs) -> dict:
+        self.calls.append(('get_series_categories', series_id))
+        return {'categories': []}
+
+    def get_series_vintage_dates(self, series_id: str, **kwargs) -> dict:
+        self.calls.append(('get_series_vintage_dates', series_id))
+        return {'vintage_dates': ['2024-06-14']}
+
+
+class FakePaginator():
+
+    """A `Paginator` stand-in serving the dates of release 50."""
+
+    def __init__(self, series_service: FakeScheduledSeriesService) -> None:
+        self.series_service = series_service
+
+    def release_dates(self, release_id: str, **kwargs) -> list:
+        return [
+            {'release_id': 50, 'date': '2024-06-07'},
+            {'release_id': 50, 'date': '2024-07-05'}
+        ]
+
+
+class TTLPolicyTest(TestCase):
+
+    """Will perform a unit test for the `TTLPolicy` and `ResponseCache` objects."""
+
+    def setUp(self) -> None:
+        """Set up a Friday afternoon, just after the last updates."""
+
+        self.now = datetime(2024, 6, 14, 21, 0, tzinfo=timezone.utc)
+        self.series_service = FakeScheduledSeriesService()
+
+    def test_daily_series_expires_next_business_day(self):
+        """Test that a daily series updated on a Friday lives until Monday."""
+
+        ttl_policy = TTLPolicy()
+        series_info = self.series_service.get_series(series_id='DGS10')['seriess'][0]
+        expires_at = ttl_policy.expires_at(series_info=series_info, now=self.now)
+
+        self.assertEqual(expires_at.date().isoformat(), '2024-06-17')
+
+    def test_release_date_drives_expiry(self):
+        """Test that a series lives until the next release day starts."""
+
+        release_calendar = ReleaseCalendar(paginator=FakePaginator(self.series_service))
+        ttl_policy = TTLPolicy(release_calendar=release_calendar)
+        series_info = self.series_service.get_series(series_id='UNRATE')['seriess'][0]
+        expires_at = ttl_policy.expires_at(series_info=series_info, now=self.now)
+
+        self.assertEqual(expires_at.isoformat(), '2024-07-05T05:00:00+00:00')
+
+    def test_past_vintages_never_expire_early(self):
+        """Test that responses pinned to the past live for `max_ttl`."""
+
+        ttl_policy = TTLPolicy()
+        expires_at = ttl_policy.expires_at(
+            series_info={},
+            now=self.now,
+            params={'vintage_dates': ['2020-01-01', '2021-01-01']}
+        )
+
+        self.assertEqual(expires_at - self.now, ttl_policy.max_ttl)
+
+    def test_response_cache_expires_entries(self):
+        """Test that cached responses are served until their expiry."""
+
+        clock = [self.now]
+        response_cache = ResponseCache(
+            series_service=self.series_service,
+            clock=lambda: clock[0]
+        )
+
+        response_cache.get_series_observations(series_id='DGS10')
+        response_cache.get_series_observations(series_id='DGS10')
+        self.assertEqual((response_cache.hits, response_cache.misses), (1, 2))
+
+        clock[0] = self.now + timedelta(days=3)
+        response_cache.get_series_observations(series_id='DGS10')
+        self.assertEqual(
+            self.series_service.calls.count(('get_series_observations', 'DGS10')),
+            2
+        )
+
+    def test_response_cache_methods_resolve(self):
+        """Test that every cached method exists on `Series` and is served by its wrapper."""
+
+        response_cache = ResponseCache(series_service=self.series_service, clock=lambda: self.now)
+
+        for method in ResponseCache.CACHED_METHODS:
+            self.assertTrue(hasattr(Series, method), method)
+            getattr(response_cache, method)(series_id='DGS10')
+            self.assertIn((method, 'DGS10'), self.series_service.calls)
+
+
+class CentralTimeTest(TestCase):
+
+    """Will perform a unit test for the `CentralTime` fallback time zone."""
+
+    def test_daylight_saving_time(self):
+        """Test that the offset follows the US daylight saving rules, across both changes."""
+
+        central_time = CentralTime()
+        cases = [
+            (datetime(2024, 1, 15, 12, tzinfo=timezone.utc), '20240115 0600', 'CST'),
+            (datetime(2024, 3, 10, 7, 59, tzinfo=timezone.utc), '20240310 0159', 'CST'),
+            (datetime(2024, 3, 10, 8, 0, tzinfo=timezone.utc), '20240310 0300', 'CDT'),
+            (datetime(2024, 7, 4, 12, tzinfo=timezone.utc), '20240704 0700', 'CDT'),
+            (datetime(2024, 11, 3, 6, 30, tzinfo=timezone.utc), '20241103 0130', 'CDT'),
+            (datetime(2024, 11, 3, 7, 30, tzinfo=timezone.utc), '20241103 0130', 'CST')
+        ]
+
+        for value, expected, name in cases:
+            local = value.astimezone(central_time)
+            self.assertEqual((local.strftime('%Y%m%d %H%M'), local.tzname()), (expected, name))
+            self.assertEqual(local.astimezone(timezone.utc), value)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import pathlib
+import tempfile
+import unittest
+
+from unittest import TestCase
+from fred.category_tree import CategoryTree
+from fred.category_index import CategorySeriesIndex
+
+
+class FakePaginator():
+
+    """A `Paginator` stand-in serving the series of a few categories."""
+
+    series = {
+        22: ['DFF', 'DGS10'],
+        115: ['DGS10', 'DGS30'],
+        15: ['DEXJPUS'],
+        12: ['UNRATE']
+    }
+
+    def category_series(self, category_id: str):
+        return iter([{'id': series_id} for series_id in self.series.get(int(category_id), [])])
+
+
+class CategorySeriesIndexTest(TestCase):
+
+    """Will perform a unit test for the `CategorySeriesIndex` object."""
+
+    def setUp(self) -> None:
+        """Harvest the series of a small hierarchy."""
+
+        self.category_tree = CategoryTree(
+            category_ids=[0, 32991, 22, 115, 15, 10, 12],
+            parent_ids=[-1, 0, 32991, 22, 32991, 0, 10],
+            names=['Categories', 'Money', 'Interest Rates', 'Treasury', 'Exchange Rates', 'Labor', 'CPS']
+        )
+        self.category_index = CategorySeriesIndex.harvest(
+            category_tree=self.category_tree,
+            paginator=FakePaginator(),
+            max_workers=2
+        )
+
+    def test_series(self):
+        """Test the series directly in a category."""
+
+        self.assertEqual(self.category_index.series(category_id=115), ['DGS10', 'DGS30'])
+        self.assertEqual(self.category_index.series(category_id=32991), [])
+
+    def test_subtree_series(self):
+        """Test the union of the series under a category."""
+
+        self.assertEqual(
+            self.category_index.subtree_series(category_id=32991),
+            ['DEXJPUS', 'DFF', 'DGS10', 'DGS30']
+        )
+        self.assertEqual(self.category_index.subtree_count(category_id=0), 5)
+
+    def test_categories(self):
+        """Test the reverse map."""
+
+        self.assertEqual(sorted(self.category_index.categories(series_id='DGS10')), [22, 115])
+
+    def test_save_and_load(self):
+        """Test that a saved index loads back identically."""
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = pathlib.Path(directory).joinpath('category_series.json')
+            self.category_index.save(file_path=file_path)
+            loaded = CategorySeriesIndex.load(file_path=file_path, category_tree=self.category_tree)
+
+        self.assertEqual(loaded.subtree_series(category_id=22), ['DFF', 'DGS10', 'DGS30'])
+
+
+if __name__ == '__main__':
+    unittest.main()
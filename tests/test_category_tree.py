@@ -0,0 +1,78 @@
+import pathlib
+import tempfile
+import unittest
+
+from unittest import TestCase
+from fred.category_tree import CategoryTree
+
+
+class FakeCategoriesService():
+
+    """A `Categories` service stand-in serving a small hierarchy."""
+
+    hierarchy = {
+        0: [(32991, 'Money, Banking, & Finance'), (10, 'Population, Employment, & Labor Markets')],
+        32991: [(22, 'Interest Rates'), (15, 'Exchange Rates')],
+        10: [(12, 'Current Population Survey')],
+        22: [(115, 'Treasury Constant Maturity')],
+        15: [],
+        12: [],
+        115: []
+    }
+
+    def get_category(self, category_id: str) -> dict:
+        return {'categories': [{'id': 0, 'name': 'Categories', 'parent_id': 0}]}
+
+    def get_category_children(self, category_id: str) -> dict:
+        return {
+            'categories': [
+                {'id': child_id, 'name': name, 'parent_id': int(category_id)}
+                for child_id, name in self.hierarchy[int(category_id)]
+            ]
+        }
+
+
+class CategoryTreeTest(TestCase):
+
+    """Will perform a unit test for the `CategoryTree` object."""
+
+    def setUp(self) -> None:
+        """Crawl the small hierarchy."""
+
+        self.category_tree = CategoryTree.crawl(
+            categories_service=FakeCategoriesService(),
+            max_workers=2
+        )
+
+    def test_crawl(self):
+        """Test that every category was reached."""
+
+        self.assertEqual(len(self.category_tree), 7)
+        self.assertEqual(self.category_tree.name(category_id=115), 'Treasury Constant Maturity')
+        self.assertEqual(self.category_tree.parent(category_id=115), 22)
+        self.assertIsNone(self.category_tree.parent(category_id=0))
+
+    def test_hierarchy_queries(self):
+        """Test the ancestor, descendant and children queries."""
+
+        self.assertEqual(self.category_tree.path_to_root(category_id=115), [115, 22, 32991, 0])
+        self.assertEqual(self.category_tree.ancestors(category_id=115), [22, 32991, 0])
+        self.assertEqual(sorted(self.category_tree.descendants(category_id=32991)), [15, 22, 115])
+        self.assertEqual(self.category_tree.children(category_id=32991), [15, 22])
+        self.assertTrue(self.category_tree.is_descendant(category_id=115, ancestor_id=32991))
+        self.assertFalse(self.category_tree.is_descendant(category_id=12, ancestor_id=32991))
+
+    def test_save_and_load(self):
+        """Test that a saved snapshot loads back identically."""
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = pathlib.Path(directory).joinpath('categories.json')
+            self.category_tree.save(file_path=file_path)
+            loaded = CategoryTree.load(file_path=file_path)
+
+        self.assertEqual(loaded.subtree(category_id=0), self.category_tree.subtree(category_id=0))
+        self.assertEqual(loaded.path_to_root(category_id=12), [12, 10, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,6 +8,8 @@ from fred.releases import Releases
 from fred.sources import Sources
 from fred.series import Series
 from fred.tags import Tags
+from fred.paginator import Paginator
+from fred.mirror import FredMirror
 
 
 class FredClientTest(TestCase):
@@ -65,6 +67,21 @@ class FredClientTest(TestCase):
         tags_services = self.fred_client.tags()
         self.assertIsInstance(tags_services, Tags)
 
+    def test_creates_instance_of_paginator(self):
+        """Create an instance and make sure it's a `fred.Paginator` object."""
+
+        # Initialize the Paginator.
+        paginator = self.fred_client.paginator()
+        self.assertIsInstance(paginator, Paginator)
+
+    def test_creates_instance_of_mirror(self):
+        """Create an instance and make sure it's a `fred.FredMirror` attached to the session."""
+
+        # Initialize the Mirror.
+        fred_mirror = self.fred_client.mirror(database_path=':memory:')
+        self.assertIsInstance(fred_mirror, FredMirror)
+        self.assertIs(self.fred_client.fred_session.mirror, fred_mirror)
+
     def tearDown(self) -> None:
         """Teardown the `FederalReserveClient` Client."""
         del self.fred_client
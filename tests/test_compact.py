@@ -0,0 +1,68 @@
+import sys
+import unittest
+
+from unittest import TestCase
+from fred.compact import CompactObservations
+
+
+class CompactObservationsTest(TestCase):
+
+    """Will perform a unit test for the `CompactObservations` object."""
+
+    def setUp(self) -> None:
+        """Set up an `output_type=1` observations response."""
+
+        self.content = {
+            'count': 3,
+            'observations': [
+                {'realtime_start': '2020-01-01', 'realtime_end': '2020-06-30', 'date': '2019-01-01', 'value': '1.5'},
+                {'realtime_start': '2020-07-01', 'realtime_end': '9999-12-31', 'date': '2019-01-01', 'value': '1.75'},
+                {'realtime_start': '2020-07-01', 'realtime_end': '9999-12-31', 'date': '2019-04-01', 'value': '.'}
+            ]
+        }
+        self.observations = CompactObservations.from_response(
+            content=self.content,
+            series_id='GNPCA'
+        )
+
+    def test_round_trip(self):
+        """Test that rows come back in the FRED shape."""
+
+        self.assertEqual(len(self.observations), 3)
+        self.assertEqual(self.observations.to_response(), self.content)
+
+    def test_intervals_are_dictionary_encoded(self):
+        """Test that repeated real-time periods are stored once."""
+
+        self.assertEqual(len(self.observations.interval_starts), 2)
+        self.assertEqual(list(self.observations.interval_codes), [0, 1, 1])
+
+    def test_as_of(self):
+        """Test the `as_of` method."""
+
+        rows = self.observations.as_of(realtime_date='2020-03-15')
+        self.assertEqual(rows, [self.content['observations'][0]])
+
+    def test_memory_is_smaller_than_rows(self):
+        """Test that a large pull takes less memory than the raw rows."""
+
+        rows = [
+            {
+                'realtime_start': '2020-01-01',
+                'realtime_end': '9999-12-31',
+                'date': '2019-01-%02d' % (day % 28 + 1),
+                'value': str(day)
+            }
+            for day in range(10000)
+        ]
+        raw_size = sys.getsizeof(rows) + sum(
+            sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row.values())
+            for row in rows
+        )
+
+        observations = CompactObservations.from_response(content={'observations': rows})
+        self.assertLess(observations.nbytes() * 5, raw_size)
+
+
+if __name__ == '__main__':
+    unittest.main()
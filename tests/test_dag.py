@@ -0,0 +1,118 @@
+import unittest
+import threading
+
+from unittest import TestCase
+from fred.dag import FredDAG
+
+
+class FakeSeriesService():
+
+    """A `Series` service stand-in returning canned metadata and observations."""
+
+    def __init__(self) -> None:
+        self.fetched = threading.Event()
+
+    def get_series(self, series_id: str) -> dict:
+        return {'seriess': [{'id': series_id, 'frequency_short': 'M'}]}
+
+    def get_series_observations(self, series_id: str) -> dict:
+        if series_id == 'BROKEN':
+            raise ValueError('No observations.')
+        self.fetched.set()
+        return {'observations': [{'date': '2024-01-01', 'value': '1.0'}]}
+
+
+class FredDAGTest(TestCase):
+
+    """Will perform a unit test for the `FredDAG` object."""
+
+    def setUp(self) -> None:
+        """Set up the `FredDAG` object."""
+
+        self.series_service = FakeSeriesService()
+        self.fred_dag = FredDAG(max_workers=4)
+
+    def test_join_and_broadcast(self):
+        """Test that a node with several dependencies joins them by key."""
+
+        self.fred_dag.add_node(name='units', function=lambda: 'lin')
+        self.fred_dag.add_node(
+            name='series',
+            function=lambda: [{'id': 'GDP'}, {'id': 'UNRATE'}],
+            fan_out=True
+        )
+        self.fred_dag.add_node(
+            name='metadata',
+            function=lambda series: self.series_service.get_series(series_id=series['id']),
+            depends_on=['series']
+        )
+        self.fred_dag.add_node(
+            name='observations',
+            function=lambda series: self.series_service.get_series_observations(series_id=series['id']),
+            depends_on=['series']
+        )
+        self.fred_dag.add_node(
+            name='summary',
+            function=lambda metadata, observations, units: (
+                metadata['seriess'][0]['frequency_short'], len(observations['observations']), units
+            ),
+            depends_on=['metadata', 'observations', 'units']
+        )
+
+        result = self.fred_dag.run()
+
+        self.assertEqual(result.outputs['summary'], {'GDP': ('M', 1, 'lin'), 'UNRATE': ('M', 1, 'lin')})
+        self.assertEqual(result.timings()['observations']['tasks'], 2)
+        self.assertEqual(result.timings()['series']['items'], 2)
+
+    def test_pipelining(self):
+        """Test that downstream work starts before the source is exhausted."""
+
+        def source():
+            yield {'id': 'GDP'}
+            # Only finishes once the first item went through the next stage.
+            self.assertTrue(self.series_service.fetched.wait(timeout=5))
+            yield {'id': 'UNRATE'}
+
+        self.fred_dag.add_node(name='series', function=source, fan_out=True)
+        self.fred_dag.add_node(
+            name='observations',
+            function=lambda series: self.series_service.get_series_observations(series_id=series['id']),
+            depends_on=['series']
+        )
+
+        result = self.fred_dag.run()
+
+        self.assertEqual(sorted(result.outputs['observations']), ['GDP', 'UNRATE'])
+        self.assertEqual(result.errors['series'], {})
+
+    def test_errors_stop_the_key(self):
+        """Test that a failed task is recorded and its key goes no further."""
+
+        self.fred_dag.add_node(name='series', function=lambda: ['GDP', 'BROKEN'], fan_out=True)
+        self.fred_dag.add_node(
+            name='observations',
+            function=lambda series_id: self.series_service.get_series_observations(series_id=series_id),
+            depends_on=['series']
+        )
+        self.fred_dag.add_node(
+            name='count',
+            function=lambda observations: len(observations['observations']),
+            depends_on=['observations']
+        )
+
+        result = self.fred_dag.run()
+
+        self.assertEqual(result.outputs['count'], {'GDP': 1})
+        self.assertIn('BROKEN', result.errors['observations'])
+        self.assertEqual(result.stats['observations'].errors, 1)
+
+    def test_dependencies_must_exist(self):
+        """Test that nodes are added after the nodes they depend on."""
+
+        with self.assertRaises(ValueError):
+            self.fred_dag.add_node(name='observations', function=len, depends_on=['series'])
+
+
+if __name__ == '__main__':
+    unittest.main()
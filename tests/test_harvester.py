@@ -0,0 +1,78 @@
+import unittest
+
+from unittest import TestCase
+from fred.harvester import BulkHarvester
+from fred.paginator import Paginator
+from fakes import FakeSession
+
+
+class FakeReleasesSession(FakeSession):
+
+    """A `FredSession` stand-in serving two releases of one source."""
+
+    def respond(self, endpoint: str, params: dict) -> dict:
+        if endpoint == '/source/releases':
+            return {'count': 2, 'releases': [{'id': 1}, {'id': 2}]}
+
+        if endpoint == '/release/series':
+            ids = {'1': ['A', 'B', 'C'], '2': ['C', 'D']}[params['release_id']]
+            return {'count': len(ids), 'seriess': [{'id': series_id} for series_id in ids]}
+
+        if endpoint == '/series/observations':
+            if params['series_id'] == 'D':
+                raise ValueError('Not found.')
+
+            rows = [
+                {'date': '2020-01-{day:02d}'.format(day=day), 'value': str(day)}
+                for day in range(1, 6)
+            ]
+            page = rows[params['offset']:params['offset'] + params['limit']]
+
+            return {'count': len(rows), 'observations': page}
+
+        raise KeyError(endpoint)
+
+
+class BulkHarvesterTest(TestCase):
+
+    """Will perform a unit test for the `BulkHarvester` object."""
+
+    def setUp(self) -> None:
+        """Set up the `BulkHarvester` object."""
+
+        self.session = FakeReleasesSession()
+        self.written = {}
+        self.reports = []
+        self.harvester = BulkHarvester(
+            paginator=Paginator(session=self.session),
+            writer=self.written.__setitem__,
+            max_workers=2,
+            progress_callback=lambda progress: self.reports.append(progress.as_dict()),
+            limit=2
+        )
+
+    def test_harvest_source(self):
+        """Test harvesting every series of a source, once each."""
+
+        progress = self.harvester.harvest_source(source_id=1)
+
+        self.assertEqual(progress.total, 4)
+        self.assertEqual(progress.completed, 3)
+        self.assertEqual(progress.failed, 1)
+        self.assertIn('D', progress.errors)
+        self.assertEqual(sorted(self.written), ['A', 'B', 'C'])
+
+    def test_observations_are_paged(self):
+        """Test that every observation page of a series is fetched and merged."""
+
+        progress = self.harvester.harvest(series_ids=['A'])
+
+        self.assertEqual(len(self.written['A']['observations']), 5)
+        self.assertEqual(progress.observations, 5)
+        self.assertEqual(self.session.endpoints.count('/series/observations'), 3)
+        self.assertEqual(self.reports[-1]['completed'], 1)
+        self.assertEqual(self.reports[-1]['eta'], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+
+from unittest import TestCase
+from fred.limiter import RateLimiter
+
+
+class RateLimiterTest(TestCase):
+
+    """Will perform a unit test for the `RateLimiter` object."""
+
+    def test_burst_then_wait(self):
+        """Test that the bucket allows a burst, then asks to wait."""
+
+        rate_limiter = RateLimiter(rate=1.0, capacity=3)
+
+        for _ in range(3):
+            self.assertEqual(rate_limiter.try_acquire(), 0.0)
+
+        wait = rate_limiter.try_acquire()
+        self.assertGreater(wait, 0.9)
+        self.assertLessEqual(wait, 1.0)
+
+    def test_acquire_blocks(self):
+        """Test that `acquire` waits for the refill."""
+
+        rate_limiter = RateLimiter(rate=50.0, capacity=1)
+        rate_limiter.acquire()
+
+        self.assertGreater(rate_limiter.acquire(), 0.01)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+import unittest
+import tempfile
+import pathlib
+
+from unittest import TestCase
+from unittest import mock
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from fred.mirror import FredMirror
+from fred.paginator import Paginator
+from fred.session import FredSession
+from fakes import FakeClient
+from fakes import FakeSession
+
+
+class FakeFredSession(FakeSession):
+
+    """A `FredSession` stand-in serving a tiny FRED: 3 categories, 2 releases, 3 series."""
+
+    SERIES = {
+        'GNPCA': {'release': 53, 'category': 1, 'tags': ['usa', 'annual', 'gnp'], 'popularity': 50},
+        'UNRATE': {'release': 50, 'category': 2, 'tags': ['usa', 'monthly', 'sa'], 'popularity': 90},
+        'UNRATENSA': {'release': 50, 'category': 2, 'tags': ['usa', 'monthly', 'nsa'], 'popularity': 40}
+    }
+
+    TAG_NAMES = ['annual', 'gnp', 'monthly', 'nsa', 'sa', 'usa']
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.updates = []
+        self.failing_endpoints = []
+
+        # Each endpoint's response, built from the request parameters.
+        self.responses = {
+            '/category': lambda params: {'categories': [{'id': 0, 'name': 'Categories', 'parent_id': 0}]},
+            '/category/children': self._category_children,
+            '/category/series': lambda params: self._series_page(
+                lambda info: info['category'] == int(params['category_id'])
+            ),
+            '/releases': lambda params: {
+                'count': 2,
+                'releases': [{'id': 50, 'name': 'Employment'}, {'id': 53, 'name': 'GDP'}]
+            },
+            '/sources': lambda params: {'count': 1, 'sources': [{'id': 22, 'name': 'BLS'}]},
+            '/tags': lambda params: {
+                'count': len(self.TAG_NAMES),
+                'tags': [{'name': name, 'group_id': 'gen', 'series_count': 1} for name in self.TAG_NAMES]
+            },
+            '/release/series': lambda params: self._series_page(
+                lambda info: info['release'] == int(params['release_id'])
+            ),
+            '/release/sources': lambda params: {'sources': [{'id': 22, 'name': 'BLS'}]},
+            '/tags/series': lambda params: self._series_page(lambda info: params['tag_names'][0] in info['tags']),
+            '/series/updates': lambda params: {'count': len(self.updates), 'seriess': self.updates[params['offset']:]},
+            '/series/release': lambda params: {'releases': [{'id': 53, 'name': 'GDP'}]},
+            '/series/categories': lambda params: {'categories': [{'id': 1, 'name': 'C1', 'parent_id': 0}]},
+            '/series/tags': lambda params: {'tags': [{'name': 'usa'}]}
+        }
+
+    def respond(self, endpoint: str, params: dict) -> dict:
+        if endpoint in self.failing_endpoints:
+            raise ConnectionError(endpoint)
+
+        return self.responses[endpoint](params)
+
+    def _category_children(self, params: dict) -> dict:
+        children = {'0': [1, 2]}.get(params['category_id'], [])
+        return {'categories': [{'id': child, 'name': 'C{id}'.format(id=child), 'parent_id': 0} for child in children]}
+
+    def _series_page(self, predicate) -> dict:
+        seriess = [
+            {'id': series_id, 'title': series_id, 'popularity': info['popularity']}
+            for series_id, info in self.SERIES.items() if predicate(info)
+        ]
+        return {'count': len(seriess), 'seriess': seriess}
+
+
+class FredMirrorTest(TestCase):
+
+    """Will perform a unit test for the `FredMirror` object."""
+
+    def setUp(self) -> None:
+        """Build the mirror in a temporary database."""
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.session = FakeFredSession()
+        self.now = datetime(2024, 6, 14, 12, 0, tzinfo=timezone.utc)
+        self.fred_mirror = FredMirror(
+            database_path=pathlib.Path(self.directory.name) / 'fred.db',
+            paginator=Paginator(session=self.session),
+            max_workers=2
+        )
+        self.fred_mirror.build(now=self.now)
+
+    def tearDown(self) -> None:
+        """Remove the temporary database."""
+
+        self.fred_mirror.close()
+        self.directory.cleanup()
+
+    def test_build(self):
+        """Test that every table is filled."""
+
+        counts = self.fred_mirror.counts()
+
+        self.assertEqual(counts['categories'], 3)
+        self.assertEqual(counts['series'], 3)
+        self.assertEqual(counts['series_tags'], 9)
+        self.assertEqual(counts['release_sources'], 2)
+
+    def test_answers(self):
+        """Test that metadata requests are answered locally, in the API shape."""
+
+        answer = self.fred_mirror.answer
+
+        self.assertEqual(answer('/series', {'series_id': 'UNRATE'})['seriess'][0]['popularity'], 90)
+        self.assertIsNone(answer('/series', {'series_id': 'MISSING'}))
+        content = answer('/release/series', {'release_id': '50', 'order_by': 'popularity', 'sort_order': 'desc'})
+        self.assertEqual([item['id'] for item in content['seriess']], ['UNRATE', 'UNRATENSA'])
+        self.assertEqual(answer('/series/release', {'series_id': 'GNPCA'})['releases'][0]['name'], 'GDP')
+        self.assertEqual([item['id'] for item in answer('/category/children', {'category_id': 0})['categories']], [1, 2])
+        self.assertEqual(answer('/category/children', {'category_id': 1})['categories'], [])
+        self.assertIsNone(answer('/category/children', {'category_id': 99}))
+
+        content = answer('/tags/series', {'tag_names': 'usa;monthly', 'exclude_tag_names': 'nsa'})
+        self.assertEqual((content['count'], content['seriess'][0]['id']), (1, 'UNRATE'))
+
+        # The past and unsupported filters go to the API.
+        self.assertIsNone(
+            answer('/series', {'series_id': 'UNRATE', 'realtime_start': '2000-01-01', 'realtime_end': '2000-01-01'})
+        )
+        self.assertIsNone(
+            answer('/category/series', {'category_id': 2, 'filter_variable': 'frequency', 'filter_value': 'Monthly'})
+        )
+
+    def test_failed_build(self):
+        """Test that a crawl failing midway keeps the batches written so far and answers nothing."""
+
+        self.session.failing_endpoints = ['/tags/series']
+
+        with self.assertRaises(ConnectionError):
+            self.fred_mirror.build(now=self.now)
+
+        self.assertFalse(self.fred_mirror.is_built)
+        self.assertEqual(self.fred_mirror.counts()['series'], 3)
+        self.assertIsNone(self.fred_mirror.answer('/series', {'series_id': 'UNRATE'}))
+
+    def test_refresh(self):
+        """Test that the updates feed adds new series with their links."""
+
+        self.session.updates = [{'id': 'GDP', 'title': 'GDP', 'popularity': 95}]
+        changes = self.fred_mirror.refresh(now=self.now + timedelta(hours=1))
+
+        self.assertEqual(changes['added'], 1)
+        self.assertEqual(self.fred_mirror.answer('/series/release', {'series_id': 'GDP'})['releases'][0]['id'], 53)
+
+    def test_refresh_batches_known_ids(self):
+        """Test that the known series are looked up in batches, and a naive time is taken as local time."""
+
+        self.session.updates = [
+            {'id': 'GNPCA', 'title': 'GNPCA', 'popularity': 51},
+            {'id': 'UNRATE', 'title': 'UNRATE', 'popularity': 91},
+            {'id': 'GDP', 'title': 'GDP', 'popularity': 95}
+        ]
+        now = (self.now + timedelta(hours=1)).astimezone().replace(tzinfo=None)
+
+        with mock.patch('fred.mirror.VARIABLES_PER_QUERY', 2):
+            changes = self.fred_mirror.refresh(now=now)
+
+        self.assertEqual(changes, {'updated': 2, 'added': 1, 'rebuilt': 0})
+        self.assertEqual(self.fred_mirror.get_meta(key='last_refresh'), (self.now + timedelta(hours=1)).isoformat())
+
+    def test_session_hook(self):
+        """Test that `FredSession.make_request` answers from an attached mirror."""
+
+        fred_session = FredSession(client=FakeClient())
+        fred_session.mirror = self.fred_mirror
+
+        content = fred_session.make_request(
+            method='get',
+            endpoint='/series',
+            params={'series_id': 'GNPCA', 'api_key': 'xxxxxx', 'file_type': 'json'}
+        )
+
+        self.assertEqual(content['seriess'][0]['id'], 'GNPCA')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+
+from unittest import TestCase
+from fred.paginator import Paginator
+from fakes import FakeSession
+
+
+class FakeCategorySession(FakeSession):
+
+    """A `FredSession` stand-in serving 2,500 series from `/category/series`."""
+
+    def respond(self, endpoint: str, params: dict) -> dict:
+        ids = ['S{number:04d}'.format(number=number) for number in range(2500)]
+        page = ids[params['offset']:params['offset'] + params['limit']]
+
+        return {'count': len(ids), 'seriess': [{'id': series_id} for series_id in page]}
+
+
+class PaginatorTest(TestCase):
+
+    """Will perform a unit test for the `Paginator` object."""
+
+    def setUp(self) -> None:
+        """Set up the `Paginator` object."""
+
+        self.fred_session = FakeCategorySession()
+        self.paginator = Paginator(session=self.fred_session, max_workers=2)
+
+    def test_yields_every_item_in_order(self):
+        """Test that every page is fetched once and the items stay in order."""
+
+        series = self.paginator.category_series(category_id='125', collect=True)
+
+        self.assertEqual(len(series), 2500)
+        self.assertEqual(series[0]['id'], 'S0000')
+        self.assertEqual(series[-1]['id'], 'S2499')
+        self.assertEqual(sorted(params['offset'] for _, params in self.fred_session.requests), [0, 1000, 2000])
+
+    def test_is_lazy(self):
+        """Test that nothing is fetched before the generator is consumed."""
+
+        series = self.paginator.category_series(category_id='125')
+
+        self.assertEqual(self.fred_session.requests, [])
+        self.assertEqual(next(series)['id'], 'S0000')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+
+from unittest import TestCase
+from fred.category_tree import CategoryTree
+from fred.category_index import CategorySeriesIndex
+from fred.paginator import Paginator
+from fred.planner import QueryPlanner
+from fred.planner import SeriesQuery
+from fred.tag_index import TagIndex
+from fakes import FakeSession
+
+
+class FakeTagsSession(FakeSession):
+
+    """A `FredSession` stand-in serving the series of category 1 with their tags."""
+
+    TAGS = {
+        'UNRATE': ['usa', 'monthly', 'sa'],
+        'UNRATENSA': ['usa', 'monthly', 'nsa'],
+        'CAUR': ['california', 'monthly', 'sa']
+    }
+
+    def respond(self, endpoint: str, params: dict) -> dict:
+        tag_names = params.get('tag_names') or []
+        exclude_tag_names = params.get('exclude_tag_names') or []
+        seriess = [
+            {'id': series_id} for series_id, tags in self.TAGS.items()
+            if all(name in tags for name in tag_names) and not any(name in tags for name in exclude_tag_names)
+        ]
+
+        return {'count': len(seriess), 'seriess': seriess}
+
+
+class QueryPlannerTest(TestCase):
+
+    """Will perform a unit test for the `QueryPlanner` object."""
+
+    def setUp(self) -> None:
+        """Set up the `QueryPlanner` object."""
+
+        self.session = FakeTagsSession()
+        self.query = SeriesQuery(category_id=1, tag_names=['usa', 'monthly'], exclude_tag_names=['nsa'])
+
+    def test_api_plan_then_cache(self):
+        """Test that the cheapest API path runs once and its result is reused."""
+
+        query_planner = QueryPlanner(paginator=Paginator(session=self.session))
+
+        result = query_planner.execute(query=self.query)
+        self.assertEqual((result['plan'], result['series_ids']), ('filtered_listing', ['UNRATE']))
+        self.assertEqual(self.session.endpoints, ['/category/series'])
+
+        result = query_planner.execute(query=self.query)
+        self.assertEqual(result['plan'], 'cache')
+        self.assertEqual(len(self.session.endpoints), 1)
+
+    def test_costs_use_known_counts(self):
+        """Test that a large category makes the tag intersection expensive."""
+
+        query_planner = QueryPlanner(paginator=Paginator(session=self.session))
+        query_planner.known_counts[(('category', 1), (), ())] = 50000
+
+        plans = query_planner.explain(query=self.query)
+
+        self.assertEqual([plan['name'] for plan in plans], ['filtered_listing', 'tags_intersection'])
+        self.assertEqual(plans[1]['api_calls'], 51)
+
+    def test_local_indexes(self):
+        """Test that the local indexes answer without any API call."""
+
+        category_tree = CategoryTree(category_ids=[0, 1], parent_ids=[-1, 0], names=['Categories', 'Labor'])
+        category_index = CategorySeriesIndex(
+            category_tree=category_tree,
+            series_by_category={1: list(FakeTagsSession.TAGS)}
+        )
+        tag_index = TagIndex()
+        for series_id, names in FakeTagsSession.TAGS.items():
+            tag_index.add_series_tags(series_id=series_id, tags=[{'name': name} for name in names])
+
+        query_planner = QueryPlanner(
+            paginator=Paginator(session=self.session),
+            tag_index=tag_index,
+            category_index=category_index
+        )
+        result = query_planner.execute(query=self.query)
+
+        self.assertEqual((result['plan'], result['series_ids']), ('local_index', ['UNRATE']))
+        self.assertEqual(self.session.endpoints, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import socket
+import unittest
+import threading
+import requests
+
+from unittest import TestCase
+from unittest import mock
+from fred.breaker import CircuitBreakers
+from fred.profiler import SessionProfiler
+from fred.session import FredSession
+from fakes import FakeClient
+from fakes import FakeResponse
+
+
+class SessionProfilerTest(TestCase):
+
+    """Will perform a unit test for the `SessionProfiler` object."""
+
+    def test_report(self):
+        """Test that phases are totaled per endpoint and user time is what is left."""
+
+        profiler = SessionProfiler()
+        profiler.started, profiler.ended = 0.0, 1.0
+        profiler.owner = threading.get_ident()
+        profiler.record(endpoint='/series', phases={'first_byte': 0.2, 'decode': 0.1}, response_bytes=10)
+        profiler.record(endpoint='/series', phases={'first_byte': 0.4, 'decode': 0.1}, response_bytes=30)
+
+        report = profiler.report()
+
+        self.assertEqual(report['endpoints']['/series']['calls'], 2)
+        self.assertEqual(report['endpoints']['/series']['bytes'], 40)
+        self.assertAlmostEqual(report['total']['phases']['first_byte']['max_seconds'], 0.4)
+        self.assertAlmostEqual(report['total']['phases']['decode']['share'], 0.25)
+        self.assertAlmostEqual(report['user_seconds'], 0.2)
+        self.assertIn('/series', profiler.format_report())
+
+    def test_user_time_of_the_opening_thread(self):
+        """Test that calls recorded by worker threads do not count against user time."""
+
+        profiler = SessionProfiler()
+        profiler.start()
+
+        worker = threading.Thread(
+            target=profiler.record,
+            kwargs={'endpoint': '/category/series', 'phases': {'first_byte': 100.0}}
+        )
+        worker.start()
+        worker.join()
+        profiler.record(endpoint='/series', phases={'first_byte': 0.0})
+        profiler.stop()
+
+        report = profiler.report()
+
+        self.assertGreater(report['user_seconds'], 0.0)
+        self.assertEqual(report['user_seconds'], report['wall_seconds'])
+
+    def test_session_profile(self):
+        """Test that `FredSession.profile` records each phase of a request."""
+
+        fred_session = FredSession(client=FakeClient())
+        response = FakeResponse(body={'observations': []})
+
+        with mock.patch.object(requests.Session, 'send', return_value=response) as send, \
+                mock.patch.object(socket, 'getaddrinfo', return_value=[]):
+            with fred_session.profile(cprofile=True, memory=True) as profiler:
+                fred_session.make_request(
+                    method='get',
+                    endpoint='/series/observations',
+                    params={'series_id': 'GNPCA', 'api_key': 'xxxxxx', 'file_type': 'json'}
+                )
+
+        self.assertIsNone(fred_session.profiler)
+        self.assertTrue(send.call_args.kwargs['stream'])
+
+        report = profiler.report()
+        phases = report['endpoints']['/series/observations']['phases']
+
+        self.assertEqual(set(phases), {'limiter_wait', 'dns', 'first_byte', 'transfer', 'decode'})
+        self.assertEqual(report['total']['bytes'], len(response.content))
+        self.assertIn('cumulative', report['cprofile'])
+        self.assertIsInstance(report['memory'], list)
+
+    def test_session_profile_statuses(self):
+        """Test that failed, fallback and mirror answers are recorded with their status."""
+
+        fred_session = FredSession(client=FakeClient())
+        fred_session.rate_limiter = None
+        fred_session.circuit_breakers = CircuitBreakers(min_calls=1)
+        params = {'series_id': 'GNPCA', 'api_key': 'xxxxxx', 'file_type': 'json'}
+
+        with mock.patch.object(socket, 'getaddrinfo', return_value=[]), fred_session.profile() as profiler:
+            with mock.patch.object(requests.Session, 'send', return_value=FakeResponse(body={'seriess': []})):
+                fred_session.make_request(method='get', endpoint='/series', params=dict(params))
+
+            with mock.patch.object(requests.Session, 'send', side_effect=requests.ConnectionError()):
+                with self.assertRaises(requests.ConnectionError):
+                    fred_session.make_request(method='get', endpoint='/series', params=dict(params))
+                fred_session.make_request(method='get', endpoint='/series', params=dict(params))
+
+            fred_session.mirror = mock.Mock(**{'answer.return_value': {'seriess': []}})
+            fred_session.make_request(method='get', endpoint='/series', params=dict(params))
+
+        summary = profiler.report()['endpoints']['/series']
+
+        self.assertEqual(summary['statuses'], {'success': 1, 'failed': 1, 'mirror': 1, 'fallback': 1})
+        self.assertEqual(summary['bytes'], len(b'{"seriess": []}'))
+        self.assertEqual([call['status'] for call in profiler.calls], ['success', 'failed', 'fallback', 'mirror'])
+        self.assertIn('first_byte', profiler.calls[1]['phases'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import unittest
+
+from datetime import date
+from datetime import timedelta
+from unittest import TestCase
+from fred.release_calendar import ReleaseCalendar
+
+
+class FakeSeriesService():
+
+    """A `Series` service stand-in that counts the release lookups."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def get_series_release(self, series_id: str) -> dict:
+        self.calls += 1
+        return {'releases': [{'id': 53, 'name': 'Gross Domestic Product'}]}
+
+
+class FakePaginator():
+
+    """A `Paginator` stand-in serving a small release calendar."""
+
+    def __init__(self) -> None:
+        self.series_service = FakeSeriesService()
+        self.release_dates = [
+            {'release_id': 53, 'release_name': 'Gross Domestic Product', 'date': '2021-01-28'},
+            {'release_id': 50, 'release_name': 'Employment Situation', 'date': '2021-02-05'},
+            {'release_id': 53, 'release_name': 'Gross Domestic Product', 'date': '2021-02-25'},
+            {'release_id': 10, 'release_name': 'Consumer Price Index', 'date': '2021-02-10'},
+            {'release_id': 50, 'release_name': 'Employment Situation', 'date': '2021-03-05'},
+            {'release_id': 53, 'release_name': 'Gross Domestic Product', 'date': '2021-03-25'},
+            {'release_id': 10, 'release_name': 'Consumer Price Index', 'date': '2021-03-05'}
+        ]
+        self.calls = []
+
+    def releases_dates(self, **kwargs):
+        self.calls.append(kwargs)
+        return iter(self.release_dates)
+
+
+class ReleaseCalendarTest(TestCase):
+
+    """Will perform a unit test for the `ReleaseCalendar` object."""
+
+    def setUp(self) -> None:
+        """Harvest the small calendar."""
+
+        self.paginator = FakePaginator()
+        self.release_calendar = ReleaseCalendar(paginator=self.paginator)
+        self.added = self.release_calendar.harvest()
+
+    def test_next_and_previous(self):
+        """Test the next and previous release dates of a release."""
+
+        self.assertEqual(self.added, 7)
+        self.assertEqual(
+            self.release_calendar.next_release_date(release_id=53, after='2021-02-25'),
+            date(2021, 3, 25)
+        )
+        self.assertEqual(
+            self.release_calendar.previous_release_date(release_id=53, on_or_before='2021-02-25'),
+            date(2021, 2, 25)
+        )
+        self.assertIsNone(self.release_calendar.next_release_date(release_id=53, after='2021-03-25'))
+        self.assertIsNone(self.release_calendar.previous_release_date(release_id=50, on_or_before='2021-01-01'))
+
+    def test_releases_on(self):
+        """Test the releases published on a date."""
+
+        self.assertEqual(self.release_calendar.releases_on(day='2021-03-05'), [10, 50])
+        self.assertEqual(self.release_calendar.releases_on(day=date(2021, 3, 6)), [])
+
+    def test_series_lookups_are_cached(self):
+        """Test that the release of a series is only asked for once."""
+
+        for _ in range(3):
+            next_date = self.release_calendar.next_series_release_date(series_id='GDP', after='2021-01-01')
+
+        self.assertEqual(next_date, date(2021, 1, 28))
+        self.assertEqual(self.paginator.series_service.calls, 1)
+
+    def test_refresh_is_incremental(self):
+        """Test that a refresh only adds the new dates."""
+
+        self.paginator.release_dates.append(
+            {'release_id': 53, 'release_name': 'Gross Domestic Product', 'date': '2021-04-29'}
+        )
+
+        self.assertEqual(self.release_calendar.refresh(), 1)
+        self.assertEqual(
+            self.paginator.calls[-1]['realtime_start'],
+            (self.release_calendar.last_refresh - timedelta(days=1)).isoformat()
+        )
+        self.assertEqual(len(self.release_calendar.dates_by_release[53]), 4)
+
+    def test_refresh_replaces_the_window(self):
+        """Test that a refresh drops the rescheduled and cancelled dates of its window."""
+
+        self.release_calendar.last_refresh = date(2021, 3, 1)
+
+        # GDP moves from 2021-03-25 to 2021-03-26 and the 2021-03-05 CPI release is cancelled.
+        self.paginator.release_dates = [
+            item for item in self.paginator.release_dates
+            if (item['release_id'], item['date']) not in [(53, '2021-03-25'), (10, '2021-03-05')]
+        ]
+        self.paginator.release_dates.append(
+            {'release_id': 53, 'release_name': 'Gross Domestic Product', 'date': '2021-03-26'}
+        )
+
+        self.assertEqual(self.release_calendar.refresh(), 1)
+        self.assertEqual(
+            self.release_calendar.next_release_date(release_id=53, after='2021-02-25'),
+            date(2021, 3, 26)
+        )
+        self.assertEqual(self.release_calendar.releases_on(day='2021-03-05'), [50])
+        self.assertEqual(self.release_calendar.releases_on(day='2021-03-25'), [])
+        self.assertIsNone(self.release_calendar.next_release_date(release_id=10, after='2021-02-10'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,72 @@ import unittest
 from unittest import TestCase
 from configparser import ConfigParser
 from fred.client import FederalReserveClient
+from fred.releases import Releases
+from fakes import FakeSession
+
+
+class FakeTableSession(FakeSession):
+
+    """A `FredSession` stand-in serving one level of a release table per request.
+
+    The table is: 1 (with children 3 and 4), then 2.
+    """
+
+    CHILDREN = {None: [(1, 'group', '1'), (2, 'series', '2')], 1: [(4, 'series', '2'), (3, 'series', '1')]}
+
+    def respond(self, endpoint: str, params: dict) -> dict:
+        elements = {
+            str(element_id): {
+                'element_id': element_id,
+                'series_id': 'S{id}'.format(id=element_id) if element_type == 'series' else None,
+                'name': 'Element {id}'.format(id=element_id),
+                'type': element_type,
+                'line': line,
+                'observation_value': params['observation_date'] if element_type == 'series' else None,
+                'children': []
+            }
+            for element_id, element_type, line in self.CHILDREN.get(params['element_id'], [])
+        }
+
+        return {'elements': elements}
+
+
+class ReleaseTableTreeTest(TestCase):
+
+    """Will perform an offline unit test for `Releases.get_release_table_tree` and its sweep."""
+
+    def setUp(self) -> None:
+        """Set up the `Releases` service on a fake session."""
+
+        self.fred_session = FakeTableSession()
+        self.releases_services = Releases(session=self.fred_session)
+
+    def test_get_release_table_tree(self):
+        """Test that every level is fetched and flattened in table order."""
+
+        table = self.releases_services.get_release_table_tree(release_id='53', max_workers=2)
+
+        self.assertEqual(table['element_id'], [1, 3, 4, 2])
+        self.assertEqual(table['parent_id'], [None, 1, 1, None])
+        self.assertEqual(table['series_id'], [None, 'S3', 'S4', 'S2'])
+        self.assertEqual(len(self.fred_session.requests), 5)
+
+    def test_get_release_table_sweep(self):
+        """Test that later expansions only fetch the elements known to have children."""
+
+        self.releases_services.get_release_table_tree(release_id='53', max_workers=2)
+        self.fred_session.requests.clear()
+
+        snapshots = self.releases_services.get_release_table_sweep(
+            release_id='53',
+            observation_dates=['2019-01-01', '2020-01-01'],
+            max_workers=2
+        )
+
+        self.assertEqual(len(self.fred_session.requests), 4)
+        self.assertEqual(list(snapshots), ['2019-01-01', '2020-01-01'])
+        self.assertEqual(snapshots['2020-01-01']['element_id'], [1, 3, 4, 2])
+        self.assertEqual(snapshots['2020-01-01']['observation_value'], [None, '2020-01-01', '2020-01-01', '2020-01-01'])
 
 
 class ReleasesTest(TestCase):
@@ -77,6 +143,28 @@ class ReleasesTest(TestCase):
         response = self.releases_services.get_release_tables(release_id='53')
         self.assertIsNotNone(response)
 
+    def test_get_release_table_tree(self):
+        """Test the `get_release_table_tree` method."""
+
+        response = self.releases_services.get_release_table_tree(
+            release_id='53',
+            element_id=12886
+        )
+        self.assertEqual(len(response['element_id']), len(response['parent_id']))
+
+    def test_get_release_table_sweep(self):
+        """Test the `get_release_table_sweep` method."""
+
+        response = self.releases_services.get_release_table_sweep(
+            release_id='53',
+            element_id=12886,
+            observation_dates=['2019-01-01', '2020-01-01']
+        )
+        self.assertEqual(
+            response['2019-01-01']['element_id'],
+            response['2020-01-01']['element_id']
+        )
+
     def tearDown(self) -> None:
         """Teardown the `FederalReserveClient.Releases` Client."""
         del self.fred_client
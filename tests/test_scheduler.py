@@ -0,0 +1,94 @@
+import time
+import unittest
+import threading
+
+from unittest import TestCase
+from concurrent.futures import ThreadPoolExecutor
+from fred.scheduler import PriorityScheduler
+from fred.scheduler import current_priority
+from fred.scheduler import inherit_priority
+from fred.scheduler import priority
+
+
+class FakeRateLimiter():
+
+    """A `RateLimiter` stand-in handing out tokens only when the test adds them."""
+
+    def __init__(self) -> None:
+        self.tokens = 0
+        self._lock = threading.Lock()
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        with self._lock:
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return 0.0
+            return 0.005
+
+
+class PrioritySchedulerTest(TestCase):
+
+    """Will perform a unit test for the `PriorityScheduler` object."""
+
+    def grant_order(self, background_share: float) -> list:
+        """Queues three requests of each priority, then releases one token at a time."""
+
+        rate_limiter = FakeRateLimiter()
+        scheduler = PriorityScheduler(background_share=background_share)
+        order = []
+
+        def request(name: str) -> None:
+            scheduler.acquire(rate_limiter=rate_limiter, priority=name)
+            order.append(name[0])
+
+        threads = [
+            threading.Thread(target=request, args=(name,))
+            for name in ['background'] * 3 + ['interactive'] * 3
+        ]
+        for thread in threads:
+            thread.start()
+
+        while sum(stats['waiting'] for stats in scheduler.stats().values()) < 6:
+            time.sleep(0.001)
+
+        for granted in range(1, 7):
+            rate_limiter.tokens += 1
+            while len(order) < granted:
+                time.sleep(0.001)
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(scheduler.stats()['background']['granted'], 3)
+
+        return order
+
+    def test_interactive_first(self):
+        """Test that interactive requests are served before background ones."""
+
+        self.assertEqual(self.grant_order(background_share=0.0), list('iiibbb'))
+
+    def test_background_share(self):
+        """Test that background requests get their minimum share while interactive ones wait."""
+
+        self.assertEqual(self.grant_order(background_share=0.25), list('biiibb'))
+
+    def test_priority_context(self):
+        """Test that the priority follows the thread and work handed to a pool."""
+
+        self.assertEqual(current_priority(), 'interactive')
+
+        with priority('background'), ThreadPoolExecutor(max_workers=1) as executor:
+            self.assertEqual(current_priority(), 'background')
+            self.assertEqual(executor.submit(inherit_priority(current_priority)).result(), 'background')
+            self.assertEqual(executor.submit(current_priority).result(), 'interactive')
+
+        self.assertEqual(current_priority(), 'interactive')
+
+        with self.assertRaises(ValueError):
+            with priority('urgent'):
+                pass
+
+
+if __name__ == '__main__':
+    unittest.main()
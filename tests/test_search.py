@@ -0,0 +1,156 @@
+import unittest
+import tempfile
+import pathlib
+
+from unittest import TestCase
+from fred.search import SeriesIdIndex
+from fred.search import SeriesSearchIndex
+from fred.search import stem
+
+
+class SeriesSearchIndexTest(TestCase):
+
+    """Will perform a unit test for the `SeriesSearchIndex` object."""
+
+    def setUp(self) -> None:
+        """Set up the `SeriesSearchIndex` object."""
+
+        self.search_index = SeriesSearchIndex()
+        self.search_index.add_many(
+            series=[
+                {'id': 'GNPCA', 'title': 'Real Gross National Product', 'units': 'Billions of Chained 2012 Dollars',
+                 'frequency': 'Annual', 'seasonal_adjustment': 'Not Seasonally Adjusted', 'popularity': 60},
+                {'id': 'GDP', 'title': 'Gross Domestic Product', 'units': 'Billions of Dollars',
+                 'frequency': 'Quarterly', 'seasonal_adjustment': 'Seasonally Adjusted Annual Rate', 'popularity': 90},
+                {'id': 'UNRATE', 'title': 'Unemployment Rate', 'units': 'Percent',
+                 'frequency': 'Monthly', 'seasonal_adjustment': 'Seasonally Adjusted', 'popularity': 95}
+            ],
+            tags={'GDP': ['gdp', 'bea', 'sa'], 'GNPCA': ['gnp', 'bea', 'nsa'], 'UNRATE': ['bls', 'sa']}
+        )
+
+    def test_stem(self):
+        """Test the `stem` function."""
+
+        self.assertEqual(stem('rates'), stem('rate'))
+        self.assertEqual(stem('adjusted'), 'adjust')
+
+    def test_series_search(self):
+        """Test that every word has to match."""
+
+        response = self.search_index.series_search(search_text='gross product')
+        self.assertEqual(response['count'], 2)
+        self.assertEqual(
+            {series['id'] for series in response['seriess']},
+            {'GDP', 'GNPCA'}
+        )
+
+    def test_order_by_popularity(self):
+        """Test ordering results by popularity."""
+
+        response = self.search_index.series_search(
+            search_text='gross',
+            order_by='popularity'
+        )
+        self.assertEqual([series['id'] for series in response['seriess']], ['GDP', 'GNPCA'])
+
+    def test_order_by_sorts_missing_values_last(self):
+        """Test that series without the attribute come last in both orders."""
+
+        self.search_index.add_many(series=[{'id': 'GNP', 'title': 'Gross National Product', 'popularity': None}])
+
+        for sort_order, expected in [('asc', ['GNPCA', 'GDP', 'GNP']), ('desc', ['GDP', 'GNPCA', 'GNP'])]:
+            response = self.search_index.series_search(
+                search_text='gross',
+                order_by='popularity',
+                sort_order=sort_order
+            )
+            self.assertEqual([series['id'] for series in response['seriess']], expected)
+
+    def test_filters_and_tags(self):
+        """Test the filter and tag parameters."""
+
+        response = self.search_index.series_search(
+            search_text='billions',
+            filter_variable='frequency',
+            filter_value='Annual'
+        )
+        self.assertEqual(response['count'], 1)
+
+        response = self.search_index.series_search(
+            search_text='gross',
+            tag_names=['bea'],
+            exclude_tag_names=['nsa']
+        )
+        self.assertEqual([series['id'] for series in response['seriess']], ['GDP'])
+
+    def test_prefix_search(self):
+        """Test search as you type."""
+
+        response = self.search_index.series_search(search_text='unemp', prefix=True)
+        self.assertEqual([series['id'] for series in response['seriess']], ['UNRATE'])
+
+    def test_incremental_update(self):
+        """Test that updating a series replaces its terms."""
+
+        self.search_index.add_series(series={'id': 'UNRATE', 'title': 'Civilian Jobless Rate'})
+        self.assertEqual(self.search_index.series_search(search_text='unemployment')['count'], 0)
+        self.assertEqual(self.search_index.series_search(search_text='jobless')['count'], 1)
+
+        self.search_index.remove_series(series_id='UNRATE')
+        self.assertNotIn('UNRATE', self.search_index)
+
+
+class SeriesIdIndexTest(TestCase):
+
+    """Will perform a unit test for the `SeriesIdIndex` object."""
+
+    def setUp(self) -> None:
+        """Set up the `SeriesIdIndex` object."""
+
+        self.id_index = SeriesIdIndex.build(
+            series_ids=['GDP', 'GDPC1', 'GNPCA', 'A191RL1Q225SBEA', 'UNRATE'],
+            popularity=[90, 85, 60, 70, 95]
+        )
+
+    def test_substring_search(self):
+        """Test substring matches are ordered by popularity."""
+
+        self.assertEqual(self.id_index.search(search_text='gdp'), ['GDP', 'GDPC1'])
+        self.assertEqual(self.id_index.search(search_text='RL1'), ['A191RL1Q225SBEA'])
+        self.assertEqual(self.id_index.search(search_text='A'), ['UNRATE', 'A191RL1Q225SBEA', 'GNPCA'])
+        self.assertEqual(self.id_index.search(search_text='XYZ'), [])
+
+    def test_suffix_order(self):
+        """Test that the suffixes are sorted as strings, equal suffixes in the order of their IDs."""
+
+        text = self.id_index.text.decode('ascii')
+        expected = sorted(
+            (text[position:text.index('\n', position)], position)
+            for position in range(len(text)) if text[position] != '\n'
+        )
+
+        self.assertEqual(list(self.id_index.suffixes), [position for _, position in expected])
+
+    def test_prefix_search(self):
+        """Test prefix matches."""
+
+        self.assertEqual(self.id_index.search(search_text='G', prefix=True), ['GDP', 'GDPC1', 'GNPCA'])
+        self.assertEqual(self.id_index.search(search_text='A', prefix=True), ['A191RL1Q225SBEA'])
+
+    def test_save_and_load(self):
+        """Test that a memory mapped index answers the same queries."""
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = pathlib.Path(directory).joinpath('series_ids.idx')
+            self.id_index.save(file_path=file_path)
+            loaded = SeriesIdIndex.load(file_path=file_path)
+
+            self.assertEqual(len(loaded), 5)
+            self.assertEqual(loaded.search(search_text='CA'), ['GNPCA'])
+            self.assertEqual(loaded.series_search(search_text='GDP')['count'], 2)
+
+            del loaded
+
+
+if __name__ == '__main__':
+    unittest.main()
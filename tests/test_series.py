@@ -3,6 +3,87 @@ import unittest
 from unittest import TestCase
 from configparser import ConfigParser
 from fred.client import FederalReserveClient
+from fred.series import Series
+from fakes import FakeSession
+
+
+class FakeVintageSession(FakeSession):
+
+    """A `FredSession` stand-in serving `output_type=2` observations, one column per vintage date."""
+
+    DATES = ['2000-01-01', '2001-01-01', '2002-01-01']
+
+    def respond(self, endpoint: str, params: dict) -> dict:
+        rows = [
+            dict(
+                {'date': observation_date},
+                **{'GNPCA_' + vintage.replace('-', ''): str(index) for vintage in params['vintage_dates'].split(',')}
+            )
+            for index, observation_date in enumerate(self.DATES)
+        ]
+
+        if params['sort_order'] == 'desc':
+            rows.reverse()
+
+        offset = params['offset'] or 0
+        limit = params['limit'] or len(rows)
+
+        return {'count': len(rows), 'offset': offset, 'limit': limit, 'observations': rows[offset:offset + limit]}
+
+
+class SeriesVintageMergeTest(TestCase):
+
+    """Will perform an offline unit test for the vintage date chunks of `Series.get_series_observations`."""
+
+    def test_chunks_are_merged_before_the_offset_and_limit(self):
+        """Test that rows split across a chunk boundary are merged, then sorted, offset and limited."""
+
+        fred_session = FakeVintageSession()
+        series_service = Series(session=fred_session)
+
+        response = series_service.get_series_observations(
+            series_id='GNPCA',
+            output_type=2,
+            vintage_dates=['2009-07-30', '2010-07-30', '2011-07-29'],
+            vintage_chunk_size=2,
+            sort_order='desc',
+            offset=1,
+            limit=1
+        )
+
+        self.assertEqual(len(fred_session.requests), 2)
+        self.assertTrue(all(params['offset'] is None and params['limit'] is None for _, params in fred_session.requests))
+
+        self.assertEqual(response['count'], 3)
+        self.assertEqual(response['observations'], [
+            {'date': '2001-01-01', 'GNPCA_20090730': '1', 'GNPCA_20100730': '1', 'GNPCA_20110729': '1'}
+        ])
+
+    def test_comma_separated_vintage_dates(self):
+        """Test that a comma separated string is split into dates, not characters."""
+
+        fred_session = FakeVintageSession()
+        series_service = Series(session=fred_session)
+
+        series_service.get_series_observations(
+            series_id='GNPCA',
+            output_type=2,
+            vintage_dates='2009-07-30,2010-07-30, 2011-07-29',
+            vintage_chunk_size=2
+        )
+
+        self.assertEqual(
+            sorted(params['vintage_dates'] for _, params in fred_session.requests),
+            ['2009-07-30,2010-07-30', '2011-07-29']
+        )
+
+    def test_invalid_chunk_size(self):
+        """Test that a chunk size below 1 raises a `ValueError`."""
+
+        series_service = Series(session=FakeVintageSession())
+
+        with self.assertRaises(ValueError):
+            series_service.get_series_observations(series_id='GNPCA', vintage_dates=['2009-07-30'], vintage_chunk_size=0)
 
 
 class SeriesTest(TestCase):
@@ -43,6 +124,18 @@ class SeriesTest(TestCase):
         )
         self.assertIsNotNone(response)
 
+    def test_get_series_observations_vintage_chunks(self):
+        """Test the `get_series_observations` method with chunked vintage dates."""
+
+        response = self.series_services.get_series_observations(
+            series_id='GNPCA',
+            output_type=2,
+            vintage_dates=['2009-07-30', '2010-07-30', '2011-07-29'],
+            vintage_chunk_size=2
+        )
+        self.assertIn('observations', response)
+        self.assertEqual(response['count'], len(response['observations']))
+
     def test_get_series_release(self):
         """Test the `get_series_release` method."""
 
@@ -0,0 +1,105 @@
+import unittest
+import tempfile
+import pathlib
+
+from unittest import TestCase
+from fred.source_catalog import SourceCatalog
+
+
+class FakeReleasesService():
+
+    """A `Releases` service stand-in serving the sources of a release."""
+
+    def __init__(self, paginator: 'FakePaginator') -> None:
+        self.paginator = paginator
+
+    def get_release_sources(self, release_id: str, **kwargs) -> dict:
+        return {
+            'sources': [
+                {'id': source_id}
+                for source_id, release_ids in self.paginator.mapping.items()
+                if int(release_id) in release_ids
+            ]
+        }
+
+
+class FakePaginator():
+
+    """A `Paginator` stand-in over a small, mutable sources to releases mapping."""
+
+    def __init__(self) -> None:
+        self.mapping = {1: [10, 11], 3: [11, 12]}
+        self.changed_on = {}
+        self.calls = []
+        self.releases_service = FakeReleasesService(paginator=self)
+
+    def sources(self, realtime_start: str = '2024-01-01', **kwargs) -> list:
+        return [{'id': source_id, 'realtime_start': realtime_start} for source_id in self.mapping]
+
+    def releases(self, realtime_start: str = '2024-01-01', **kwargs) -> list:
+        release_ids = sorted({release_id for ids in self.mapping.values() for release_id in ids})
+        return [
+            {'id': release_id, 'realtime_start': self.changed_on.get(release_id, realtime_start)}
+            for release_id in release_ids
+        ]
+
+    def source_releases(self, source_id: int, collect: bool = False, **kwargs) -> list:
+        self.calls.append(source_id)
+        return [{'id': release_id, 'name': 'R{id}'.format(id=release_id)} for release_id in self.mapping[source_id]]
+
+
+class SourceCatalogTest(TestCase):
+
+    """Will perform a unit test for the `SourceCatalog` object."""
+
+    def setUp(self) -> None:
+        """Set up the `SourceCatalog` object."""
+
+        self.paginator = FakePaginator()
+        self.source_catalog = SourceCatalog.crawl(paginator=self.paginator, max_workers=2)
+
+    def test_lookups(self):
+        """Test both directions of the mapping."""
+
+        self.assertEqual(self.source_catalog.source_releases(source_id=3), [11, 12])
+        self.assertEqual(self.source_catalog.release_sources(release_id=11), [1, 3])
+        self.assertEqual(self.source_catalog.release_sources(release_id=99), [])
+        self.assertEqual(
+            self.source_catalog.get_source_releases(source_id=1)['releases'][0]['name'],
+            'R10'
+        )
+
+    def test_incremental_refresh(self):
+        """Test that only new or changed items are fetched again."""
+
+        self.paginator.mapping = {1: [10], 3: [11, 12, 13], 4: [13]}
+        self.paginator.changed_on = {13: '2024-02-01'}
+        self.paginator.calls = []
+
+        changes = self.source_catalog.refresh(
+            paginator=self.paginator,
+            realtime_start='2024-01-15',
+            realtime_end='2024-02-15'
+        )
+
+        self.assertEqual(changes['changed_sources'], [4])
+        self.assertEqual(changes['changed_releases'], [13])
+        self.assertEqual(self.paginator.calls, [4])
+        self.assertEqual(self.source_catalog.release_sources(release_id=13), [3, 4])
+        self.assertEqual(self.source_catalog.source_releases(source_id=3), [11, 12, 13])
+
+    def test_save_and_load(self):
+        """Test that a saved catalog answers the same lookups."""
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = pathlib.Path(directory) / 'sources.json'
+            self.source_catalog.save(file_path=file_path)
+            loaded = SourceCatalog.load(file_path=file_path)
+
+        self.assertEqual(loaded.release_sources(release_id=11), [1, 3])
+        self.assertEqual(loaded.releases[12]['name'], 'R12')
+        self.assertEqual(loaded.last_refresh, self.source_catalog.last_refresh)
+
+
+if __name__ == '__main__':
+    unittest.main()
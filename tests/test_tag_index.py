@@ -0,0 +1,116 @@
+import unittest
+import tempfile
+import pathlib
+
+from unittest import TestCase
+from fred.tag_index import TagIndex
+
+
+class FakeSeriesService():
+
+    """A `Series` service stand-in serving the tags of four series."""
+
+    TAGS = {
+        'UNRATE': ['usa', 'monthly', 'unemployment', 'sa'],
+        'UNRATENSA': ['usa', 'monthly', 'unemployment', 'nsa'],
+        'CAUR': ['california', 'monthly', 'unemployment', 'sa'],
+        'GNPCA': ['usa', 'annual', 'gnp', 'nsa']
+    }
+
+    GROUPS = {
+        'usa': 'geo', 'california': 'geo', 'monthly': 'freq', 'annual': 'freq',
+        'sa': 'seas', 'nsa': 'seas', 'unemployment': 'gen', 'gnp': 'gen'
+    }
+
+    def get_series_tags(self, series_id: str, **kwargs) -> dict:
+        return {
+            'tags': [
+                {'name': name, 'group_id': self.GROUPS[name], 'popularity': len(name), 'series_count': 99}
+                for name in self.TAGS[series_id]
+            ]
+        }
+
+
+class TagIndexTest(TestCase):
+
+    """Will perform a unit test for the `TagIndex` object."""
+
+    def setUp(self) -> None:
+        """Set up the `TagIndex` object."""
+
+        self.tag_index = TagIndex.harvest(
+            series_ids=list(FakeSeriesService.TAGS),
+            series_service=FakeSeriesService(),
+            max_workers=2
+        )
+
+    def test_related_tags(self):
+        """Test the related tags of a tag set and their series counts."""
+
+        content = self.tag_index.get_related_tags(
+            tag_names=['monthly', 'unemployment'],
+            order_by='series_count',
+            sort_order='desc'
+        )
+        counts = {tag['name']: tag['series_count'] for tag in content['tags']}
+
+        self.assertEqual(counts, {'usa': 2, 'sa': 2, 'nsa': 1, 'california': 1})
+        self.assertEqual(content['tags'][-1]['name'], 'california')
+
+    def test_filters(self):
+        """Test the exclude, tag group and universe filters."""
+
+        content = self.tag_index.get_related_tags(
+            tag_names='usa',
+            exclude_tag_names=['nsa'],
+            tag_group_id='freq'
+        )
+        self.assertEqual([tag['name'] for tag in content['tags']], ['monthly'])
+
+        content = self.tag_index.get_related_tags(
+            tag_names=['usa'],
+            series_ids=['GNPCA'],
+            search_text='gn'
+        )
+        self.assertEqual([tag['name'] for tag in content['tags']], ['gnp'])
+
+    def test_tags_series(self):
+        """Test filtered, paged series listings and counts."""
+
+        content = self.tag_index.get_tags_series(
+            tag_names=['monthly'],
+            exclude_tag_names=['california'],
+            limit=1
+        )
+
+        self.assertEqual(content['count'], 2)
+        self.assertEqual(content['seriess'], [{'id': 'UNRATE'}])
+        self.assertEqual(self.tag_index.count_series(tag_names=['usa', 'nsa']), 2)
+
+    def test_matching_series_is_a_copy(self):
+        """Test that changing a single tag or unfiltered result leaves the index alone."""
+
+        for tag_names in [['usa'], None]:
+            before = self.tag_index.count_series(tag_names=tag_names)
+            matching = self.tag_index.matching_series(tag_names=tag_names)
+            matching.discard(self.tag_index.ordinals['UNRATE'])
+
+            self.assertEqual(self.tag_index.count_series(tag_names=tag_names), before)
+
+    def test_save_and_load(self):
+        """Test that a saved index answers the same queries."""
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = pathlib.Path(directory) / 'tags.json'
+            self.tag_index.save(file_path=file_path)
+            loaded = TagIndex.load(file_path=file_path)
+
+        self.assertEqual(
+            loaded.get_related_tags(tag_names=['sa']),
+            self.tag_index.get_related_tags(tag_names=['sa'])
+        )
+        self.assertEqual(loaded.get_series_tags(series_id='CAUR'), ['california', 'monthly', 'unemployment', 'sa'])
+
+
+if __name__ == '__main__':
+    unittest.main()
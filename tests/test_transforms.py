@@ -0,0 +1,97 @@
+import math
+import unittest
+
+from unittest import TestCase
+from fred.transforms import UnitsTransformer
+
+
+class UnitsTransformerTest(TestCase):
+
+    """Will perform a unit test for the `UnitsTransformer` object."""
+
+    def setUp(self) -> None:
+        """Set up the `UnitsTransformer` object."""
+
+        self.transformer = UnitsTransformer(frequency='q')
+        self.values = ['100', '110', '.', '121', '133.1']
+
+    def test_lin_treats_missing_values_as_nan(self):
+        """Test the `lin` units."""
+
+        result = self.transformer.transform(values=self.values, units='lin')
+        self.assertEqual(result[0], 100.0)
+        self.assertTrue(math.isnan(result[2]))
+
+    def test_pch(self):
+        """Test the `pch` units."""
+
+        result = self.transformer.transform(values=self.values, units='pch')
+        self.assertTrue(math.isnan(result[0]))
+        self.assertAlmostEqual(result[1], 10.0)
+        self.assertTrue(math.isnan(result[3]))
+        self.assertAlmostEqual(result[4], 10.0)
+
+    def test_pca_and_cca(self):
+        """Test the `pca` and `cca` units."""
+
+        pca = self.transformer.transform(values=self.values, units='pca')
+        cca = self.transformer.transform(values=self.values, units='cca')
+        self.assertAlmostEqual(pca[1], (1.1 ** 4 - 1) * 100)
+        self.assertAlmostEqual(cca[1], math.log(1.1) * 400)
+
+    def test_ch1_uses_year_ago_value(self):
+        """Test the `ch1` units."""
+
+        values = [float(value) for value in range(1, 7)]
+        result = self.transformer.transform(values=values, units='ch1')
+        self.assertTrue(math.isnan(result[3]))
+        self.assertEqual(result[4], 4.0)
+
+    def test_infers_frequency_from_dates(self):
+        """Test the `cca` units when the frequency is inferred."""
+
+        transformer = UnitsTransformer()
+        dates = ['2020-01-01', '2020-02-01', '2020-03-01']
+        result = transformer.transform(values=[1, 2, 4], units='cca', dates=dates)
+        self.assertAlmostEqual(result[2], math.log(2) * 1200)
+
+    def test_transform_observations(self):
+        """Test the `transform_observations` method."""
+
+        content = {
+            'units': 'lin',
+            'observations': [
+                {'date': '2020-01-01', 'value': '100'},
+                {'date': '2020-04-01', 'value': '105'}
+            ]
+        }
+
+        result = self.transformer.transform_observations(content=content, units='chg')
+        self.assertEqual(result['units'], 'chg')
+        self.assertEqual(result['observations'][0]['value'], '.')
+        self.assertEqual(result['observations'][1]['value'], '5.0')
+
+    def test_transform_observations_rejects_revisions(self):
+        """Test that several rows per date, one per real-time period, raise a `ValueError`."""
+
+        content = {
+            'units': 'lin',
+            'observations': [
+                {'date': '2020-01-01', 'realtime_start': '2020-02-01', 'realtime_end': '2020-02-27', 'value': '100'},
+                {'date': '2020-01-01', 'realtime_start': '2020-02-28', 'realtime_end': '9999-12-31', 'value': '101'},
+                {'date': '2020-04-01', 'realtime_start': '2020-05-01', 'realtime_end': '9999-12-31', 'value': '105'}
+            ]
+        }
+
+        with self.assertRaises(ValueError):
+            self.transformer.transform_observations(content=content, units='chg')
+
+    def test_invalid_units(self):
+        """Test that unknown units raise a `ValueError`."""
+
+        with self.assertRaises(ValueError):
+            self.transformer.transform(values=self.values, units='abc')
+
+
+if __name__ == '__main__':
+    unittest.main()
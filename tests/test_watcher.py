@@ -0,0 +1,137 @@
+import queue
+import pathlib
+import tempfile
+import unittest
+
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from unittest import TestCase
+from fred.cache import fred_time
+from fred.watcher import UpdatesWatcher
+
+
+class FakeSeriesService():
+
+    """A `Series` service stand-in serving a fixed updates feed."""
+
+    def __init__(self, updates: list) -> None:
+        self.updates = updates
+        self.windows = []
+
+    def get_series_updates(self, offset: int = 0, limit: int = 1000, **kwargs) -> dict:
+        self.windows.append((kwargs['start_time'], kwargs['end_time']))
+        return {'count': len(self.updates), 'seriess': self.updates[offset:offset + 2]}
+
+
+class UpdatesWatcherTest(TestCase):
+
+    """Will perform a unit test for the `UpdatesWatcher` object."""
+
+    def setUp(self) -> None:
+        """Set up the `UpdatesWatcher` object."""
+
+        today = datetime.now(tz=timezone.utc).strftime('%Y-%m-%d')
+        self.series_service = FakeSeriesService(
+            updates=[
+                {'id': 'GDP', 'last_updated': today + ' 07:31:02-05'},
+                {'id': 'UNRATE', 'last_updated': today + ' 07:44:03-05'},
+                {'id': 'PAYEMS', 'last_updated': today + ' 07:44:05-05'}
+            ]
+        )
+        self.directory = tempfile.TemporaryDirectory()
+        self.state_path = pathlib.Path(self.directory.name).joinpath('updates.json')
+
+    def tearDown(self) -> None:
+        """Remove the state file."""
+
+        self.directory.cleanup()
+
+    def test_dispatches_in_batches(self):
+        """Test that updates are paged, batched and sent to callbacks and the queue."""
+
+        batches = []
+        output_queue = queue.Queue()
+
+        watcher = UpdatesWatcher(
+            series_service=self.series_service,
+            batch_size=2,
+            output_queue=output_queue
+        )
+        watcher.register(callback=batches.append)
+
+        self.assertEqual(watcher.poll_once(), ['GDP', 'UNRATE', 'PAYEMS'])
+        self.assertEqual(batches, [['GDP', 'UNRATE'], ['PAYEMS']])
+        self.assertEqual(output_queue.qsize(), 2)
+
+    def test_failed_callback_is_retried(self):
+        """Test that updates are not marked as seen when their dispatch fails."""
+
+        batches = []
+        failures = [RuntimeError('Callback failed.')]
+        watcher = UpdatesWatcher(series_service=self.series_service, batch_size=2)
+
+        def failing(batch: list) -> None:
+            # The second batch of the first poll fails.
+            if batches and failures:
+                raise failures.pop()
+            batches.append(batch)
+
+        watcher.register(callback=failing)
+
+        with self.assertRaises(RuntimeError):
+            watcher.poll_once()
+
+        self.assertEqual(watcher.seen, {})
+        self.assertEqual(watcher.poll_once(), ['GDP', 'UNRATE', 'PAYEMS'])
+        self.assertEqual(watcher.poll_once(), [])
+
+    def test_deduplicates_and_persists_high_water_mark(self):
+        """Test that a restarted watcher skips what it already dispatched."""
+
+        first_poll = datetime.now(tz=timezone.utc).replace(second=0, microsecond=0)
+        watcher = UpdatesWatcher(series_service=self.series_service, state_path=self.state_path)
+        watcher.poll_once(now=first_poll + timedelta(seconds=30))
+
+        restarted = UpdatesWatcher(series_service=self.series_service, state_path=self.state_path)
+        self.assertEqual(restarted.high_water_mark, first_poll)
+        self.assertEqual(restarted.poll_once(now=first_poll + timedelta(minutes=5)), [])
+        self.assertEqual(restarted.poll_once(now=first_poll + timedelta(minutes=10)), [])
+
+        # Each window starts where the window before the last one ended.
+        self.assertEqual(
+            self.series_service.windows[-1][0],
+            self.series_service.windows[0][1]
+        )
+
+    def test_repolls_rows_shifted_while_paging(self):
+        """Test that a row skipped because the feed shifted during a poll is dispatched by the next one."""
+
+        first_poll = datetime.now(tz=timezone.utc).replace(second=0, microsecond=0)
+        updates = [
+            (series_id, first_poll - timedelta(minutes=minutes))
+            for series_id, minutes in [('GDP', 1), ('UNRATE', 2), ('PAYEMS', 3)]
+        ]
+
+        def get_series_updates(offset: int = 0, limit: int = 1000, **kwargs) -> dict:
+            window = [
+                {'id': series_id, 'last_updated': updated_at.isoformat()} for series_id, updated_at in updates
+                if kwargs['start_time'] <= fred_time(updated_at) <= kwargs['end_time']
+            ]
+
+            # GDP is updated again after the first page, leaving the window and moving PAYEMS up.
+            if offset == 0 and updates[0][0] == 'GDP':
+                updates[0] = ('GDP', first_poll + timedelta(minutes=2))
+
+            return {'count': len(window), 'seriess': window[offset:offset + 2]}
+
+        self.series_service.get_series_updates = get_series_updates
+        watcher = UpdatesWatcher(series_service=self.series_service)
+
+        self.assertEqual(watcher.poll_once(now=first_poll), ['GDP', 'UNRATE'])
+        self.assertEqual(watcher.poll_once(now=first_poll + timedelta(minutes=5)), ['GDP', 'PAYEMS'])
+        self.assertEqual(watcher.poll_once(now=first_poll + timedelta(minutes=10)), [])
+
+
+if __name__ == '__main__':
+    unittest.main()